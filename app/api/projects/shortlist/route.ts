@@ -8,6 +8,203 @@ import fs from "fs/promises"
 
 const execAsync = promisify(exec)
 
+// Optional long-lived worker (scripts/resume_selector_worker.py). When set, the
+// route asks the warm worker first and only spawns a Python process as a fallback.
+const RESUME_SELECTOR_URL = process.env.RESUME_SELECTOR_URL
+
+// Split the subprocess's stderr into plain log output and per-name totals of the
+// telemetry JSON lines the selector emits (see scripts/telemetry.py)
+function splitTelemetry(stderr: string) {
+  const logLines: string[] = []
+  const spans: Record<string, { count: number; seconds: number }> = {}
+  const counters: Record<string, number> = {}
+  for (const line of stderr.split("\n")) {
+    let event: any = null
+    if (line.startsWith('{"telemetry"')) {
+      try {
+        event = JSON.parse(line)
+      } catch {
+        event = null
+      }
+    }
+    if (!event) {
+      logLines.push(line)
+    } else if (event.telemetry === "span") {
+      const key = event.kind ? `${event.name}:${event.kind}` : event.name
+      spans[key] = spans[key] || { count: 0, seconds: 0 }
+      spans[key].count += 1
+      spans[key].seconds += event.seconds
+    } else if (event.telemetry === "counter") {
+      const key = event.cache ? `${event.name}:${event.cache}` : event.kind ? `${event.name}:${event.kind}` : event.name
+      counters[key] = (counters[key] || 0) + event.value
+    }
+  }
+  return { log: logLines.join("\n").trim(), spans, counters }
+}
+
+async function runWorkerShortlist(folder: string, projectDescription: string, topK: number, fast: boolean) {
+  if (!RESUME_SELECTOR_URL) {
+    return null
+  }
+
+  try {
+    const response = await fetch(`${RESUME_SELECTOR_URL.replace(/\/$/, "")}/shortlist`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        folder,
+        project_description: projectDescription,
+        top_k: topK,
+        fast,
+      }),
+    })
+    return await response.json()
+  } catch (error) {
+    console.warn("Resume selector worker unavailable, falling back to subprocess:", error)
+    return null
+  }
+}
+
+async function runWorkerShortlistStream(folder: string, projectDescription: string, topK: number, fast: boolean) {
+  if (!RESUME_SELECTOR_URL) {
+    return null
+  }
+
+  try {
+    const response = await fetch(`${RESUME_SELECTOR_URL.replace(/\/$/, "")}/shortlist/stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        folder,
+        project_description: projectDescription,
+        top_k: topK,
+        fast,
+      }),
+    })
+    return response.ok && response.body ? response.body : null
+  } catch (error) {
+    console.warn("Resume selector worker unavailable, falling back to subprocess:", error)
+    return null
+  }
+}
+
+// Attach student information to a worker event before it is sent to the client
+function mapShortlistEvent(event: any, project: any) {
+  if (event.event === "ranking") {
+    return {
+      event: "ranking",
+      project: {
+        id: project.id,
+        name: project.name,
+        description: project.description
+      },
+      total_applications: project.project_requests.length,
+      shortlisted_candidates: mapShortlistedCandidates(event.candidates, project.project_requests)
+    }
+  }
+  if (event.event === "summary") {
+    return {
+      event: "summary",
+      index: event.index,
+      candidate: mapShortlistedCandidates([event.candidate], project.project_requests)[0] ?? null
+    }
+  }
+  return event
+}
+
+// Forward NDJSON events line by line as the worker produces them
+function streamShortlistEvents(source: ReadableStream<Uint8Array>, project: any) {
+  const encoder = new TextEncoder()
+  const decoder = new TextDecoder()
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const send = (event: any) => controller.enqueue(encoder.encode(JSON.stringify(event) + "\n"))
+      const reader = source.getReader()
+      let buffer = ""
+
+      try {
+        while (true) {
+          const { done, value } = await reader.read()
+          if (done) break
+
+          buffer += decoder.decode(value, { stream: true })
+          let newline
+          while ((newline = buffer.indexOf("\n")) >= 0) {
+            const line = buffer.slice(0, newline).trim()
+            buffer = buffer.slice(newline + 1)
+            if (line) {
+              send(mapShortlistEvent(JSON.parse(line), project))
+            }
+          }
+        }
+        if (buffer.trim()) {
+          send(mapShortlistEvent(JSON.parse(buffer), project))
+        }
+      } catch (error) {
+        console.error("Error streaming shortlist events:", error)
+        send({ event: "error", error: "Failed to process resumes with AI" })
+      } finally {
+        controller.close()
+      }
+    }
+  })
+
+  return ndjsonResponse(stream)
+}
+
+// Replay a complete (non-streamed) result as the same NDJSON events
+function shortlistResultEvents(result: any, project: any) {
+  const events = result.error
+    ? [{ event: "error", error: result.error }]
+    : [
+        { event: "ranking", candidates: result.candidates },
+        ...result.candidates.map((candidate: any, index: number) => ({ event: "summary", index, candidate })),
+        { event: "done" }
+      ]
+  const body = events.map(event => JSON.stringify(mapShortlistEvent(event, project)) + "\n").join("")
+  return ndjsonResponse(body)
+}
+
+function ndjsonResponse(body: ReadableStream<Uint8Array> | string) {
+  return new Response(body, {
+    headers: {
+      "Content-Type": "application/x-ndjson",
+      "Cache-Control": "no-cache"
+    }
+  })
+}
+
+function mapShortlistedCandidates(candidates: any[], projectRequests: any[]) {
+  // Map results to include student information from database
+  const shortlistedCandidates = []
+  for (const candidate of candidates) {
+    // Find the corresponding project request
+    const projectRequest = projectRequests.find(req => 
+      req.resume_path && req.resume_path.includes(candidate.file_name)
+    )
+
+    if (projectRequest) {
+      shortlistedCandidates.push({
+        request_id: projectRequest.id,
+        student_id: projectRequest.student_id,
+        student_name: projectRequest.student.user.name,
+        student_email: projectRequest.student.user.email,
+        file_name: candidate.file_name,
+        file_path: candidate.file_path,
+        score: candidate.score,
+        ai_analysis: {
+          name: candidate.name,
+          skills: candidate.skills,
+          reasons: candidate.reasons,
+          metadata: candidate.metadata
+        }
+      })
+    }
+  }
+  return shortlistedCandidates
+}
+
 export async function POST(request: NextRequest) {
   try {
     const userId = request.headers.get("x-user-id")
@@ -21,7 +218,9 @@ export async function POST(request: NextRequest) {
     }
 
     const body = await request.json()
-    const { project_id, top_k = 3 } = body
+    // stream: true returns NDJSON events (ranking first, then one summary per candidate)
+    // fast: true explains matches from resume metadata instead of calling the LLM
+    const { project_id, top_k = 3, stream = false, fast = false } = body
 
     if (!project_id) {
       return NextResponse.json({ 
@@ -89,6 +288,38 @@ Requirements: Looking for candidates with relevant skills and experience for thi
 Expected completion: ${new Date(project.expected_completion_date).toLocaleDateString()}
     `.trim()
 
+    // Prefer the warm worker when one is configured
+    if (stream) {
+      const workerStream = await runWorkerShortlistStream(resumesFolder, projectDescription, top_k, Boolean(fast))
+      if (workerStream) {
+        return streamShortlistEvents(workerStream, project)
+      }
+    }
+
+    const workerResult = await runWorkerShortlist(resumesFolder, projectDescription, top_k, Boolean(fast))
+    if (workerResult) {
+      if (stream) {
+        return shortlistResultEvents(workerResult, project)
+      }
+
+      if (workerResult.error) {
+        return NextResponse.json({ 
+          error: workerResult.error 
+        }, { status: 500 })
+      }
+
+      return NextResponse.json({ 
+        success: true,
+        project: {
+          id: project.id,
+          name: project.name,
+          description: project.description
+        },
+        total_applications: project.project_requests.length,
+        shortlisted_candidates: mapShortlistedCandidates(workerResult.candidates, project.project_requests)
+      })
+    }
+
     // Create a temporary Python script to run the resume selector
     const scriptPath = path.join(process.cwd(), "scripts", "run_resume_selector.py")
     const mistralApiKey = process.env.MISTRAL_API_KEY || ""
@@ -121,34 +352,34 @@ def main():
         print("Initializing AI Resume Selector...", file=sys.stderr)
         selector = ResumeSelector(api_key="${mistralApiKey}", quiet=True)
         
-        # Process resumes from the project folder
+        # Add the project folder to the shared resume index (only unseen resumes are processed)
         resume_folder = "${resumesFolder.replace(/\\/g, "\\\\")}"
         print(f"Processing resumes from: {resume_folder}", file=sys.stderr)
-        success = selector.process_resumes(resume_folder)
+        selector.load_shared_index()
+        success = selector.sync_folder(resume_folder)
         
         if not success:
             print(json.dumps({"error": "Failed to process resumes"}))
             return
         
-        print(f"Successfully processed {selector.get_resume_count()} resumes", file=sys.stderr)
+        print(f"Shared index holds {selector.get_resume_count()} resumes", file=sys.stderr)
         
         # Project description
         project_desc = """${projectDescription.replace(/"/g, '\\"')}"""
         
         # Search for top candidates
         print("Searching for top candidates...", file=sys.stderr)
-        candidates = selector.search_resumes(project_desc, top_k=${top_k})
+        candidates = selector.search_resumes(project_desc, top_k=${top_k}, folder=resume_folder)
         
         if not candidates:
             print(json.dumps({"error": "No suitable candidates found"}))
             return
         
-        # Generate summaries for candidates
+        # Generate summaries for all candidates concurrently
         print("Generating AI analysis for candidates...", file=sys.stderr)
+        summaries = selector.generate_candidate_summaries(project_desc, candidates, fast=${fast ? "True" : "False"})
         results = []
-        for i, candidate in enumerate(candidates, 1):
-            print(f"Analyzing candidate {i}/{len(candidates)}...", file=sys.stderr)
-            summary = selector.generate_candidate_summary(project_desc, candidate)
+        for candidate, summary in zip(candidates, summaries):
             results.append({
                 "file_name": candidate["file_name"],
                 "file_path": candidate["file_path"],
@@ -204,51 +435,42 @@ if __name__ == "__main__":
       }
       
       console.log("Using Python path:", pythonPath);
+      const startedAt = Date.now()
       const { stdout, stderr } = await execAsync(`"${pythonPath}" "${scriptPath}"`, {
         cwd: process.cwd(),
         timeout: 30000000, // 2 minutes timeout
-        env: { ...process.env, PYTHONIOENCODING: 'utf-8' }
+        env: { ...process.env, PYTHONIOENCODING: 'utf-8', RESUME_SELECTOR_TELEMETRY: 'jsonl' }
       })
 
-      if (stderr) {
-        console.error("Python script stderr:", stderr)
+      const telemetry = splitTelemetry(stderr || "")
+      if (telemetry.log) {
+        console.error("Python script stderr:", telemetry.log)
       }
+      console.log("Resume selector telemetry:", JSON.stringify({
+        subprocess_seconds: (Date.now() - startedAt) / 1000,
+        spans: telemetry.spans,
+        counters: telemetry.counters,
+      }))
 
       // Parse the result
       const result = JSON.parse(stdout.trim())
 
+      if (stream) {
+        try {
+          await fs.unlink(scriptPath)
+        } catch (error) {
+          console.log("Could not delete temporary script:", error)
+        }
+        return shortlistResultEvents(result, project)
+      }
+
       if (result.error) {
         return NextResponse.json({ 
           error: result.error 
         }, { status: 500 })
       }
 
-      // Map results to include student information from database
-      const shortlistedCandidates = []
-      for (const candidate of result.candidates) {
-        // Find the corresponding project request
-        const projectRequest = project.project_requests.find(req => 
-          req.resume_path && req.resume_path.includes(candidate.file_name)
-        )
-
-        if (projectRequest) {
-          shortlistedCandidates.push({
-            request_id: projectRequest.id,
-            student_id: projectRequest.student_id,
-            student_name: projectRequest.student.user.name,
-            student_email: projectRequest.student.user.email,
-            file_name: candidate.file_name,
-            file_path: candidate.file_path,
-            score: candidate.score,
-            ai_analysis: {
-              name: candidate.name,
-              skills: candidate.skills,
-              reasons: candidate.reasons,
-              metadata: candidate.metadata
-            }
-          })
-        }
-      }
+      const shortlistedCandidates = mapShortlistedCandidates(result.candidates, project.project_requests)
 
       // Clean up the temporary script
       try {
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Recall@k versus query latency for the approximate vector indexes.
+
+Builds the flat (exact) index and the HNSW and IVF indexes from
+vector_index over the same normalized vectors, then sweeps each
+approximate index's search-time knob (efSearch for HNSW, nprobe for IVF).
+For every setting it reports recall@k against the flat index's results
+and single-query latency, alongside the flat baseline, so ann_threshold,
+hnsw_ef_search and ivf_nprobe can be chosen from data.
+
+Vectors are synthetic by default: clustered unit vectors, which behave
+more like resume embeddings than uniform noise. Pass --vectors with an
+(n, dim) float32 .npy file, such as the embeddings.npy of the snapshot
+version named in its CURRENT file, to measure real embeddings.
+
+Usage:
+    python scripts/benchmark_ann.py --sizes 10000,50000 --json ann.json
+    python scripts/benchmark_ann.py --vectors .cache/resume-selector/snapshots/shared/<version>/embeddings.npy
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vector_index import HNSW_EF_SEARCH, IVF_NPROBE, create_index, faiss, ivf_list_count, search_parameters
+
+
+def synthetic_vectors(count: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """Unit vectors scattered around random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim)).astype('float32')
+    vectors = centres[rng.integers(0, clusters, count)] + 0.6 * rng.standard_normal((count, dim)).astype('float32')
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def make_queries(vectors: np.ndarray, count: int, seed: int = 1) -> np.ndarray:
+    """Queries near (but not equal to) indexed vectors, like project descriptions near matching resumes."""
+    rng = np.random.default_rng(seed)
+    # Noise of norm about 0.5 around unit vectors
+    noise = 0.5 * rng.standard_normal((count, vectors.shape[1])) / np.sqrt(vectors.shape[1])
+    queries = (vectors[rng.integers(0, len(vectors), count)] + noise).astype('float32')
+    faiss.normalize_L2(queries)
+    return queries
+
+
+def build(kind: str, vectors: np.ndarray):
+    start = time.perf_counter()
+    index = create_index(kind, vectors.shape[1], training_vectors=vectors)
+    index.add_with_ids(vectors, np.arange(len(vectors), dtype='int64'))
+    return index, time.perf_counter() - start
+
+
+def measure(index, queries: np.ndarray, k: int, truth: np.ndarray, **knobs) -> Dict[str, Any]:
+    """Recall@k against truth and per-query latency, searching one query at a time like the selector."""
+    params = search_parameters(index, None, **knobs)
+    found = np.empty((len(queries), k), dtype='int64')
+    latencies = []
+    for row in range(len(queries)):
+        start = time.perf_counter()
+        _, ids = index.search(queries[row:row + 1], k, params=params)
+        latencies.append(time.perf_counter() - start)
+        found[row] = ids[0]
+    recall = np.mean([len(set(found[row]) & set(truth[row])) / k for row in range(len(queries))])
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "recall": round(float(recall), 4),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 3)
+    }
+
+
+def run_size(vectors: np.ndarray, queries: np.ndarray, args: argparse.Namespace) -> Dict[str, Any]:
+    print(f"{len(vectors)} vectors, dim {vectors.shape[1]}:", file=sys.stderr)
+    flat, flat_build = build("flat", vectors)
+    _, truth = flat.search(queries, args.k)
+    baseline = measure(flat, queries, args.k, truth)
+    rows: List[Dict[str, Any]] = [{"index": "flat", "build_seconds": round(flat_build, 3), "setting": None,
+                                   **baseline}]
+
+    hnsw, hnsw_build = build("hnsw", vectors)
+    for ef_search in args.ef_search:
+        rows.append({"index": "hnsw", "build_seconds": round(hnsw_build, 3), "setting": f"efSearch={ef_search}",
+                     **measure(hnsw, queries, args.k, truth, ef_search=ef_search)})
+
+    ivf, ivf_build = build("ivf", vectors)
+    for nprobe in args.nprobe:
+        rows.append({"index": "ivf", "build_seconds": round(ivf_build, 3),
+                     "setting": f"nprobe={nprobe}/{ivf_list_count(len(vectors))}",
+                     **measure(ivf, queries, args.k, truth, nprobe=nprobe)})
+
+    for row in rows:
+        row["speedup"] = round(baseline["p50_ms"] / row["p50_ms"], 2) if row["p50_ms"] else None
+    return {"vectors": len(vectors), "dim": int(vectors.shape[1]), "k": args.k, "results": rows}
+
+
+def parse_ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recall@k vs latency of approximate vector indexes")
+    parser.add_argument("--sizes", default="10000,50000", help="Comma-separated synthetic collection sizes")
+    parser.add_argument("--vectors", help="(n, dim) float32 .npy file to use instead of synthetic vectors")
+    parser.add_argument("--dim", type=int, default=768, help="Synthetic vector dimension")
+    parser.add_argument("--clusters", type=int, default=200, help="Synthetic cluster count")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--ef-search", type=parse_ints, default=[16, 32, HNSW_EF_SEARCH, 128, 256])
+    parser.add_argument("--nprobe", type=parse_ints, default=[1, 4, IVF_NPROBE, 64])
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    if args.vectors:
+        loaded = np.ascontiguousarray(np.load(args.vectors), dtype='float32')
+        faiss.normalize_L2(loaded)
+        collections = [loaded]
+    else:
+        collections = [synthetic_vectors(size, args.dim, args.clusters) for size in parse_ints(args.sizes)]
+
+    runs = [run_size(vectors, make_queries(vectors, args.queries), args) for vectors in collections]
+
+    for run in runs:
+        print(f"\n{run['vectors']} vectors, recall@{run['k']}:")
+        print(f"{'index':<6}{'setting':>18}{'build s':>10}{'recall':>9}{'p50 ms':>9}{'p95 ms':>9}{'speedup':>9}")
+        for row in run["results"]:
+            print(f"{row['index']:<6}{row['setting'] or '-':>18}{row['build_seconds']:>10}{row['recall']:>9}"
+                  f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['speedup']:>9}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Compare embedding backends: encoding throughput and ranking agreement.
+
+Every backend encodes the same resumes and project queries. Throughput is
+reported in documents per second, both for a plain encode call and for the
+token-trimmed, length-bucketed encode_documents pipeline the selector uses.
+Rankings (cosine top-k per query) are compared against the first backend
+listed, the reference, as mean top-k overlap and top-1 agreement. For same-model backends the mean cosine between
+their embeddings of the same text is reported too.
+
+Usage:
+    python scripts/benchmark_embeddings.py --backends pytorch,onnx
+    python scripts/benchmark_embeddings.py --folder public/resumes --top-k 5 --json embeddings.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import warnings
+from typing import Any, Dict, List
+
+import numpy as np
+
+warnings.filterwarnings("ignore")
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from embedding_backends import EMBEDDING_BACKENDS, create_embedding_backend
+from resume_selector_main_class import DEFAULT_CACHE_DIR, ResumeSelector
+
+SKILLS = ["Python", "Java", "React", "SQL", "machine learning", "Docker", "Kubernetes", "embedded C",
+          "PCB design", "data analysis", "TensorFlow", "Node.js", "AWS", "computer vision", "robotics"]
+ROLES = ["Software Engineer", "Data Scientist", "Research Assistant", "Embedded Developer",
+         "Web Developer", "ML Intern", "Teaching Assistant", "DevOps Engineer"]
+DEGREES = ["B.Tech in Computer Science", "Master of Science in Data Science", "PhD in Electrical Engineering",
+           "B.E. in Electronics", "M.Tech in Robotics"]
+
+QUERIES = [
+    "Build a React and Node.js web portal for lab bookings",
+    "Computer vision research on drone imagery using TensorFlow",
+    "Embedded C firmware and PCB design for an IoT sensor board",
+    "Senior data scientist for SQL analytics and machine learning models",
+    "Deploy microservices with Docker, Kubernetes and AWS",
+    "Robotics project needing Python and computer vision skills",
+    "Junior Java developer for a library management system",
+    "PhD student for machine learning research on medical data",
+]
+
+
+def synthetic_resumes(count: int, seed: int = 0) -> List[str]:
+    """Deterministic resume-like texts."""
+    rng = random.Random(seed)
+    resumes = []
+    for i in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 7))
+        role = rng.choice(ROLES)
+        years = rng.randint(0, 10)
+        resumes.append(
+            f"Candidate {i}\n{role} with {years} years of experience.\n"
+            f"Education: {rng.choice(DEGREES)}\nSkills: {', '.join(skills)}\n"
+            + "".join(
+                f"Worked on projects involving {rng.choice(skills)} and {rng.choice(skills)}, "
+                f"delivering {rng.choice(['dashboards', 'firmware', 'APIs', 'models', 'prototypes'])} for "
+                f"{rng.choice(['a startup', 'a research lab', 'the university', 'an NGO'])}.\n"
+                # Real resumes vary a lot in length; so does padding waste
+                for _ in range(int(rng.paretovariate(1.2)) * 3)
+            )
+        )
+    return resumes
+
+
+def folder_resumes(folder: str) -> List[str]:
+    """Extract text from every PDF in a folder (extract-only selector, no model loaded)."""
+    selector = ResumeSelector(api_key="", quiet=True, mode="extract")
+    paths = sorted(str(os.path.join(folder, name)) for name in os.listdir(folder) if name.lower().endswith(".pdf"))
+    return [text for text in selector.extract_texts_from_pdfs(paths) if text]
+
+
+def normalize(embeddings: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def benchmark_backend(name: str, model: str, documents: List[str], queries: List[str],
+                      batch_size: int, model_dir: str) -> Dict[str, Any]:
+    """Load one backend, then time document and query encoding."""
+    start = time.perf_counter()
+    backend = create_embedding_backend(name, model, model_dir=model_dir)
+    backend.encode(documents[:min(8, len(documents))], batch_size=batch_size)  # warm-up
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    doc_embeddings = backend.encode(documents, batch_size=batch_size)
+    encode_seconds = time.perf_counter() - start
+
+    # Tuning is not timed: the selector tunes once per process and reuses the result
+    backend.token_budget = backend.autotune_token_budget(*backend.prepare_documents(documents))
+    start = time.perf_counter()
+    pipeline_embeddings = backend.encode_documents(documents)
+    pipeline_seconds = time.perf_counter() - start
+    pipeline_cosine = np.sum(normalize(pipeline_embeddings) * normalize(doc_embeddings), axis=1)
+
+    start = time.perf_counter()
+    query_embeddings = backend.encode(queries, batch_size=batch_size)
+    query_seconds = time.perf_counter() - start
+
+    return {
+        "backend": name,
+        "dim": int(doc_embeddings.shape[1]),
+        "load_seconds": load_seconds,
+        "docs_per_second": len(documents) / encode_seconds if encode_seconds else float("inf"),
+        "pipeline_docs_per_second": len(documents) / pipeline_seconds if pipeline_seconds else float("inf"),
+        "pipeline_min_cosine": float(np.min(pipeline_cosine)),
+        "query_ms": query_seconds * 1000 / len(queries),
+        "doc_embeddings": normalize(doc_embeddings),
+        "query_embeddings": normalize(query_embeddings),
+    }
+
+
+def rankings(result: Dict[str, Any], top_k: int) -> np.ndarray:
+    scores = result["query_embeddings"] @ result["doc_embeddings"].T
+    return np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends")
+    parser.add_argument("--backends", default="pytorch,onnx",
+                        help=f"Comma-separated backends from {', '.join(EMBEDDING_BACKENDS)}; the first is the reference")
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5", help="Embedding model name")
+    parser.add_argument("--folder", help="Folder of PDF resumes (default: synthetic resumes)")
+    parser.add_argument("--documents", type=int, default=256, help="Number of synthetic resumes")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--model-dir", default=os.path.join(DEFAULT_CACHE_DIR, "onnx"),
+                        help="Where exported ONNX models are kept")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    backends = [name.strip() for name in args.backends.split(",") if name.strip()]
+    documents = folder_resumes(args.folder) if args.folder else synthetic_resumes(args.documents)
+    if not documents:
+        print("❌ No documents to encode", file=sys.stderr)
+        sys.exit(1)
+    top_k = min(args.top_k, len(documents))
+    print(f"Encoding {len(documents)} resumes and {len(QUERIES)} queries with {', '.join(backends)}", file=sys.stderr)
+
+    results = [benchmark_backend(name, args.model, documents, QUERIES, args.batch_size, args.model_dir)
+               for name in backends]
+
+    reference = results[0]
+    reference_ranks = rankings(reference, top_k)
+    report = []
+    for result in results:
+        ranks = rankings(result, top_k)
+        overlap = np.mean([len(set(a) & set(b)) / top_k for a, b in zip(reference_ranks, ranks)])
+        entry = {
+            "backend": result["backend"],
+            "dim": result["dim"],
+            "load_seconds": round(result["load_seconds"], 3),
+            "docs_per_second": round(result["docs_per_second"], 1),
+            "pipeline_docs_per_second": round(result["pipeline_docs_per_second"], 1),
+            "pipeline_min_cosine": round(result["pipeline_min_cosine"], 4),
+            "query_ms": round(result["query_ms"], 2),
+            "speedup": round(result["docs_per_second"] / reference["docs_per_second"], 2),
+            f"overlap@{top_k}": round(float(overlap), 3),
+            "top1_agreement": round(float(np.mean(ranks[:, 0] == reference_ranks[:, 0])), 3),
+        }
+        if result["dim"] == reference["dim"] and result["backend"] != "hashing" and reference["backend"] != "hashing":
+            cosine = np.sum(result["doc_embeddings"] * reference["doc_embeddings"], axis=1)
+            entry["mean_cosine_to_reference"] = round(float(np.mean(cosine)), 4)
+        report.append(entry)
+
+    header = (f"{'backend':<10}{'docs/s':>10}{'pipeline':>10}{'speedup':>9}{'query ms':>10}"
+              f"{f'overlap@{top_k}':>12}{'top1':>7}")
+    print(header)
+    for entry in report:
+        print(f"{entry['backend']:<10}{entry['docs_per_second']:>10}{entry['pipeline_docs_per_second']:>10}"
+              f"{entry['speedup']:>9}{entry['query_ms']:>10}{entry[f'overlap@{top_k}']:>12}{entry['top1_agreement']:>7}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"documents": len(documents), "queries": len(QUERIES), "top_k": top_k,
+                       "model": args.model, "reference": reference["backend"], "backends": report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
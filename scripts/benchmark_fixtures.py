@@ -0,0 +1,167 @@
+"""
+Test fixtures for resume selector benchmarks.
+
+Provides a synthetic resume corpus written as real PDF files (by a small
+hand-rolled PDF writer, so no PDF library is needed) and a deterministic,
+offline stand-in for the Mistral client with configurable latency.
+"""
+import re
+import json
+import time
+import random
+import asyncio
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from benchmark_embeddings import SKILLS, ROLES, DEGREES, synthetic_resumes
+
+LINES_PER_PAGE = 55
+LINE_WIDTH = 90
+
+
+def _pdf_escape(line: str) -> bytes:
+    data = line.encode("latin-1", errors="replace")
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def write_text_pdf(path: str, text: str):
+    """
+    Write plain text as a minimal multi-page PDF (Helvetica, one text line per line).
+
+    Args:
+        path (str): Output file
+        text (str): Text to lay out; long lines are wrapped
+    """
+    lines: List[str] = []
+    for paragraph in text.splitlines():
+        lines.extend(textwrap.wrap(paragraph, LINE_WIDTH) or [""])
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # Objects 1-3 are the catalog, page tree and font; each page adds a page and a content object
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids) + b"] /Count %d >>" % len(pages),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for page_id, page_lines in zip(page_ids, pages):
+        stream = b"BT /F1 10 Tf 14 TL 50 800 Td\n" + b"".join(
+            b"(" + _pdf_escape(line) + b") Tj T*\n" for line in page_lines
+        ) + b"ET"
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    Path(path).write_bytes(bytes(output))
+
+
+def write_resume_corpus(folder: str, count: int, seed: int = 0) -> List[str]:
+    """
+    Write `count` synthetic resume PDFs (deterministic for a seed).
+
+    Args:
+        folder (str): Output folder (created if needed)
+        count (int): Number of resumes
+        seed (int): Random seed
+
+    Returns:
+        List[str]: Paths of the written PDFs
+    """
+    Path(folder).mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for i, text in enumerate(synthetic_resumes(count, seed=seed)):
+        contact = f"candidate{i}@example.com | +1 555 {rng.randint(1000000, 9999999)}"
+        path = str(Path(folder) / f"resume_{i:05d}.pdf")
+        write_text_pdf(path, text.replace("\n", f"\n{contact}\n", 1))
+        paths.append(path)
+    return paths
+
+
+def _response(prompt: str, content: str) -> SimpleNamespace:
+    # Token counts use the rough 4-characters-per-token rule
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+                           usage=SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4))
+
+
+def _mentions(vocabulary: List[str], text: str) -> List[str]:
+    lowered = text.lower()
+    return [term for term in vocabulary if term.lower() in lowered]
+
+
+def fake_metadata(resume_text: str) -> Dict[str, Any]:
+    """Metadata a model might extract from a synthetic resume, derived from its text alone."""
+    name = re.search(r"Candidate \d+", resume_text)
+    years = re.search(r"(\d+) years of experience", resume_text)
+    email = re.search(r"\S+@\S+", resume_text)
+    headline = re.search(r"^.*years of experience.*$", resume_text, re.MULTILINE)
+    return {
+        "name": name.group(0) if name else "Unknown",
+        "email": email.group(0) if email else "",
+        "phone": "",
+        "skills": _mentions(SKILLS, resume_text),
+        "experience_years": int(years.group(1)) if years else 0,
+        "education": _mentions(DEGREES, resume_text),
+        "job_titles": _mentions(ROLES, resume_text),
+        "summary": headline.group(0) if headline else ""
+    }
+
+
+class FakeChat:
+    """chat.complete / chat.complete_async with fixed latency and deterministic JSON answers (single or batched)."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.prompt_chars = 0
+
+    def _answer(self, messages: List[Dict[str, str]]) -> SimpleNamespace:
+        prompt = messages[-1]["content"]
+        self.calls += 1
+        self.prompt_chars += len(prompt)
+
+        if "## PROJECT DESCRIPTION" in prompt:
+            name = re.search(r"^Name: (.*)$", prompt, re.MULTILINE)
+            skills = re.search(r"^Skills: (.*)$", prompt, re.MULTILINE)
+            return _response(prompt, json.dumps({
+                "name": name.group(1) if name else "Unknown",
+                "skills": [s for s in skills.group(1).split(", ") if s] if skills else [],
+                "reasons": ["Relevant skills", "Relevant experience", "Good project fit"],
+                "score": 0.0
+            }))
+        if "### RESUME " in prompt:
+            blocks = re.split(r"^### RESUME (\S+)$", prompt, flags=re.MULTILINE)[1:]
+            return _response(prompt, json.dumps({"resumes": [
+                {"id": resume_id, **fake_metadata(block)} for resume_id, block in zip(blocks[::2], blocks[1::2])
+            ]}))
+        return _response(prompt, json.dumps(fake_metadata(prompt)))
+
+    def complete(self, messages: List[Dict[str, str]], **kwargs) -> SimpleNamespace:
+        time.sleep(self.latency)
+        return self._answer(messages)
+
+    async def complete_async(self, messages: List[Dict[str, str]], **kwargs) -> SimpleNamespace:
+        await asyncio.sleep(self.latency)
+        return self._answer(messages)
+
+
+class FakeMistral:
+    """Offline stand-in for mistralai.Mistral; counts calls and prompt characters."""
+
+    def __init__(self, latency: float = 0.05):
+        """
+        Args:
+            latency (float): Seconds every chat call takes
+        """
+        self.chat = FakeChat(latency)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Stage-level throughput benchmark for the resume selector.
+
+For each corpus size, synthetic resume PDFs are written to a temporary
+folder and run through a fresh ResumeSelector with empty caches and an
+offline fake Mistral client (fixed latency, deterministic answers), timing
+each stage separately:
+
+    extraction   PDF text extraction
+    metadata     LLM metadata extraction (fake client)
+    model_load   embedding model load
+    embedding    document embedding
+    indexing     FAISS index build (embeddings come from the store)
+    search       one search per project query
+    summaries    LLM candidate summaries for the top results (fake client)
+
+Each stage reports wall time, per-item time and the peak resident memory
+sampled while it ran. Results are written as JSON; pass an earlier result
+file with --baseline to print per-stage speedups against it.
+
+Usage:
+    python scripts/benchmark_pipeline.py --json pipeline.json
+    python scripts/benchmark_pipeline.py --sizes 100 --llm-latency-ms 300 --baseline pipeline.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import warnings
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+warnings.filterwarnings("ignore")
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_embeddings import QUERIES
+from benchmark_fixtures import FakeMistral, write_resume_corpus
+from embedding_backends import EMBEDDING_BACKENDS
+from resume_selector_main_class import ResumeSelector, DEFAULT_EMBEDDING_BACKEND
+from resume_store import ResumeRecord
+from telemetry import current_rss, max_rss
+
+STAGES = ("extraction", "metadata", "model_load", "embedding", "indexing", "search", "summaries")
+
+
+class RssSampler:
+    """Tracks the peak RSS reached while a stage runs by sampling in a background thread."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, current_rss() or 0)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss() or 0)
+        if not self.peak:
+            # No /proc or psutil: fall back to the process-wide peak
+            self.peak = max_rss() or 0
+
+
+@contextmanager
+def stage(results: Dict[str, Dict[str, Any]], name: str, items: int):
+    """Time a block and record its wall time, per-item time and peak RSS under results[name]."""
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+    results[name] = {
+        "seconds": round(seconds, 4),
+        "items": items,
+        "ms_per_item": round(seconds * 1000 / items, 3) if items else None,
+        "peak_rss_mb": round(sampler.peak / 2 ** 20, 1)
+    }
+    print(f"  {name:<11}{seconds:>9.3f}s  {results[name]['peak_rss_mb']:>8.1f} MB", file=sys.stderr)
+
+
+def run_size(count: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Benchmark every stage on a fresh corpus of `count` resumes."""
+    work_dir = tempfile.mkdtemp(prefix="resume-benchmark-")
+    try:
+        pdf_paths = write_resume_corpus(os.path.join(work_dir, "resumes"), count, seed=args.seed)
+        llm = FakeMistral(latency=args.llm_latency_ms / 1000)
+        selector = ResumeSelector(
+            api_key="",
+            embedding_model=args.model,
+            quiet=True,
+            cache_dir=os.path.join(work_dir, "cache"),
+            extraction_workers=args.extraction_workers,
+            llm_concurrency=args.llm_concurrency,
+            llm_requests_per_second=args.llm_rps,
+            embedding_backend=args.embedding_backend,
+            llm_client=llm
+        )
+        print(f"{count} resumes:", file=sys.stderr)
+        stages: Dict[str, Dict[str, Any]] = {}
+
+        with stage(stages, "extraction", count):
+            texts = selector.extract_texts_from_pdfs(pdf_paths)
+
+        with stage(stages, "metadata", count):
+            metadata = selector.extract_metadata_batch(texts)
+        metadata_calls = llm.chat.calls
+
+        for pdf_path, text, meta in zip(pdf_paths, texts, metadata):
+            selector._ingest_resume(pdf_path, text=text, metadata=meta)
+        records: List[ResumeRecord] = list(selector.store)
+
+        with stage(stages, "model_load", 1):
+            selector.warm_up()
+
+        with stage(stages, "embedding", len(records)):
+            selector._encode_documents([selector._build_enhanced_text(r.text, r.metadata) for r in records])
+
+        with stage(stages, "indexing", len(records)):
+            selector.build_index()
+
+        queries = QUERIES[:args.queries]
+        with stage(stages, "search", len(queries)):
+            candidates = [selector.search_resumes(query, top_k=args.top_k) for query in queries]
+
+        summary_queries = min(args.summary_queries, len(queries))
+        summarized = sum(len(c) for c in candidates[:summary_queries])
+        with stage(stages, "summaries", summarized):
+            for query, found in zip(queries[:summary_queries], candidates):
+                selector.generate_candidate_summaries(query, found)
+
+        return {
+            "resumes": count,
+            "indexed": len(records),
+            "stages": stages,
+            "total_seconds": round(sum(s["seconds"] for s in stages.values()), 4),
+            "llm": {
+                "metadata_calls": metadata_calls,
+                "summary_calls": llm.chat.calls - metadata_calls,
+                "prompt_chars": llm.chat.prompt_chars
+            }
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def print_comparison(result: Dict[str, Any], baseline: Dict[str, Any]):
+    """Print per-stage speedups (baseline time / current time) for the sizes both runs measured."""
+    previous = {run["resumes"]: run for run in baseline.get("runs", [])}
+    for run in result["runs"]:
+        base = previous.get(run["resumes"])
+        if base is None:
+            continue
+        print(f"\nSpeedup vs baseline, {run['resumes']} resumes:")
+        for name in STAGES:
+            now, before = run["stages"].get(name), base["stages"].get(name)
+            if now and before and now["seconds"]:
+                print(f"  {name:<11}{before['seconds'] / now['seconds']:>8.2f}x"
+                      f"  ({before['seconds']:.3f}s -> {now['seconds']:.3f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume selector stages on a synthetic corpus")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated corpus sizes")
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5", help="Embedding model name")
+    parser.add_argument("--embedding-backend", choices=EMBEDDING_BACKENDS, default=DEFAULT_EMBEDDING_BACKEND)
+    parser.add_argument("--extraction-workers", type=int, default=1)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0, help="Latency of every fake Mistral call")
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--llm-rps", type=float, default=50.0, help="Request rate limit for batched LLM calls")
+    parser.add_argument("--queries", type=int, default=len(QUERIES), help="Project queries to search")
+    parser.add_argument("--summary-queries", type=int, default=2, help="Queries whose results get summaries")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    parser.add_argument("--baseline", help="Earlier --json output to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    result = {
+        "config": {key: value for key, value in vars(args).items() if key not in ("json_path", "baseline")},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "runs": [run_size(count, args) for count in sizes],
+        "peak_rss_mb": round((max_rss() or 0) / 2 ** 20, 1)
+    }
+
+    print(f"\n{'resumes':>8}" + "".join(f"{name:>12}" for name in STAGES) + f"{'total':>10}")
+    for run in result["runs"]:
+        print(f"{run['resumes']:>8}" + "".join(f"{run['stages'][name]['seconds']:>12.3f}" for name in STAGES)
+              + f"{run['total_seconds']:>10.2f}")
+    print(f"Peak RSS: {result['peak_rss_mb']} MB")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            print_comparison(result, json.load(f))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the resume selector.
+
+Measures, in fresh interpreters, how long it takes to import
+resume_selector_main_class and to construct an extract-only ResumeSelector,
+and checks that neither pulls in the heavy dependencies that are meant to
+load lazily. Exits non-zero on a regression, so it can run in CI or as a
+pre-deploy check.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 10 --max-import-seconds 0.5 --json startup.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from typing import Any, Dict, List
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must not be imported until a capability needs them
+HEAVY_MODULES = ("torch", "transformers", "sentence_transformers", "faiss", "mistralai", "httpx", "pdfplumber")
+
+PROBE = """
+import sys, time, json
+sys.path.insert(0, {scripts_dir!r})
+start = time.perf_counter()
+import resume_selector_main_class
+imported = time.perf_counter()
+resume_selector_main_class.ResumeSelector(api_key="", quiet=True, cache_dir=None, mode="extract")
+constructed = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "construct_seconds": constructed - imported,
+    "heavy_modules_loaded": sorted(m for m in {heavy!r} if m in sys.modules)
+}}))
+"""
+
+
+def run_probe() -> Dict[str, Any]:
+    """Run one measurement in a fresh interpreter."""
+    code = PROBE.format(scripts_dir=SCRIPTS_DIR, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume selector import and startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure (median is reported)")
+    parser.add_argument("--max-import-seconds", type=float,
+                        default=float(os.environ.get("RESUME_SELECTOR_MAX_IMPORT_SECONDS", "1.0")),
+                        help="Fail if the median import time exceeds this")
+    parser.add_argument("--max-construct-seconds", type=float, default=0.5,
+                        help="Fail if the median extract-only construction time exceeds this")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, Any]] = [run_probe() for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "import_seconds": statistics.median(run["import_seconds"] for run in runs),
+        "construct_seconds": statistics.median(run["construct_seconds"] for run in runs),
+        "heavy_modules_loaded": sorted(set().union(*(run["heavy_modules_loaded"] for run in runs))),
+    }
+
+    print(f"Import:                {result['import_seconds'] * 1000:.1f} ms (median of {args.runs})")
+    print(f"Extract-only startup:  {result['construct_seconds'] * 1000:.1f} ms")
+
+    failures = []
+    if result["import_seconds"] > args.max_import_seconds:
+        failures.append(f"import took {result['import_seconds']:.3f}s (budget {args.max_import_seconds}s)")
+    if result["construct_seconds"] > args.max_construct_seconds:
+        failures.append(f"construction took {result['construct_seconds']:.3f}s "
+                        f"(budget {args.max_construct_seconds}s)")
+    if result["heavy_modules_loaded"]:
+        failures.append(f"heavy modules imported eagerly: {', '.join(result['heavy_modules_loaded'])}")
+    result["failures"] = failures
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}", file=sys.stderr)
+        sys.exit(1)
+    print("✅ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Embedding backends for the resume selector.
+
+Every backend turns texts into float32 vectors (L2 normalization is left to
+the caller) and exposes a cache key, so embeddings cached or indexed with one
+backend are never mixed with another's:
+
+    pytorch  - SentenceTransformer in fp32 PyTorch (the original behaviour)
+    onnx     - the same model exported to ONNX with dynamic int8 quantization,
+               run on ONNX Runtime; much faster on CPU-only servers
+    hashing  - deterministic feature hashing of words, no model or network;
+               for tests and offline tooling, not for real shortlists
+
+Document batches go through encode_documents, which trims each text to the
+model's token limit, groups texts of similar token length into batches under
+a padded-token budget (tuned to the machine), and restores input order.
+"""
+import os
+import re
+import time
+import sys
+import hashlib
+import platform
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from telemetry import Telemetry
+
+EMBEDDING_BACKENDS = ("pytorch", "onnx", "hashing")
+
+HASHING_DIM = 384
+
+# First sentence-transformers release with the ONNX backend and quantized export
+ONNX_MIN_SENTENCE_TRANSFORMERS = (3, 2)
+
+# Padded tokens per forward pass considered when tuning document batches
+TOKEN_BUDGETS = (1024, 2048, 4096, 8192, 16384, 32768)
+MAX_BATCH_TEXTS = 256
+
+# Encodes of at least this many documents tune the token budget once per backend
+AUTOTUNE_MIN_TEXTS = 256
+AUTOTUNE_SAMPLE_TEXTS = 64
+
+
+class EmbeddingBackend:
+    """Interface shared by all embedding backends."""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.token_budget: Optional[int] = None
+        # Replaced by the selector's telemetry; disabled by default
+        self.telemetry = Telemetry()
+
+    @property
+    def dim(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies the vectors this backend produces (used by caches and snapshots)."""
+        return embedding_cache_key(self.name, self.model_name)
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts (List[str]): Texts to embed
+            batch_size (int): Texts per forward pass
+            show_progress_bar (bool): Show a progress bar on stderr
+
+        Returns:
+            np.ndarray: (len(texts), dim) float32 embeddings
+        """
+        raise NotImplementedError
+
+    def prepare_documents(self, texts: List[str]) -> Tuple[List[Any], List[int]]:
+        """
+        Turn texts into model inputs trimmed to the input limit, with their token counts.
+
+        Args:
+            texts (List[str]): Texts to embed
+
+        Returns:
+            Tuple[List[Any], List[int]]: One prepared input per text and its token count
+        """
+        return list(texts), [len(text.split()) + 2 for text in texts]
+
+    def encode_prepared(self, items: List[Any]) -> np.ndarray:
+        """Embed one batch of prepare_documents output in a single forward pass."""
+        return self.encode(items, batch_size=len(items))
+
+    def encode_documents(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed many texts with token trimming and length-bucketed batches.
+
+        Texts are sorted by token count and packed into batches of similar
+        length whose padded size stays under the token budget, so short
+        texts are not padded to the longest one in the input. Output rows
+        follow input order.
+
+        Args:
+            texts (List[str]): Texts to embed
+
+        Returns:
+            np.ndarray: (len(texts), dim) float32 embeddings
+        """
+        if not texts:
+            return np.zeros((0, self.dim), dtype='float32')
+
+        items, lengths = self.prepare_documents(texts)
+        if self.token_budget is None and len(texts) >= AUTOTUNE_MIN_TEXTS:
+            with self.telemetry.span("autotune_token_budget", backend=self.name) as span:
+                self.token_budget = self.autotune_token_budget(items, lengths)
+                span.set(token_budget=self.token_budget)
+        budget = self.token_budget or default_token_budget(self.dim)
+
+        embeddings = np.empty((len(texts), self.dim), dtype='float32')
+        for batch in length_buckets(lengths, budget):
+            with self.telemetry.span("encode_batch", backend=self.name) as span:
+                embeddings[batch] = self.encode_prepared([items[i] for i in batch])
+                span.set(texts=len(batch), padded_tokens=len(batch) * max(lengths[i] for i in batch))
+        return embeddings
+
+    def autotune_token_budget(self, items: List[Any], lengths: List[int]) -> int:
+        """
+        Pick the padded-token budget with the best measured throughput on a sample.
+
+        Candidates are limited by available memory; the sample spans the
+        whole length distribution.
+
+        Args:
+            items (List[Any]): prepare_documents output
+            lengths (List[int]): Token counts
+
+        Returns:
+            int: Best token budget
+        """
+        order = np.argsort(lengths, kind="stable")
+        sample = order[np.linspace(0, len(order) - 1, min(AUTOTUNE_SAMPLE_TEXTS, len(order))).astype(int)]
+        sample_items = [items[i] for i in sample]
+        sample_lengths = [lengths[i] for i in sample]
+        sample_tokens = sum(sample_lengths)
+
+        cap = memory_token_cap(self.dim)
+        candidates = [budget for budget in TOKEN_BUDGETS if budget <= cap] or [TOKEN_BUDGETS[0]]
+        # Budgets above the sample's total size would all run it as a single batch
+        candidates = [budget for budget in candidates if budget <= 2 * sample_tokens] or candidates[:1]
+
+        self.encode_prepared(sample_items[:2])  # warm-up
+        best_budget, best_rate = candidates[0], 0.0
+        for budget in candidates:
+            start = time.perf_counter()
+            for batch in length_buckets(sample_lengths, budget):
+                self.encode_prepared([sample_items[i] for i in batch])
+            rate = sample_tokens / max(time.perf_counter() - start, 1e-9)
+            if rate > best_rate:
+                best_budget, best_rate = budget, rate
+        return best_budget
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """fp32 PyTorch SentenceTransformer."""
+
+    name = "pytorch"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model_name)
+
+    @property
+    def dim(self) -> int:
+        # Renamed in newer sentence-transformers releases
+        get_dimension = getattr(self.model, "get_embedding_dimension", None) or \
+            self.model.get_sentence_embedding_dimension
+        return get_dimension()
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, batch_size=batch_size, show_progress_bar=show_progress_bar),
+                          dtype='float32')
+
+    def prepare_documents(self, texts: List[str]) -> Tuple[List[Any], List[int]]:
+        """
+        Tokenize once, truncating to max_seq_length; batches are then padded from these IDs directly.
+
+        Falls back to plain texts when the tokenizer cannot be driven directly.
+        """
+        tokenizer = getattr(self.model, "tokenizer", None)
+        max_length = getattr(self.model, "max_seq_length", None)
+        if tokenizer is None or not getattr(tokenizer, "is_fast", False) or tokenizer.pad_token_id is None \
+                or not max_length:
+            return super().prepare_documents(texts)
+
+        # Tokens span at least one character and rarely more than eight; this bound
+        # just avoids tokenizing text far past the limit
+        texts = [text[:max_length * 8] for text in texts]
+        input_ids = tokenizer(texts, truncation=True, max_length=max_length, return_attention_mask=False,
+                              return_token_type_ids=False)["input_ids"]
+        return input_ids, [len(ids) for ids in input_ids]
+
+    def encode_prepared(self, items: List[Any]) -> np.ndarray:
+        if not items or isinstance(items[0], str):
+            return super().encode_prepared(items)
+
+        import torch
+        tokenizer = self.model.tokenizer
+        longest = max(len(ids) for ids in items)
+        input_ids = np.full((len(items), longest), tokenizer.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(items), longest), dtype=np.int64)
+        for row, ids in enumerate(items):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+
+        features = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in tokenizer.model_input_names:
+            features["token_type_ids"] = np.zeros_like(input_ids)
+        features = {name: torch.from_numpy(value).to(self.model.device) for name, value in features.items()}
+        with torch.inference_mode():
+            embeddings = self.model(features)["sentence_embedding"]
+        return embeddings.float().cpu().numpy()
+
+
+class OnnxBackend(SentenceTransformerBackend):
+    """
+    SentenceTransformer exported to ONNX and dynamically quantized to int8.
+
+    The export and quantization run once per model and are saved under
+    model_dir; later instances load the quantized model directly.
+    Requires sentence-transformers >= 3.2 with optimum and onnxruntime
+    (pip install -r requirements-onnx.txt).
+    """
+
+    name = "onnx"
+
+    def __init__(self, model_name: str, model_dir: Optional[str] = None, quantization: Optional[str] = None):
+        """
+        Args:
+            model_name (str): HuggingFace model name or local SentenceTransformer directory
+            model_dir (Optional[str]): Where the exported models are kept (a temporary directory if None)
+            quantization (Optional[str]): "arm64", "avx2", "avx512" or "avx512_vnni"; detected if None
+        """
+        EmbeddingBackend.__init__(self, model_name)
+        _require_onnx_support()
+        from sentence_transformers import SentenceTransformer
+
+        self.quantization = quantization or detect_quantization_target()
+        export_dir = Path(model_dir or tempfile.mkdtemp(prefix="onnx-")) / _slug(model_name)
+        quantized = self._find_quantized(export_dir)
+        if quantized is None:
+            from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+            print(f"Exporting {model_name} to ONNX ({self.quantization} int8)...", file=sys.stderr)
+            model = SentenceTransformer(model_name, backend="onnx")
+            model.save_pretrained(str(export_dir))
+            export_dynamic_quantized_onnx_model(model, self.quantization, str(export_dir))
+            quantized = self._find_quantized(export_dir)
+            if quantized is None:
+                raise RuntimeError(f"Quantized ONNX model for {model_name} was not written to {export_dir}")
+
+        self.model = SentenceTransformer(str(export_dir), backend="onnx",
+                                         model_kwargs={"file_name": quantized.relative_to(export_dir).as_posix()})
+
+    def _find_quantized(self, export_dir: Path) -> Optional[Path]:
+        matches = sorted((export_dir / "onnx").glob(f"model_*int8_{self.quantization}.onnx"))
+        return matches[0] if matches else None
+
+
+class HashingBackend(EmbeddingBackend):
+    """Deterministic signed feature hashing of lowercased words and word bigrams."""
+
+    name = "hashing"
+
+    def __init__(self, model_name: str = "hashing", dim: int = HASHING_DIM):
+        super().__init__(model_name)
+        self._dim = dim
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def cache_key(self) -> str:
+        return f"hashing-{self._dim}"
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self._dim), dtype='float32')
+        for row, text in enumerate(texts):
+            words = re.findall(r"\w+", text.lower())
+            for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+                digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                embeddings[row, digest % self._dim] += 1.0 if (digest >> 63) else -1.0
+        return embeddings
+
+
+def length_buckets(lengths: List[int], token_budget: int) -> Iterator[np.ndarray]:
+    """
+    Group text indices into batches of similar token length.
+
+    Indices are visited longest first; a batch is closed when adding the
+    next text would push its padded size (count * longest) over token_budget.
+
+    Args:
+        lengths (List[int]): Token count per text
+        token_budget (int): Maximum padded tokens per batch
+
+    Yields:
+        np.ndarray: Indices of one batch
+    """
+    order = np.argsort(-np.asarray(lengths), kind="stable")
+    start = 0
+    while start < len(order):
+        longest = max(1, lengths[order[start]])
+        size = max(1, min(MAX_BATCH_TEXTS, token_budget // longest))
+        yield order[start:start + size]
+        start += size
+
+
+def memory_token_cap(dim: int) -> int:
+    """
+    Largest padded-token batch whose estimated activations fit in a quarter of available memory.
+
+    The estimate (about 24 floats of activations per hidden unit per token)
+    is deliberately rough; it only rules out budgets that could swap.
+    """
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return TOKEN_BUDGETS[-1]
+    return int(available * 0.25 / (dim * 4 * 24))
+
+
+def default_token_budget(dim: int) -> int:
+    """Token budget used before autotuning: scales with cores, capped by memory."""
+    cores = os.cpu_count() or 1
+    cap = memory_token_cap(dim)
+    fitting = [budget for budget in TOKEN_BUDGETS if budget <= min(cap, 1024 * cores * 2)]
+    return fitting[-1] if fitting else TOKEN_BUDGETS[0]
+
+
+def embedding_cache_key(backend: str, model_name: str) -> str:
+    """
+    Cache key for a backend/model pair, computable without loading the model.
+
+    The PyTorch key is the bare model name so caches written before backends
+    existed stay valid.
+    """
+    if backend == "pytorch":
+        return model_name
+    if backend == "hashing":
+        return f"hashing-{HASHING_DIM}"
+    return f"{model_name}@{backend}-int8"
+
+
+def detect_quantization_target() -> str:
+    """Pick the ONNX Runtime quantization config matching this CPU."""
+    machine = platform.machine().lower()
+    if machine in ("arm64", "aarch64"):
+        return "arm64"
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            flags = f.read()
+    except OSError:
+        return "avx2"
+    if "avx512_vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+
+def create_embedding_backend(backend: str, model_name: str, model_dir: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Instantiate an embedding backend by name.
+
+    Args:
+        backend (str): One of EMBEDDING_BACKENDS
+        model_name (str): HuggingFace model name (ignored by the hashing backend)
+        model_dir (Optional[str]): Directory for exported ONNX models
+
+    Returns:
+        EmbeddingBackend: The loaded backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend == "pytorch":
+        return SentenceTransformerBackend(model_name)
+    if backend == "onnx":
+        return OnnxBackend(model_name, model_dir=model_dir)
+    if backend == "hashing":
+        return HashingBackend()
+    raise ValueError(f"Unknown embedding backend {backend!r}; expected one of {', '.join(EMBEDDING_BACKENDS)}")
+
+
+def _require_onnx_support():
+    """
+    Fail early, with the fix, when the installed packages cannot run the onnx backend.
+
+    Raises:
+        ImportError: If sentence-transformers is older than 3.2 or optimum's ONNX Runtime support is missing
+    """
+    import importlib.util
+    import sentence_transformers
+
+    version = sentence_transformers.__version__
+    match = re.match(r"(\d+)\.(\d+)", version)
+    if match is None or (int(match.group(1)), int(match.group(2))) < ONNX_MIN_SENTENCE_TRANSFORMERS:
+        raise ImportError(f"The onnx embedding backend needs sentence-transformers >= "
+                          f"{'.'.join(map(str, ONNX_MIN_SENTENCE_TRANSFORMERS))} (installed: {version}); "
+                          f"run pip install -r requirements-onnx.txt")
+    try:
+        found = importlib.util.find_spec("optimum.onnxruntime") is not None
+    except ImportError:
+        found = False
+    if not found:
+        raise ImportError('The onnx embedding backend needs optimum with ONNX Runtime support; '
+                          'run pip install -r requirements-onnx.txt')
+
+
+def _slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "--", model_name.strip("/")) or "model"
@@ -0,0 +1,69 @@
+"""
+Inter-process file locks.
+
+The shared resume index is updated by the long-lived worker and by one-off
+scripts spawned by the API route. file_lock serializes those updates with an
+advisory lock on a lock file (fcntl on POSIX, msvcrt on Windows), held for
+the duration of a with-block.
+"""
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Seconds between attempts while another process holds the lock
+POLL_INTERVAL = 0.1
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: str, timeout: Optional[float] = 600.0) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file, waiting for other processes to release it.
+
+    Args:
+        path (str): Lock file (created if missing; its contents are unused)
+        timeout (Optional[float]): Seconds to wait before giving up (None waits forever)
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within timeout
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not _try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out after {timeout}s waiting for lock {path}")
+            time.sleep(POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,40 @@
+"""
+Deferred imports for the resume selector's heavy dependencies.
+
+faiss, pdfplumber, sentence_transformers (torch) and mistralai together take
+seconds to import. Modules bound with LazyModule are imported on first
+attribute access, so callers that never touch a capability never pay for it.
+"""
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """Stand-in for a module that imports the real one on first attribute access."""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name (str): Fully qualified module name
+        """
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def preload(*modules: LazyModule):
+    """Import lazily bound modules now (e.g. to warm up a long-lived worker)."""
+    for module in modules:
+        module._load()
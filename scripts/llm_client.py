@@ -0,0 +1,110 @@
+"""
+Concurrency helpers for Mistral calls made by the resume selector.
+
+Provides an asyncio token-bucket rate limiter and a retry wrapper with
+jittered exponential backoff for rate-limit (429) and server (5xx) errors.
+"""
+import asyncio
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Asyncio token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request takes one token and waits when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): Sustained requests per second
+            capacity (Optional[float]): Maximum burst size (defaults to max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "raw_response", None), "status_code", None)
+    return status
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Read a Retry-After header (in seconds) from an SDK error, if present."""
+    headers = getattr(getattr(error, "raw_response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Return True for rate-limit, server and transport errors that are worth retrying."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    # httpx is only loaded once the Mistral SDK is, so don't import it just for this check
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    return _status_code(error) in RETRYABLE_STATUS_CODES
+
+
+async def call_with_retries(make_call: Callable[[], Awaitable[Any]], max_retries: int = 4,
+                            base_delay: float = 0.5, max_delay: float = 20.0,
+                            rate_limiter: Optional[TokenBucket] = None) -> Any:
+    """
+    Await make_call(), retrying retryable errors with full-jitter exponential backoff.
+
+    Args:
+        make_call (Callable[[], Awaitable[Any]]): Factory creating a fresh request coroutine
+        max_retries (int): Retries after the first attempt
+        base_delay (float): Backoff base in seconds
+        max_delay (float): Upper bound on a single backoff in seconds
+        rate_limiter (Optional[TokenBucket]): Limiter consulted before every attempt
+
+    Returns:
+        Any: The call's result
+
+    Raises:
+        Exception: The last error if it is not retryable or retries are exhausted
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        try:
+            return await make_call()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+            delay = max(delay, min(max_delay, _retry_after(e) or 0))
+            print(f"⚠️ LLM call failed ({e}); retrying in {delay:.1f}s", file=sys.stderr)
+            attempt += 1
+            await asyncio.sleep(delay)
@@ -0,0 +1,240 @@
+"""
+Rule-based resume metadata extraction, run before the LLM.
+
+Contact details, vocabulary skills, degrees and job titles can be read
+reliably with regexes, section detection and a curated vocabulary, so the
+selector only asks Mistral for the fields this module leaves out (usually
+the summary and years of experience). Every field is either returned with
+confidence or omitted; nothing is guessed.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from metadata_index import DEGREE_KEYWORDS
+
+# Metadata schema shared with the LLM prompt, in prompt order
+METADATA_FIELDS = ("name", "email", "phone", "skills", "experience_years", "education", "job_titles", "summary")
+
+# Fewer vocabulary matches than this and the LLM is asked for skills too
+MIN_LOCAL_SKILLS = 3
+
+SKILL_VOCABULARY = (
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C", "C++", "C#", "Go", "Rust", "Kotlin", "Swift", "Ruby",
+    "PHP", "Scala", "R", "MATLAB", "SQL", "Bash", "Dart", "Verilog", "VHDL", "Embedded C", "Assembly",
+    # Web and mobile
+    "HTML", "CSS", "React", "React Native", "Angular", "Vue.js", "Next.js", "Node.js", "Express.js", "Django",
+    "Flask", "FastAPI", "Spring Boot", "Tailwind CSS", "Bootstrap", "GraphQL", "REST APIs", "Flutter", "Android",
+    "iOS", "MERN",
+    # Data and ML
+    "Machine Learning", "Deep Learning", "Computer Vision", "NLP", "Natural Language Processing", "TensorFlow",
+    "PyTorch", "Keras", "scikit-learn", "Pandas", "NumPy", "OpenCV", "Data Analysis", "Data Science",
+    "Data Visualization", "Power BI", "Tableau", "Excel", "Generative AI", "LLM", "Hugging Face",
+    # Databases and infrastructure
+    "PostgreSQL", "MySQL", "MongoDB", "SQLite", "Redis", "Firebase", "Prisma", "AWS", "Azure", "GCP",
+    "Google Cloud", "Docker", "Kubernetes", "Terraform", "Linux", "Git", "GitHub", "CI/CD", "Jenkins",
+    # Hardware and engineering
+    "Arduino", "Raspberry Pi", "IoT", "PCB Design", "Embedded Systems", "FPGA", "Robotics", "ROS", "AutoCAD",
+    "SolidWorks", "CAD", "Simulink", "LabVIEW", "3D Printing",
+    # Design and process
+    "Figma", "UI/UX", "Agile", "Scrum", "Jira",
+)
+
+# Single letters and common words only count inside a skills section
+SECTION_ONLY_SKILLS = {"C", "R", "Go", "Swift", "Excel", "Git", "CAD", "Agile"}
+
+TITLE_KEYWORDS = (
+    "engineer", "developer", "intern", "analyst", "scientist", "manager", "assistant", "consultant",
+    "designer", "researcher", "architect", "lead", "administrator", "associate", "specialist", "technician",
+    "programmer", "fellow", "coordinator", "head"
+)
+
+SECTION_HEADERS = {
+    "skills": ("skills", "technical skills", "key skills", "core skills", "technologies", "tech stack",
+               "skills & tools", "skills and tools", "tools"),
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internships", "internship", "positions of responsibility"),
+    "education": ("education", "academic background", "academics", "qualifications", "academic qualifications"),
+    "projects": ("projects", "academic projects", "personal projects", "key projects"),
+    "other": ("summary", "profile", "objective", "about me", "certifications", "achievements", "awards",
+              "publications", "languages", "interests", "hobbies", "extracurricular activities", "references",
+              "contact", "declaration")
+}
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"(?<![\w/])(\+?\d{1,3}[\s.-]?)?(\(?\d{2,5}\)?[\s.-]?)?\d{3,5}[\s.-]?\d{3,5}(?![\w/])")
+YEARS_RE = re.compile(r"(\d{1,2}(?:\.\d)?)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:\w+\s+)?experience", re.IGNORECASE)
+DATE_RANGE_RE = re.compile(
+    r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|till date|ongoing)",
+    re.IGNORECASE
+)
+# Document titles that head a resume and look like names ("Curriculum Vitae")
+DOCUMENT_TITLES = ("curriculum vitae", "resume", "cv", "biodata", "bio data")
+NAME_RE = re.compile(r"^[A-Z][A-Za-z'.-]*(?:\s+[A-Z][A-Za-z'.-]*){1,3}$")
+
+_SKILL_RE = re.compile(
+    r"(?<![\w+#.])(" + "|".join(re.escape(skill) for skill in sorted(SKILL_VOCABULARY, key=len, reverse=True))
+    + r")(?![\w+#]|\.\w)",
+    re.IGNORECASE
+)
+_CANONICAL_SKILLS = {skill.lower(): skill for skill in SKILL_VOCABULARY}
+# Degree keywords as whole words ("Master's" and "Bachelors" count, "mastered" does not)
+_DEGREE_RE = re.compile(
+    r"(?<![a-z])(" + "|".join(re.escape(k) for keywords in DEGREE_KEYWORDS.values() for k in keywords)
+    + r"|doctorate|b\.\s?tech|m\.\s?tech|b\.\s?e\.|m\.\s?e\.)(?:'?s)?(?![a-z])",
+    re.IGNORECASE
+)
+_TITLE_RE = re.compile(r"\b(" + "|".join(TITLE_KEYWORDS) + r")s?\b", re.IGNORECASE)
+_HEADER_LOOKUP = {header: section for section, headers in SECTION_HEADERS.items() for header in headers}
+_DOCUMENT_TITLE_RE = re.compile(r"\b(" + "|".join(DOCUMENT_TITLES) + r")\b", re.IGNORECASE)
+
+
+def split_sections(text: str) -> Dict[str, List[str]]:
+    """
+    Group resume lines under the section header they follow.
+
+    Lines before the first recognized header go under "header". An inline
+    header ("Skills: Python, SQL") starts its section with the rest of the line.
+
+    Args:
+        text (str): Resume text
+
+    Returns:
+        Dict[str, List[str]]: Non-empty lines per section ("skills", "experience", ...)
+    """
+    sections: Dict[str, List[str]] = {"header": []}
+    current = "header"
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        key = re.sub(r"[^a-z&/ ]", "", line.lower()).strip()
+        if len(line) <= 40 and key in _HEADER_LOOKUP:
+            current = _HEADER_LOOKUP[key]
+            sections.setdefault(current, [])
+            continue
+        header, colon, rest = line.partition(":")
+        inline_key = header.strip().lower()
+        if colon and rest.strip() and inline_key in _HEADER_LOOKUP:
+            current = _HEADER_LOOKUP[inline_key]
+            line = rest.strip()
+        sections.setdefault(current, []).append(line)
+    return sections
+
+
+def _find_name(header_lines: List[str]) -> Optional[str]:
+    """
+    The person's name, if the first header line is clearly one (2-4 capitalized words).
+
+    Document titles ("Curriculum Vitae", "Resume") above the name are skipped.
+    Only the first remaining line is considered, so anything ambiguous there
+    is left for the LLM rather than guessing from a later line.
+    """
+    for line in header_lines[:3]:
+        candidate = line.split("|")[0].strip()
+        key = re.sub(r"[^a-z ]", "", candidate.lower().replace("é", "e")).strip()
+        if key in DOCUMENT_TITLES:
+            continue
+        if NAME_RE.match(candidate) and not _TITLE_RE.search(candidate) and not _DEGREE_RE.search(candidate) \
+                and not _DOCUMENT_TITLE_RE.search(key) and key not in _HEADER_LOOKUP:
+            return candidate
+        return None
+    return None
+
+
+def _find_phone(text: str) -> Optional[str]:
+    for match in PHONE_RE.finditer(text):
+        phone = match.group(0).strip()
+        digits = re.sub(r"\D", "", phone)
+        # Years and date ranges are digit runs too
+        if 10 <= len(digits) <= 15 and not DATE_RANGE_RE.search(phone):
+            return phone
+    return None
+
+
+def _find_skills(text: str, skills_lines: List[str]) -> List[str]:
+    skills_text = "\n".join(skills_lines)
+    found: Dict[str, None] = {}
+    for source, in_section in ((skills_text, True), (text, False)):
+        for match in _SKILL_RE.finditer(source):
+            skill = _CANONICAL_SKILLS[match.group(1).lower()]
+            if in_section or skill not in SECTION_ONLY_SKILLS:
+                found.setdefault(skill)
+    return list(found)
+
+
+def _find_education(sections: Dict[str, List[str]]) -> List[str]:
+    if sections.get("education"):
+        return [line for line in sections["education"] if _DEGREE_RE.search(line) and len(line) <= 150]
+    # No education section: only short, non-sentence lines naming a degree
+    return [line for lines in sections.values() for line in lines
+            if _DEGREE_RE.search(line) and len(line) <= 100 and not line.endswith(".")]
+
+
+def _find_job_titles(experience_lines: List[str]) -> List[str]:
+    titles: Dict[str, None] = {}
+    for line in experience_lines:
+        if len(line) > 80 or line.startswith(("•", "-", "*", "◦")) or line.endswith("."):
+            continue
+        if _TITLE_RE.search(line):
+            # "Software Engineer at Acme | 2021 - 2023" -> "Software Engineer"
+            title = re.split(r"\s+(?:at|@)\s+|\s*[|,–—(]\s*|\s+-\s+", line)[0].strip()
+            if title and _TITLE_RE.search(title) and not DATE_RANGE_RE.search(title):
+                titles.setdefault(title)
+    return list(titles)
+
+
+def _stated_experience_years(text: str) -> Optional[float]:
+    """
+    Years of experience when the resume states them ("5+ years of experience").
+
+    Date ranges are not summed: they are only accurate to the year and
+    "Present" entries overcount, so without a statement the LLM decides.
+    """
+    stated = YEARS_RE.search(text)
+    return float(stated.group(1)) if stated else None
+
+
+def extract_local_metadata(text: str) -> Dict[str, Any]:
+    """
+    Extract the metadata fields that rules can find reliably.
+
+    Args:
+        text (str): Resume text
+
+    Returns:
+        Dict[str, Any]: A subset of METADATA_FIELDS; fields that could not be
+        determined confidently are left out for the LLM to fill
+    """
+    sections = split_sections(text)
+    metadata: Dict[str, Any] = {}
+
+    name = _find_name(sections["header"])
+    if name:
+        metadata["name"] = name
+
+    email = EMAIL_RE.search(text)
+    if email:
+        metadata["email"] = email.group(0)
+
+    phone = _find_phone(text)
+    if phone:
+        metadata["phone"] = phone
+
+    skills = _find_skills(text, sections.get("skills", []))
+    if len(skills) >= MIN_LOCAL_SKILLS:
+        metadata["skills"] = skills
+
+    education = _find_education(sections)
+    if education:
+        metadata["education"] = education
+
+    job_titles = _find_job_titles(sections.get("experience", []))
+    if job_titles:
+        metadata["job_titles"] = job_titles
+
+    experience_years = _stated_experience_years(text)
+    if experience_years is not None:
+        metadata["experience_years"] = experience_years
+
+    return metadata
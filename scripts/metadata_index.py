@@ -0,0 +1,304 @@
+"""
+Precompiled metadata features for scoring the whole candidate pool at once.
+
+Skills and job titles are interned into a shared vocabulary and stored as
+(row, term) pairs, alongside per-row experience and degree counts. A project
+description is matched against the vocabulary once with an Aho-Corasick
+automaton, after which every resume's metadata score is computed with a
+few NumPy operations instead of per-candidate substring loops.
+
+The same features back hard-constraint filtering: a sorted experience index,
+per-row degree levels and an inverted skill index produce the set of rows a
+filtered search may return.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+# Degree levels for filtering; a resume's level is the highest one it mentions
+DEGREE_LEVELS = {"bachelor": 1, "master": 2, "phd": 3}
+DEGREE_KEYWORDS = {
+    3: ("phd", "ph.d", "doctor"),
+    2: ("master", "m.sc", "msc", "m.tech", "mtech", "mba", "m.s."),
+    1: ("bachelor", "b.sc", "bsc", "b.tech", "btech", "b.e.", "b.s."),
+}
+
+
+def degree_level(degree: str) -> int:
+    """Map a degree description to a DEGREE_LEVELS value (0 if unrecognized)."""
+    degree = degree.lower()
+    for level in sorted(DEGREE_KEYWORDS, reverse=True):
+        if any(keyword in degree for keyword in DEGREE_KEYWORDS[level]):
+            return level
+    return 0
+
+
+def normalize_skill(skill: str) -> str:
+    """Key used by the inverted skill index."""
+    return " ".join(skill.lower().split())
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher reporting which patterns occur in a text."""
+
+    def __init__(self, patterns: List[str]):
+        """
+        Args:
+            patterns (List[str]): Patterns to match; pattern IDs are list positions
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(pattern_id)
+
+        # Breadth-first pass to fill failure links and merge outputs along them
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[int]:
+        """Return the IDs of all patterns occurring anywhere in text."""
+        goto, fail = self._goto, self._fail
+        visited = {0}
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            visited.add(state)
+
+        found: Set[int] = set()
+        for state in visited:
+            found.update(self._out[state])
+        return found
+
+
+class MetadataIndex:
+    """
+    Per-resume metadata features keyed by store row, scored in bulk.
+
+    Scores match ResumeSelector.calculate_metadata_similarity (up to float
+    rounding): skill and title terms are lowercased but otherwise kept
+    verbatim, so substring semantics and duplicate entries are preserved.
+    """
+
+    def __init__(self):
+        self._vocab: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._skill_rows: List[int] = []
+        self._skill_terms: List[int] = []
+        self._title_rows: List[int] = []
+        self._title_terms: List[int] = []
+        self._experience: List[float] = []
+        self._phd: List[int] = []
+        self._master: List[int] = []
+        self._both: List[int] = []
+        self._degree_level: List[int] = []
+        self._alive: List[bool] = []
+        self._skill_postings: Dict[str, List[int]] = {}
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._matcher: Optional[AhoCorasick] = None
+
+    def add(self, row: int, skills: Iterable[str], experience_years: float, education: Iterable[str],
+            job_titles: Iterable[str]):
+        """
+        Store the features of one resume.
+
+        Args:
+            row (int): Store row (FAISS) ID of the resume
+            skills (Iterable[str]): Skill names
+            experience_years (float): Years of experience
+            education (Iterable[str]): Degree descriptions
+            job_titles (Iterable[str]): Job titles
+        """
+        while len(self._alive) <= row:
+            self._experience.append(0.0)
+            self._phd.append(0)
+            self._master.append(0)
+            self._both.append(0)
+            self._degree_level.append(0)
+            self._alive.append(False)
+
+        for skill in skills:
+            self._skill_rows.append(row)
+            self._skill_terms.append(self._intern(skill.lower()))
+            postings = self._skill_postings.setdefault(normalize_skill(skill), [])
+            if not postings or postings[-1] != row:
+                postings.append(row)
+        for title in job_titles:
+            self._title_rows.append(row)
+            self._title_terms.append(self._intern(title.lower()))
+
+        degrees = [degree.lower() for degree in education]
+        self._experience[row] = float(experience_years)
+        self._phd[row] = sum(1 for degree in degrees if "phd" in degree)
+        self._master[row] = sum(1 for degree in degrees if "master" in degree)
+        self._both[row] = sum(1 for degree in degrees if "phd" in degree and "master" in degree)
+        self._degree_level[row] = max((degree_level(degree) for degree in degrees), default=0)
+        self._alive[row] = True
+        self._arrays = None
+
+    def remove(self, row: int):
+        """Drop a resume's features; its term pairs stay but are masked out."""
+        if 0 <= row < len(self._alive):
+            self._alive[row] = False
+            self._arrays = None
+
+    def clear(self):
+        self.__init__()
+
+    def _intern(self, term: str) -> int:
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._vocab[term] = term_id
+            self._terms.append(term)
+            self._matcher = None
+        return term_id
+
+    def _compiled(self) -> Dict[str, np.ndarray]:
+        """NumPy views of the features, rebuilt after any change."""
+        if self._arrays is None:
+            experience = np.array(self._experience, dtype=np.float64)
+            experience_order = np.argsort(experience, kind="stable")
+            self._arrays = {
+                "skill_rows": np.array(self._skill_rows, dtype=np.int64),
+                "skill_terms": np.array(self._skill_terms, dtype=np.int64),
+                "title_rows": np.array(self._title_rows, dtype=np.int64),
+                "title_terms": np.array(self._title_terms, dtype=np.int64),
+                "experience": experience,
+                "experience_order": experience_order,
+                "experience_sorted": experience[experience_order],
+                "phd": np.array(self._phd, dtype=np.float64),
+                "master": np.array(self._master, dtype=np.float64),
+                "both": np.array(self._both, dtype=np.float64),
+                "degree_level": np.array(self._degree_level, dtype=np.int8),
+                "alive": np.array(self._alive, dtype=bool),
+            }
+        return self._arrays
+
+    def matching_terms(self, project_description: str) -> np.ndarray:
+        """Boolean mask over the vocabulary of terms occurring in the description."""
+        if self._matcher is None:
+            self._matcher = AhoCorasick(self._terms)
+        present = np.zeros(len(self._terms), dtype=bool)
+        found = self._matcher.find(project_description.lower())
+        if found:
+            present[list(found)] = True
+        if "" in self._vocab:
+            present[self._vocab[""]] = True
+        return present
+
+    def scores(self, project_description: str) -> np.ndarray:
+        """
+        Metadata similarity of every row to a project description.
+
+        Args:
+            project_description (str): Project description
+
+        Returns:
+            np.ndarray: float64 scores in [0, 1] indexed by row (0 for removed rows)
+        """
+        arrays = self._compiled()
+        rows = len(arrays["alive"])
+        if rows == 0:
+            return np.zeros(0, dtype=np.float64)
+
+        description = project_description.lower()
+        present = self.matching_terms(description)
+
+        # Skills matching
+        skill_matches = np.bincount(arrays["skill_rows"], weights=present[arrays["skill_terms"]], minlength=rows)
+        score = np.minimum(0.4, skill_matches * 0.05)
+
+        # Experience level matching
+        if "senior" in description:
+            score += np.where(arrays["experience"] >= 5, 0.2, 0.0)
+        elif "junior" in description:
+            score += np.where(arrays["experience"] < 5, 0.2, 0.0)
+
+        # Education matching
+        wants_phd, wants_master = "phd" in description, "master" in description
+        if wants_phd and wants_master:
+            score += 0.1 * (arrays["phd"] + arrays["master"] - arrays["both"])
+        elif wants_phd:
+            score += 0.1 * arrays["phd"]
+        elif wants_master:
+            score += 0.1 * arrays["master"]
+
+        # Job title matching
+        title_matches = np.bincount(arrays["title_rows"], weights=present[arrays["title_terms"]], minlength=rows)
+        score += title_matches * 0.05
+
+        score = np.minimum(1.0, score)
+        score[~arrays["alive"]] = 0.0
+        return score
+
+    def allowed_rows(self, min_experience_years: Optional[float] = None, min_degree: Optional[str] = None,
+                     required_skills: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Rows satisfying every given hard constraint.
+
+        Skill postings are intersected first (smallest first), then narrowed
+        by the sorted experience index and the degree levels.
+
+        Args:
+            min_experience_years (Optional[float]): Minimum years of experience
+            min_degree (Optional[str]): Minimum degree level ("bachelor", "master" or "phd")
+            required_skills (Optional[Iterable[str]]): Skills every resume must list (case-insensitive)
+
+        Returns:
+            np.ndarray: Sorted int64 row IDs of live resumes
+
+        Raises:
+            ValueError: If min_degree is not a known degree level
+        """
+        arrays = self._compiled()
+        rows: Optional[np.ndarray] = None
+
+        # Inverted skill index
+        postings = [self._skill_postings.get(normalize_skill(skill), []) for skill in required_skills or []]
+        for posting in sorted(postings, key=len):
+            posting = np.unique(np.array(posting, dtype=np.int64))
+            rows = posting if rows is None else np.intersect1d(rows, posting, assume_unique=True)
+            if not len(rows):
+                return rows
+
+        # Sorted experience index
+        if min_experience_years is not None:
+            start = np.searchsorted(arrays["experience_sorted"], float(min_experience_years), side="left")
+            experienced = np.sort(arrays["experience_order"][start:])
+            rows = experienced if rows is None else np.intersect1d(rows, experienced, assume_unique=True)
+
+        if rows is None:
+            rows = np.arange(len(arrays["alive"]), dtype=np.int64)
+
+        keep = arrays["alive"][rows]
+        if min_degree is not None:
+            level = DEGREE_LEVELS.get(str(min_degree).lower())
+            if level is None:
+                raise ValueError(f"Unknown degree level: {min_degree}")
+            keep &= arrays["degree_level"][rows] >= level
+
+        return rows[keep]
@@ -0,0 +1,205 @@
+"""
+PDF text extraction helpers for the resume selector.
+
+These are plain module-level functions (rather than ResumeSelector methods)
+so they can be sent to worker processes without pickling the selector, its
+embedding model or its Mistral client.
+"""
+import os
+import sys
+import logging
+import time
+import multiprocessing
+import multiprocessing.connection
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from lazy_imports import LazyModule
+
+pdfplumber = LazyModule("pdfplumber")
+
+
+class PdfExtraction(NamedTuple):
+    """Extracted text of one PDF with the work it took."""
+    text: str
+    pages: int
+    seconds: float
+
+
+def iter_pdf_pages(pdf_path: str, settings: Dict[str, Any]) -> Iterator[str]:
+    """
+    Extract a PDF's text one page at a time.
+
+    Layout analysis runs only for pages that are actually consumed, so a
+    caller that stops iterating early skips the remaining pages.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        settings (Dict[str, Any]): Keyword arguments for page.extract_text
+
+    Yields:
+        str: Text of each page that has any
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text(**settings)
+            # Drop the page's parsed layout objects; they are not needed again
+            page.flush_cache()
+            if page_text:
+                yield page_text
+
+
+def extract_pdf_text(pdf_path: str, settings: Dict[str, Any], max_chars: Optional[int] = None) -> str:
+    """
+    Extract a PDF's text, stopping once a character budget is reached.
+
+    The result is exactly the first max_chars characters of the full text,
+    but pages past the budget are never parsed.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        settings (Dict[str, Any]): Keyword arguments for page.extract_text
+        max_chars (Optional[int]): Character budget, or None to extract every page
+
+    Returns:
+        str: Extracted text content, or "" if the file could not be parsed
+    """
+    return extract_pdf(pdf_path, settings, max_chars).text
+
+
+def extract_pdf(pdf_path: str, settings: Dict[str, Any], max_chars: Optional[int] = None) -> PdfExtraction:
+    """extract_pdf_text, also reporting the pages parsed and the time taken."""
+    start = time.perf_counter()
+    text = ""
+    pages = 0
+    try:
+        for page_text in iter_pdf_pages(pdf_path, settings):
+            pages += 1
+            text += page_text + "\n\n"
+            if max_chars is not None and len(text.strip()) >= max_chars:
+                break
+    except Exception as e:
+        print(f"❌ Error extracting text from {pdf_path}: {e}", file=sys.stderr)
+
+    text = text.strip()
+    if max_chars is not None:
+        text = text[:max_chars]
+    return PdfExtraction(text, pages, time.perf_counter() - start)
+
+
+def _extraction_worker(conn, settings: Dict[str, Any], max_chars: Optional[int]):
+    """Worker process loop: receive (index, path) pairs, send back (index, PdfExtraction); None stops it."""
+    # Workers start with default logging; silence pdfminer like the parent does
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        index, path = task
+        conn.send((index, extract_pdf(path, settings, max_chars)))
+
+
+class _Worker:
+    """One extraction process and the parent's end of its pipe."""
+
+    def __init__(self, settings: Dict[str, Any], max_chars: Optional[int]):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_extraction_worker, args=(child_conn, settings, max_chars),
+                                               daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task: Optional[int] = None
+        self.started = 0.0
+
+    def assign(self, index: int, path: str):
+        self.conn.send((index, path))
+        self.task = index
+        self.started = time.monotonic()
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+def extract_pdf_texts_parallel(pdf_paths: List[str], settings: Dict[str, Any], workers: Optional[int] = None,
+                               timeout: Optional[float] = None,
+                               max_chars: Optional[int] = None) -> List[PdfExtraction]:
+    """
+    Extract text from many PDFs using worker processes.
+
+    Results are returned in input order. Each file gets `timeout` seconds
+    from the moment a worker starts on it; a worker that overruns is killed
+    and replaced, so one malformed PDF costs one timeout and never holds a
+    worker for the rest of the batch. A file that times out or raises (or
+    crashes its worker) yields empty text.
+
+    Args:
+        pdf_paths (List[str]): Paths to the PDF files
+        settings (Dict[str, Any]): Keyword arguments for page.extract_text
+        workers (Optional[int]): Number of worker processes (defaults to CPU count)
+        timeout (Optional[float]): Per-file timeout in seconds, or None to wait indefinitely
+        max_chars (Optional[int]): Per-file character budget (see extract_pdf_text)
+
+    Returns:
+        List[PdfExtraction]: Extracted text (with pages parsed and seconds) per input path
+    """
+    if not pdf_paths:
+        return []
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pdf_paths)))
+    results: List[Optional[PdfExtraction]] = [None] * len(pdf_paths)
+    queue = list(range(len(pdf_paths)))[::-1]
+    pool = [_Worker(settings, max_chars) for _ in range(workers)]
+
+    def fail(slot: int, result: PdfExtraction):
+        """Record a failed file and give its slot a fresh worker."""
+        worker = pool[slot]
+        results[worker.task] = result
+        worker.kill()
+        pool[slot] = _Worker(settings, max_chars)
+
+    try:
+        while True:
+            for worker in pool:
+                if worker.task is None and queue:
+                    index = queue.pop()
+                    worker.assign(index, pdf_paths[index])
+            busy = [slot for slot, worker in enumerate(pool) if worker.task is not None]
+            if not busy:
+                break
+
+            wait_for = None
+            if timeout is not None:
+                wait_for = max(0.0, min(pool[slot].started for slot in busy) + timeout - time.monotonic())
+            ready = multiprocessing.connection.wait([pool[slot].conn for slot in busy], timeout=wait_for)
+
+            for slot in busy:
+                worker = pool[slot]
+                if worker.conn in ready:
+                    try:
+                        index, result = worker.conn.recv()
+                    except (EOFError, OSError):
+                        print(f"❌ Worker crashed extracting text from {pdf_paths[worker.task]}", file=sys.stderr)
+                        fail(slot, PdfExtraction("", 0, time.monotonic() - worker.started))
+                        continue
+                    results[index] = result
+                    worker.task = None
+                elif timeout is not None and time.monotonic() - worker.started >= timeout:
+                    print(f"❌ Timed out extracting text from {pdf_paths[worker.task]}", file=sys.stderr)
+                    fail(slot, PdfExtraction("", 0, timeout))
+    finally:
+        for worker in pool:
+            worker.stop()
+
+    return [result or PdfExtraction("", 0, 0.0) for result in results]
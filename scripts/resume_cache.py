@@ -0,0 +1,305 @@
+"""
+On-disk caches used by the resume selector.
+
+All caches are SQLite files so several processes (the long-lived worker,
+spawned shortlist scripts, extraction pool workers) can share them safely;
+SQLite's own locking serializes writers. Values are zlib-compressed and the
+total stored size is bounded with least-recently-used eviction.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """Return the hex SHA-256 digest of a UTF-8 string."""
+    return hash_bytes(text.encode("utf-8"))
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(settings: Dict[str, Any]) -> str:
+    """Return a short stable hash of a settings dict, for use in cache keys."""
+    return hash_text(json.dumps(settings, sort_keys=True))[:16]
+
+
+class SqliteLRUCache:
+    """
+    A size-bounded key/value cache stored in a single SQLite file.
+
+    Each operation opens its own short-lived connection, which keeps the
+    cache safe to use from forked worker processes and from several
+    threads without sharing connection objects.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (and create if needed) a cache database.
+
+        Args:
+            db_path (str): Path to the SQLite file
+            max_bytes (int): Upper bound on the total compressed value size
+        """
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Return the raw value for a key, or None on a miss."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return zlib.decompress(row[0])
+
+    def put_bytes(self, key: str, value: bytes):
+        """Store a raw value and evict least-recently-used entries if over budget."""
+        blob = zlib.compress(value)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time())
+            )
+            conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM ("
+                "  SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS running FROM entries"
+                " ) WHERE running > ?)",
+                (self.max_bytes,)
+            )
+
+    def delete(self, key: str):
+        """Remove a single key if present."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str):
+        """Remove every key starting with prefix (prefixes are hex hashes, so no LIKE escaping is needed)."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key LIKE ?", (prefix + "%",))
+
+    def clear(self):
+        """Remove every entry."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class PdfTextCache(SqliteLRUCache):
+    """Extracted PDF text keyed by file content hash and extraction settings."""
+
+    @staticmethod
+    def make_key(content_hash: str, settings: Dict[str, Any]) -> str:
+        return f"{content_hash}:{settings_fingerprint(settings)}"
+
+    def get(self, content_hash: str, settings: Dict[str, Any]) -> Optional[str]:
+        value = self.get_bytes(self.make_key(content_hash, settings))
+        return value.decode("utf-8") if value is not None else None
+
+    def put(self, content_hash: str, settings: Dict[str, Any], text: str):
+        self.put_bytes(self.make_key(content_hash, settings), text.encode("utf-8"))
+
+
+class MetadataCache(SqliteLRUCache):
+    """LLM-extracted resume metadata keyed by text hash, prompt version and model name."""
+
+    @staticmethod
+    def make_key(text_hash: str, prompt_version: int, model: str) -> str:
+        return f"{text_hash}:v{prompt_version}:{model}"
+
+    def get(self, text_hash: str, prompt_version: int, model: str) -> Optional[Dict[str, Any]]:
+        value = self.get_bytes(self.make_key(text_hash, prompt_version, model))
+        return json.loads(value) if value is not None else None
+
+    def put(self, text_hash: str, prompt_version: int, model: str, metadata: Dict[str, Any]):
+        self.put_bytes(self.make_key(text_hash, prompt_version, model), json.dumps(metadata).encode("utf-8"))
+
+    def invalidate(self, text_hash: Optional[str] = None):
+        """Drop cached metadata for one resume text, or for every resume if text_hash is None."""
+        if text_hash is None:
+            self.clear()
+        else:
+            self.delete_prefix(f"{text_hash}:")
+
+
+class SummaryCache(SqliteLRUCache):
+    """LLM candidate summaries keyed by project description hash, resume hash, prompt version and model name."""
+
+    @staticmethod
+    def make_key(project_hash: str, resume_hash: str, prompt_version: int, model: str) -> str:
+        return f"{project_hash}:{resume_hash}:v{prompt_version}:{model}"
+
+    def get(self, project_hash: str, resume_hash: str, prompt_version: int, model: str) -> Optional[Dict[str, Any]]:
+        value = self.get_bytes(self.make_key(project_hash, resume_hash, prompt_version, model))
+        return json.loads(value) if value is not None else None
+
+    def put(self, project_hash: str, resume_hash: str, prompt_version: int, model: str, summary: Dict[str, Any]):
+        self.put_bytes(self.make_key(project_hash, resume_hash, prompt_version, model),
+                       json.dumps(summary).encode("utf-8"))
+
+    def invalidate(self, project_hash: Optional[str] = None):
+        """Drop cached summaries for one project description, or for every project if project_hash is None."""
+        if project_hash is None:
+            self.clear()
+        else:
+            self.delete_prefix(f"{project_hash}:")
+
+
+class EmbeddingStore:
+    """
+    Float32 embedding vectors for one model, keyed by text hash.
+
+    Vectors live in an append-only raw float32 file that is read through a
+    memory map; a SQLite table maps each text hash to its row. New rows are
+    allocated inside an IMMEDIATE transaction, so concurrent writers never
+    hand out the same row, and a row is only committed after its vector has
+    been written.
+    """
+
+    def __init__(self, directory: str, model_name: str, dim: int):
+        """
+        Open (and create if needed) the store for a model.
+
+        Args:
+            directory (str): Directory holding the store files
+            model_name (str): Embedding model name; each model gets its own files
+            dim (int): Embedding dimension
+        """
+        self.model_name = model_name
+        self.dim = dim
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{hash_text(model_name)[:12]}_{dim}"
+        self.vectors_path = str(directory / f"{stem}.f32")
+        self.db_path = str(directory / f"{stem}.sqlite")
+
+        Path(self.vectors_path).touch(exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS info (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO info (name, value) VALUES ('model_name', ?)", (model_name,))
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(text_hash: str, model_name: str) -> str:
+        return f"{text_hash}:{model_name}"
+
+    def _lookup_rows(self, conn, keys: List[str]) -> Dict[str, int]:
+        rows: Dict[str, int] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, row in conn.execute(f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", chunk):
+                rows[key] = row
+        return rows
+
+    def get_many(self, text_hashes: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up vectors for several texts.
+
+        Args:
+            text_hashes (List[str]): Hashes of the embedded texts
+
+        Returns:
+            Tuple[np.ndarray, List[int]]: (n, dim) float32 array with found rows filled
+            in, and the positions in text_hashes that were not in the store
+        """
+        keys = [self.make_key(h, self.model_name) for h in text_hashes]
+        result = np.zeros((len(keys), self.dim), dtype="float32")
+        with self._connect() as conn:
+            rows = self._lookup_rows(conn, keys)
+
+        missing = [i for i, key in enumerate(keys) if key not in rows]
+        if len(missing) < len(keys):
+            vectors = np.memmap(self.vectors_path, dtype="float32", mode="r").reshape(-1, self.dim)
+            for i, key in enumerate(keys):
+                if key in rows:
+                    result[i] = vectors[rows[key]]
+            del vectors
+        return result, missing
+
+    def put_many(self, text_hashes: List[str], embeddings: np.ndarray):
+        """
+        Append vectors for texts that are not yet stored.
+
+        Args:
+            text_hashes (List[str]): Hashes of the embedded texts
+            embeddings (np.ndarray): (n, dim) vectors in the same order
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+        keys = [self.make_key(h, self.model_name) for h in text_hashes]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._lookup_rows(conn, keys)
+                next_row = conn.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM vectors").fetchone()[0]
+                new_rows = []
+                with open(self.vectors_path, "r+b") as f:
+                    for key, vector in zip(keys, embeddings):
+                        if key in existing:
+                            continue
+                        f.seek(next_row * self.dim * 4)
+                        f.write(vector.tobytes())
+                        new_rows.append((key, next_row))
+                        existing[key] = next_row
+                        next_row += 1
+                conn.executemany("INSERT INTO vectors (key, row) VALUES (?, ?)", new_rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
@@ -2,15 +2,42 @@
 import os
 import sys
 import json
+import asyncio
+import time
 import uuid
+import shutil
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import logging
 import numpy as np
-import faiss
-import pdfplumber
-from sentence_transformers import SentenceTransformer
-from mistralai import Mistral
+from lazy_imports import LazyModule, preload
+from resume_cache import PdfTextCache, MetadataCache, SummaryCache, EmbeddingStore, hash_file, hash_text
+from pdf_extraction import PdfExtraction, extract_pdf, extract_pdf_texts_parallel, iter_pdf_pages
+from llm_client import TokenBucket, call_with_retries
+from resume_store import ResumeStore, ResumeRecord
+from metadata_index import MetadataIndex
+from file_lock import file_lock
+from local_metadata import METADATA_FIELDS, extract_local_metadata
+from embedding_backends import EMBEDDING_BACKENDS, EmbeddingBackend, create_embedding_backend, embedding_cache_key
+from telemetry import Telemetry
+from vector_index import (ANN_THRESHOLD, HNSW_EF_SEARCH, INDEX_TYPES, IVF_NPROBE, choose_index_type, create_index,
+                          index_kind, ivf_list_count, search_parameters, supports_removal)
+
+# Heavy dependencies are imported on first use (see ResumeSelector modes)
+faiss = LazyModule("faiss")
+
+# Shared on-disk cache location; pass cache_dir=None to ResumeSelector to disable caching
+DEFAULT_CACHE_DIR = os.environ.get(
+    "RESUME_SELECTOR_CACHE_DIR",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "resume-selector")
+)
+
+# "pytorch", "onnx" (int8-quantized ONNX Runtime) or "hashing" (offline tests); see embedding_backends
+DEFAULT_EMBEDDING_BACKEND = os.environ.get("RESUME_SELECTOR_EMBEDDING_BACKEND", "pytorch")
+
+
 class ResumeSelector:
     """
     A class for processing resumes and finding the best candidates for projects.
@@ -20,9 +47,83 @@ class ResumeSelector:
     - Resume metadata extraction using LLM
     - Vector embedding and similarity search
     - Candidate ranking and summary generation
+
+    Capabilities are enabled by mode, each including the previous one:
+    "extract" (PDF text only), "metadata" (adds LLM metadata extraction) and
+    "search" (adds embeddings, indexing, search and summaries). Heavy
+    dependencies and the embedding model are loaded on first use, not at
+    import or construction time.
     """
 
-    def __init__(self, api_key: str, embedding_model: str = "BAAI/bge-base-en-v1.5", quiet: bool = False):
+    MODES = ("extract", "metadata", "search")
+
+    # pdfplumber settings; part of the text cache key so changing them invalidates cached text
+    PDF_EXTRACTION_SETTINGS = {
+        "x_tolerance": 1,
+        "y_tolerance": 1,
+        "keep_blank_chars": False,
+        "use_text_flow": True
+    }
+
+    # Characters of resume text sent to the metadata prompt; the longest prefix any stage reads,
+    # so it is also the default extraction budget
+    METADATA_TEXT_CHARS = 4000
+
+    # Shorter prefix sent when the LLM only has to write the summary
+    SUMMARY_TEXT_CHARS = 2000
+
+    # Chat model used for metadata and summaries
+    LLM_MODEL = "mistral-small-latest"
+
+    # Bump whenever the metadata prompt or the local rules change so cached metadata is not reused
+    METADATA_PROMPT_VERSION = 4
+
+    # Cache version of the all-fields prompt used with local_metadata=False
+    LLM_ONLY_METADATA_PROMPT_VERSION = 1
+
+    # Estimated prompt tokens (about 4 characters each) packed into one batched metadata request
+    METADATA_BATCH_TOKENS = 8000
+
+    # Most resumes per batched metadata request; bounds the length of the JSON answer
+    METADATA_BATCH_MAX_RESUMES = 8
+
+    # Bump whenever the candidate summary prompt changes so cached summaries are not reused
+    SUMMARY_PROMPT_VERSION = 1
+
+    # Bump whenever the snapshot layout changes so old snapshots are rebuilt
+    SNAPSHOT_VERSION = 4
+
+    # Snapshot versions kept besides the current one, for readers still loading an older one
+    SNAPSHOT_KEEP_VERSIONS = 2
+
+    # File in a snapshot directory naming its current version directory
+    SNAPSHOT_POINTER = "CURRENT"
+
+    # Characters of resume text included in search results (and summary prompts) by default
+    RESULT_EXCERPT_CHARS = 1500
+
+    # Candidates fetched from an approximate index for metadata reranking (at least top_k * 2)
+    ANN_CANDIDATE_POOL = 100
+
+    # Filtered searches allowing at most this many resumes score them exactly, even on an approximate index
+    EXACT_SUBSET_SEARCH_MAX = 4096
+
+    # Removed resumes an approximate index may keep (as a fraction of its vectors) before it is rebuilt
+    TOMBSTONE_REBUILD_FRACTION = 0.1
+
+    # Hard constraints accepted by search_resumes(filters=...)
+    SEARCH_FILTERS = ("min_experience_years", "min_degree", "required_skills")
+
+    def __init__(self, api_key: str, embedding_model: str = "BAAI/bge-base-en-v1.5", quiet: bool = False,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, extraction_workers: int = 1,
+                 extraction_timeout: Optional[float] = 120.0, llm_concurrency: int = 8,
+                 llm_requests_per_second: float = 5.0, query_cache_size: int = 256, mode: str = "search",
+                 embedding_backend: str = DEFAULT_EMBEDDING_BACKEND,
+                 text_char_budget: Optional[int] = METADATA_TEXT_CHARS, llm_client: Any = None,
+                 telemetry: Optional[Telemetry] = None, local_metadata: bool = True,
+                 metadata_batch_tokens: Optional[int] = METADATA_BATCH_TOKENS, index_type: str = "auto",
+                 ann_threshold: int = ANN_THRESHOLD, hnsw_ef_search: int = HNSW_EF_SEARCH,
+                 ivf_nprobe: int = IVF_NPROBE):
         """
         Initialize the resume selector with a Mistral API key.
 
@@ -30,118 +131,606 @@ class ResumeSelector:
             api_key (str): Mistral API key for LLM operations
             embedding_model (str): HuggingFace embedding model name
             quiet (bool): If True, suppress all console output
+            cache_dir (Optional[str]): Directory for on-disk caches, or None to disable caching
+            extraction_workers (int): Number of processes used to parse PDFs; 1 parses in-process
+            extraction_timeout (Optional[float]): Seconds a PDF may take in parallel extraction, counted
+                from when a worker starts on it; the worker is then replaced and the file yields ""
+            llm_concurrency (int): Maximum concurrent Mistral requests in batch operations
+            llm_requests_per_second (float): Sustained Mistral request rate in batch operations
+            query_cache_size (int): Number of project-description embeddings kept in memory
+            mode (str): "extract", "metadata" or "search" (see class docstring)
+            embedding_backend (str): "pytorch", "onnx" or "hashing" (see embedding_backends)
+            text_char_budget (Optional[int]): Stop parsing a PDF once this many characters are
+                extracted; None extracts (and stores) every page
+            llm_client (Any): Mistral-compatible client to use instead of creating one from
+                api_key (e.g. an offline fake for benchmarks)
+            telemetry (Optional[Telemetry]): Where timing spans and counters go; configured from
+                the environment when omitted (see telemetry.Telemetry.from_env)
+            local_metadata (bool): Read contact details, skills, education, job titles and
+                experience with rules first (see local_metadata) and ask the LLM only for the
+                fields still missing; False sends every field to the LLM
+            metadata_batch_tokens (Optional[int]): Prompt token budget for packing several
+                resumes into one metadata request in extract_metadata_batch; None sends one
+                request per resume
+            index_type (str): "flat" (exact), "hnsw", "ivf" or "auto" (flat below ann_threshold
+                resumes, hnsw above it); see vector_index
+            ann_threshold (int): Index size at which "auto" switches to approximate search
+            hnsw_ef_search (int): HNSW search beam width; higher is more accurate and slower
+            ivf_nprobe (int): IVF lists scanned per query; higher is more accurate and slower
         """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}, got {mode!r}")
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {', '.join(INDEX_TYPES)}, got {index_type!r}")
+        if embedding_backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"embedding_backend must be one of {', '.join(EMBEDDING_BACKENDS)}, "
+                             f"got {embedding_backend!r}")
+        self.mode = mode
+
         # Suppress PDF extraction warnings
         logging.getLogger("pdfminer").setLevel(logging.ERROR)
 
         self.quiet = quiet
-
-        # Initialize Mistral client
-        self.mistral_client = Mistral(api_key=api_key)
-
-        # Initialize embedding model
-        if not self.quiet:
-            print("Loading embedding model...")
-        self.embedding_model = SentenceTransformer(embedding_model)
-        self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
-
-        # Initialize storage
+        self.telemetry = telemetry or Telemetry.from_env()
+        self.extraction_workers = extraction_workers
+        self.extraction_timeout = extraction_timeout
+        self.text_char_budget = text_char_budget
+        # Text cache key settings; budgeted text is cached separately from full text
+        self._text_cache_settings = dict(self.PDF_EXTRACTION_SETTINGS)
+        if text_char_budget is not None:
+            self._text_cache_settings["max_chars"] = text_char_budget
+        self.local_metadata = local_metadata
+        self._metadata_prompt_version = (self.METADATA_PROMPT_VERSION if local_metadata
+                                         else self.LLM_ONLY_METADATA_PROMPT_VERSION)
+        self.metadata_batch_tokens = metadata_batch_tokens
+        self.llm_concurrency = llm_concurrency
+        self.llm_requests_per_second = llm_requests_per_second
+        self._event_loop = None
+
+        # LRU cache of query embeddings keyed by normalized project description
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        # Mistral client and embedding backend are created on first use
+        self._api_key = api_key
+        self._mistral_client = llm_client
+        self.embedding_model_name = embedding_model
+        self.embedding_backend_name = embedding_backend
+        # Identifies the vectors produced; keys the embedding store and snapshots
+        self.embedding_key = embedding_cache_key(embedding_backend, embedding_model)
+        self._embedding_backend: Optional[EmbeddingBackend] = None
+        self._embedding_dim: Optional[int] = None
+
+        # Initialize storage; store row IDs are the FAISS IDs of the ID-mapped index
         self.index = None
-        self.resumes: List[str] = []
-        self.file_paths: List[str] = []
-        self.resume_metadata: Dict[str, Any] = {}
+        self.index_type = index_type
+        self.ann_threshold = ann_threshold
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivf_nprobe = ivf_nprobe
+        # Rows removed from the store but still in an index that cannot delete vectors
+        self._index_tombstones: set = set()
+        # Full texts live in a memory-mapped blob next to the other caches
+        self.store = ResumeStore(text_dir=str(Path(cache_dir) / "texts") if cache_dir else None)
+        self.metadata_index = MetadataIndex()
+
+        # Shared-index mode: resolved folder path -> {row ID: that folder's copy of the PDF}
+        self.folder_members: Dict[str, Dict[int, str]] = {}
+        self._index_is_mmapped = False
+        # Snapshot version directory the in-memory state was last loaded from or saved to
+        self._snapshot_version: Optional[Path] = None
+
+        # Initialize on-disk caches
+        self.cache_dir = cache_dir
+        self.text_cache = None
+        self.metadata_cache = None
+        self.summary_cache = None
+        self._embedding_store = None
+        if cache_dir:
+            self.text_cache = PdfTextCache(Path(cache_dir) / "pdf_text.sqlite")
+            self.metadata_cache = MetadataCache(Path(cache_dir) / "metadata.sqlite", max_bytes=64 * 1024 * 1024)
+            self.summary_cache = SummaryCache(Path(cache_dir) / "summaries.sqlite", max_bytes=32 * 1024 * 1024)
 
         if not self.quiet:
             print("✅ Resume Selector initialized!")
 
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    @property
+    def mistral_client(self):
+        """Mistral client, created on first use."""
+        if self._mistral_client is None:
+            self._require_mode("metadata", "Mistral calls")
+            from mistralai import Mistral
+            self._mistral_client = Mistral(api_key=self._api_key)
+        return self._mistral_client
+
+    @property
+    def embedding_backend(self) -> EmbeddingBackend:
+        """Embedding backend (and its model), loaded on first use."""
+        if self._embedding_backend is None:
+            self._require_mode("search", "Embedding")
+            if not self.quiet:
+                print(f"Loading embedding model ({self.embedding_backend_name})...")
+            model_dir = str(Path(self.cache_dir) / "onnx") if self.cache_dir else None
+            with self.telemetry.span("model_load", backend=self.embedding_backend_name):
+                self._embedding_backend = create_embedding_backend(self.embedding_backend_name,
+                                                                   self.embedding_model_name, model_dir=model_dir)
+            self._embedding_backend.telemetry = self.telemetry
+        return self._embedding_backend
+
+    @property
+    def embedding_dim(self) -> int:
+        """Embedding dimension, taken from the index when one is loaded so the model is not needed."""
+        if self._embedding_dim is None:
+            if self.index is not None:
+                self._embedding_dim = int(self.index.d)
+            else:
+                self._embedding_dim = self.embedding_backend.dim
+        return self._embedding_dim
+
+    @property
+    def embedding_store(self) -> Optional[EmbeddingStore]:
+        """On-disk document embedding store, opened on first use (None when caching is disabled)."""
+        if self._embedding_store is None and self.cache_dir:
+            self._embedding_store = EmbeddingStore(Path(self.cache_dir) / "embeddings", self.embedding_key,
+                                                   self.embedding_dim)
+        return self._embedding_store
+
+    def warm_up(self):
+        """Load everything this selector's mode needs now rather than on first use."""
+        from pdf_extraction import pdfplumber
+        preload(pdfplumber)
+        if self.MODES.index(self.mode) >= self.MODES.index("metadata"):
+            self.mistral_client
+        if self.mode == "search":
+            preload(faiss)
+            self.embedding_backend
+
+    def _require_mode(self, mode: str, capability: str):
+        """Raise if this selector's mode does not include `mode`."""
+        if self.MODES.index(self.mode) < self.MODES.index(mode):
+            raise RuntimeError(f"{capability} requires mode='{mode}' or above; this selector uses mode='{self.mode}'")
+
+    def extract_text_from_pdf(self, pdf_path: str, content_hash: Optional[str] = None) -> str:
         """
         Extract text content from a PDF file.
 
+        Text is served from the on-disk cache when a file with the same
+        content was already parsed with the same extraction settings. Only
+        the first text_char_budget characters are extracted unless the
+        selector was created with text_char_budget=None.
+
         Args:
             pdf_path (str): Path to the PDF file
+            content_hash (Optional[str]): SHA-256 of the file, if the caller already computed it
 
         Returns:
             str: Extracted text content
         """
-        text = ""
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text(
-                        x_tolerance=1,
-                        y_tolerance=1,
-                        keep_blank_chars=False,
-                        use_text_flow=True
-                    )
-                    if page_text:
-                        text += page_text + "\n\n"
-        except Exception as e:
-            print(f"❌ Error extracting text from {pdf_path}: {e}", file=sys.stderr)
+        return self.extract_texts_from_pdfs([pdf_path], [content_hash])[0]
+
+    def extract_texts_from_pdfs(self, pdf_paths: List[str],
+                                content_hashes: Optional[List[Optional[str]]] = None) -> List[str]:
+        """
+        Extract text content from several PDF files.
 
-        return text.strip()
+        Cached files are served from the text cache; the rest are parsed in a
+        process pool when extraction_workers > 1. Output order always matches
+        pdf_paths, and a file that fails or times out yields "".
+
+        Args:
+            pdf_paths (List[str]): Paths to the PDF files
+            content_hashes (Optional[List[Optional[str]]]): SHA-256 per file, if already computed
+
+        Returns:
+            List[str]: Extracted text content per file
+        """
+        with self.telemetry.span("extraction") as span:
+            span.set(files=len(pdf_paths))
+            return self._extract_texts(pdf_paths, content_hashes)
+
+    def _extract_texts(self, pdf_paths: List[str], content_hashes: Optional[List[Optional[str]]]) -> List[str]:
+        content_hashes = list(content_hashes or [None] * len(pdf_paths))
+        texts: List[Optional[str]] = [None] * len(pdf_paths)
+        misses = []
+
+        for i, pdf_path in enumerate(pdf_paths):
+            if self.text_cache is not None:
+                try:
+                    content_hashes[i] = content_hashes[i] or hash_file(pdf_path)
+                    texts[i] = self.text_cache.get(content_hashes[i], self._text_cache_settings)
+                except Exception as e:
+                    print(f"⚠️ Text cache unavailable for {pdf_path}: {e}", file=sys.stderr)
+            if texts[i] is None:
+                misses.append(i)
+        self._count_cache("pdf_text", len(pdf_paths) - len(misses), len(misses))
+
+        if self.extraction_workers > 1 and len(misses) > 1:
+            parsed = extract_pdf_texts_parallel(
+                [pdf_paths[i] for i in misses],
+                self.PDF_EXTRACTION_SETTINGS,
+                workers=self.extraction_workers,
+                timeout=self.extraction_timeout,
+                max_chars=self.text_char_budget
+            )
+        else:
+            parsed = [self._parse_pdf(pdf_paths[i]) for i in misses]
+
+        for i, (text, pages, seconds) in zip(misses, parsed):
+            self.telemetry.record_span("extract_pdf", seconds, {"file": Path(pdf_paths[i]).name, "pages": pages,
+                                                                "chars": len(text)})
+            self.telemetry.count("pdf_pages_parsed", pages)
+            texts[i] = text
+            if self.text_cache is not None and content_hashes[i] and text:
+                try:
+                    self.text_cache.put(content_hashes[i], self._text_cache_settings, text)
+                except Exception as e:
+                    print(f"⚠️ Could not cache text for {pdf_paths[i]}: {e}", file=sys.stderr)
+
+        return texts
+
+    def _parse_pdf(self, pdf_path: str) -> PdfExtraction:
+        """Run pdfplumber over a PDF's pages up to the character budget, bypassing the cache."""
+        return extract_pdf(pdf_path, self.PDF_EXTRACTION_SETTINGS, max_chars=self.text_char_budget)
+
+    def iter_pdf_pages(self, pdf_path: str) -> Iterator[str]:
+        """
+        Stream a PDF's text page by page (uncached, no budget); stop iterating to skip the remaining pages.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+
+        Yields:
+            str: Text of each page that has any
+        """
+        return iter_pdf_pages(pdf_path, self.PDF_EXTRACTION_SETTINGS)
 
     def extract_metadata(self, text: str) -> Dict[str, Any]:
         """
         Extract structured metadata from resume text using LLM.
 
+        Fields the rule-based extractor finds confidently are taken from it,
+        and the LLM is asked only for the rest (usually just the summary).
+        Results are cached by resume text hash, prompt version and model, so
+        a resume that was seen before does not cost another LLM call.
+
         Args:
             text (str): Resume text content
 
         Returns:
             Dict[str, Any]: Extracted metadata including name, skills, experience, etc.
         """
+        self._require_mode("metadata", "Metadata extraction")
+        cached = self._get_cached_metadata(text)
+        self._count_cache("metadata", int(cached is not None), int(cached is None))
+        if cached is not None:
+            return cached
+
+        local, missing = self._local_metadata(text)
+        if not missing:
+            metadata = self._merge_metadata(local, {}, [])
+            self._cache_metadata(text, metadata)
+            return metadata
+
+        try:
+            response = self._llm_complete("metadata", self._metadata_request(text, missing))
+            extracted = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            self.telemetry.count("llm_errors", kind="metadata")
+            if not self.quiet:
+                print(f"Metadata extraction error: {e}", file=sys.stderr)
+            return self._merge_metadata(local, {}, missing)
+
+        metadata = self._merge_metadata(local, extracted, missing)
+        self._cache_metadata(text, metadata)
+        return metadata
+
+    def extract_metadata_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for many resumes with concurrent LLM calls.
+
+        Cached resumes are served from the metadata cache. For the rest, the
+        fields the rule-based extractor misses are requested from Mistral.
+        Several resumes share one request, up to metadata_batch_tokens of
+        prompt; a resume missing from (or malformed in) a batched answer is
+        retried on its own, and an unparseable answer is split in half and
+        retried. Requests run concurrently, bounded by llm_concurrency and a
+        token-bucket limit of llm_requests_per_second, retrying 429/5xx
+        responses with jittered backoff. Fields that still fail get their
+        default values.
+
+        Args:
+            texts (List[str]): Resume text contents
+
+        Returns:
+            List[Dict[str, Any]]: Metadata per resume, in input order
+        """
+        self._require_mode("metadata", "Metadata extraction")
+        with self.telemetry.span("metadata") as span:
+            span.set(resumes=len(texts))
+            return self._extract_metadata_batch(texts)
+
+    def _extract_metadata_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        results: List[Optional[Dict[str, Any]]] = [self._get_cached_metadata(text) for text in texts]
+        misses = [i for i, metadata in enumerate(results) if metadata is None]
+        self._count_cache("metadata", len(texts) - len(misses), len(misses))
+        if not misses:
+            return results
+
+        local = {i: self._local_metadata(texts[i]) for i in misses}
+        pending = [i for i in misses if local[i][1]]
+        if not self.quiet:
+            print(f"Extracting metadata for {len(misses)} resumes ({len(texts) - len(misses)} cached, "
+                  f"{len(misses) - len(pending)} without LLM)", file=sys.stderr)
+        extracted = self._run_async(self._extract_metadata_async([(texts[i], local[i][1]) for i in pending]))
+        answers = dict(zip(pending, extracted))
+        for i in misses:
+            fields, missing = local[i]
+            answer = answers.get(i, {})
+            results[i] = self._merge_metadata(fields, answer or {}, missing)
+            if answer is not None:
+                self._cache_metadata(texts[i], results[i])
+        return results
+
+    def _run_async(self, coroutine):
+        """
+        Run a coroutine on this selector's own event loop.
+
+        The Mistral client's async HTTP connections are bound to the loop that
+        opened them, so a long-lived selector reuses one loop instead of
+        creating a new one per call with asyncio.run.
+        """
+        return self._get_event_loop().run_until_complete(coroutine)
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop
+
+    async def _extract_metadata_async(self, requests: List[Tuple[str, List[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """Run (text, missing fields) metadata requests in concurrent batches; failed items come back as None."""
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        rate_limiter = TokenBucket(self.llm_requests_per_second)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+
+        async def complete(kind: str, request: Dict[str, Any]):
+            async with semaphore:
+                return await call_with_retries(lambda: self._llm_complete_async(kind, request),
+                                               rate_limiter=rate_limiter)
+
+        def report(kind: str, error: Exception):
+            self.telemetry.count("llm_errors", kind=kind)
+            if not self.quiet:
+                print(f"Metadata extraction error: {error}", file=sys.stderr)
+
+        async def extract_one(i: int):
+            text, fields = requests[i]
+            try:
+                response = await complete("metadata", self._metadata_request(text, fields))
+                results[i] = json.loads(response.choices[0].message.content)
+            except Exception as e:
+                report("metadata", e)
+
+        async def extract_batch(batch: List[int]):
+            if len(batch) == 1:
+                return await extract_one(batch[0])
+            try:
+                response = await complete("metadata_batch", self._metadata_batch_request([requests[i] for i in batch]))
+            except Exception as e:
+                report("metadata_batch", e)
+                return
+            try:
+                answers = self._parse_metadata_batch(response.choices[0].message.content)
+            except ValueError as e:
+                # Unusable answer: retry each half so one bad resume cannot sink the whole batch
+                report("metadata_batch", e)
+                half = len(batch) // 2
+                await asyncio.gather(extract_batch(batch[:half]), extract_batch(batch[half:]))
+                return
+            retry = []
+            for position, i in enumerate(batch, start=1):
+                answer = answers.get(str(position))
+                # An entry without every requested key is malformed; asking again alone beats caching defaults
+                if answer is None or any(field not in answer for field in requests[i][1]):
+                    retry.append(i)
+                else:
+                    results[i] = answer
+            self.telemetry.count("metadata_batch_retries", len(retry))
+            await asyncio.gather(*(extract_one(i) for i in retry))
+
+        await asyncio.gather(*(extract_batch(batch) for batch in self._metadata_batches(requests)))
+        return results
+
+    def _metadata_batches(self, requests: List[Tuple[str, List[str]]]) -> List[List[int]]:
+        """Group request indices, in order, into batches that fit the prompt token budget."""
+        if not self.metadata_batch_tokens:
+            return [[i] for i in range(len(requests))]
+        batches: List[List[int]] = []
+        current: List[int] = []
+        tokens = 0
+        for i, (text, fields) in enumerate(requests):
+            cost = len(text[:self._metadata_text_chars(fields)]) // 4
+            if current and (tokens + cost > self.metadata_batch_tokens
+                            or len(current) >= self.METADATA_BATCH_MAX_RESUMES):
+                batches.append(current)
+                current, tokens = [], 0
+            current.append(i)
+            tokens += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _llm_complete(self, kind: str, request: Dict[str, Any]):
+        """chat.complete with a timing span and token counters."""
+        with self.telemetry.span("llm_call", kind=kind) as span:
+            response = self.mistral_client.chat.complete(**request)
+            self._record_llm_usage(kind, response, span)
+        return response
+
+    async def _llm_complete_async(self, kind: str, request: Dict[str, Any]):
+        """chat.complete_async with a timing span and token counters."""
+        with self.telemetry.span("llm_call", kind=kind) as span:
+            response = await self.mistral_client.chat.complete_async(**request)
+            self._record_llm_usage(kind, response, span)
+        return response
+
+    def _record_llm_usage(self, kind: str, response, span):
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        completion_tokens = getattr(usage, "completion_tokens", None) or 0
+        span.set(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        self.telemetry.count("llm_tokens", prompt_tokens, kind=kind, type="prompt")
+        self.telemetry.count("llm_tokens", completion_tokens, kind=kind, type="completion")
+
+    def _count_cache(self, cache: str, hits: int, misses: int):
+        self.telemetry.count("cache_hits", hits, cache=cache)
+        self.telemetry.count("cache_misses", misses, cache=cache)
+
+    def _metadata_text_chars(self, fields: List[str]) -> int:
+        """Characters of resume text the LLM needs for these fields."""
+        return self.SUMMARY_TEXT_CHARS if list(fields) == ["summary"] else self.METADATA_TEXT_CHARS
+
+    def _metadata_request(self, text: str, fields: List[str] = METADATA_FIELDS) -> Dict[str, Any]:
+        """Build the chat.complete arguments for extracting the given metadata fields."""
+        keys = "\n".join(f"- {field}" for field in fields)
         prompt = f"""
 Analyze the following resume text and extract structured metadata in JSON format:
-{text[:4000]}
+{text[:self._metadata_text_chars(fields)]}
 
 Return JSON with keys:
-- name
-- email
-- phone
-- skills
-- experience_years
-- education
-- job_titles
-- summary
+{keys}
+Important: Only return valid JSON, no additional text.
+"""
+        return {
+            "model": self.LLM_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _metadata_batch_request(self, items: List[Tuple[str, List[str]]]) -> Dict[str, Any]:
+        """Build one chat.complete request extracting metadata for several resumes, numbered from 1."""
+        resumes = "\n\n".join(
+            f"### RESUME {position}\nKeys: {', '.join(fields)}\n{text[:self._metadata_text_chars(fields)]}"
+            for position, (text, fields) in enumerate(items, start=1)
+        )
+        prompt = f"""
+Analyze each resume below and extract structured metadata in JSON format.
+Each resume starts with "### RESUME <id>" followed by the keys to extract for it.
+
+{resumes}
+
+Return a JSON object {{"resumes": [...]}} with one object per resume, holding its "id" and its keys.
 Important: Only return valid JSON, no additional text.
 """
+        return {
+            "model": self.LLM_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"}
+        }
+
+    @staticmethod
+    def _parse_metadata_batch(content: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a batched metadata answer into metadata by resume id.
+
+        Raises:
+            ValueError: If the answer is not JSON or has no list of resumes
+        """
+        data = json.loads(content)
+        entries = data.get("resumes") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("Batched metadata answer has no resumes list")
+        return {str(entry["id"]): entry for entry in entries if isinstance(entry, dict) and "id" in entry}
+
+    def _default_metadata(self) -> Dict[str, Any]:
+        """Metadata used when extraction fails."""
+        return {
+            "name": "Unknown",
+            "email": "",
+            "phone": "",
+            "skills": [],
+            "experience_years": 0.0,
+            "education": [],
+            "job_titles": [],
+            "summary": ""
+        }
+
+    def _local_metadata(self, text: str) -> Tuple[Dict[str, Any], List[str]]:
+        """Rule-based fields for a resume and the fields left for the LLM."""
+        if not self.local_metadata:
+            return {}, list(METADATA_FIELDS)
+        local = extract_local_metadata(text)
+        self.telemetry.count("metadata_fields", len(local), source="local")
+        return local, [field for field in METADATA_FIELDS if field not in local]
+
+    def _merge_metadata(self, local: Dict[str, Any], extracted: Dict[str, Any],
+                        requested: List[str]) -> Dict[str, Any]:
+        """Defaults, overlaid with the requested LLM fields, overlaid with the local fields."""
+        metadata = self._default_metadata()
+        metadata.update({field: extracted[field] for field in requested if field in extracted})
+        metadata.update(local)
+        return metadata
+
+    def _get_cached_metadata(self, text: str) -> Optional[Dict[str, Any]]:
+        if self.metadata_cache is None:
+            return None
         try:
-            response = self.mistral_client.chat.complete(
-                model="mistral-small-latest",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
-            return json.loads(response.choices[0].message.content)
+            return self.metadata_cache.get(hash_text(text), self._metadata_prompt_version, self.LLM_MODEL)
         except Exception as e:
-            if not self.quiet:
-                print(f"Metadata extraction error: {e}", file=sys.stderr)
-            return {
-                "name": "Unknown",
-                "email": "",
-                "phone": "",
-                "skills": [],
-                "experience_years": 0.0,
-                "education": [],
-                "job_titles": [],
-                "summary": ""
-            }
+            print(f"⚠️ Metadata cache unavailable: {e}", file=sys.stderr)
+            return None
 
-    def process_resumes(self, folder_path: str) -> bool:
+    def _cache_metadata(self, text: str, metadata: Dict[str, Any]):
+        if self.metadata_cache is None:
+            return
+        try:
+            self.metadata_cache.put(hash_text(text), self._metadata_prompt_version, self.LLM_MODEL, metadata)
+        except Exception as e:
+            print(f"⚠️ Could not cache metadata: {e}", file=sys.stderr)
+
+    def invalidate_metadata(self, text: Optional[str] = None):
+        """
+        Drop cached LLM metadata so it is extracted again on next use.
+
+        Args:
+            text (Optional[str]): Resume text to invalidate, or None to clear the whole cache
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(hash_text(text) if text is not None else None)
+
+    def invalidate_summaries(self, project_description: Optional[str] = None):
+        """
+        Drop cached candidate summaries so they are generated again on next use.
+
+        Args:
+            project_description (Optional[str]): Project whose summaries to invalidate, or None to clear the whole cache
+        """
+        if self.summary_cache is not None:
+            self.summary_cache.invalidate(
+                hash_text(" ".join(project_description.split())) if project_description is not None else None
+            )
+
+    def process_resumes(self, folder_path: str, use_snapshot: bool = False) -> bool:
         """
         Process all PDF resumes in a folder.
 
         Args:
             folder_path (str): Path to folder containing PDF resumes
+            use_snapshot (bool): If True, load the folder's saved snapshot when it is
+                still current, and save a new snapshot after processing otherwise
 
         Returns:
             bool: True if processing was successful, False otherwise
         """
+        self._require_mode("search", "Resume indexing")
+        snapshot_dir = self.snapshot_dir_for(folder_path) if use_snapshot else None
+        if snapshot_dir and self.snapshot_is_current(snapshot_dir, folder_path) and self.load_snapshot(snapshot_dir):
+            if not self.quiet:
+                print(f"✅ Loaded {len(self.store)} resumes from snapshot", file=sys.stderr)
+            return True
+
         # Clear existing data
-        self.resumes.clear()
-        self.file_paths.clear()
-        self.resume_metadata.clear()
+        self._clear()
 
         # Find PDF files
         folder = Path(folder_path)
@@ -154,104 +743,673 @@ Important: Only return valid JSON, no additional text.
             print("❌ No PDF files found!")
             return False
 
-        # Process each PDF
+        # Extract text from every readable PDF (in parallel when configured)
+        skipped_files = []
+        readable_files, content_hashes = [], []
         for pdf_file in pdf_files:
-            file_id = uuid.uuid4().hex[:8]
-            if not self.quiet:
-                print(f"Processing: {pdf_file.name} (ID: {file_id})", file=sys.stderr)
+            try:
+                content_hashes.append(hash_file(str(pdf_file)))
+                readable_files.append(str(pdf_file))
+            except OSError as e:
+                print(f"❌ Could not read {pdf_file.name}: {e}", file=sys.stderr)
+        texts = self.extract_texts_from_pdfs(readable_files, content_hashes)
+
+        # Extract metadata for every resume with text concurrently
+        with_text = [i for i, text in enumerate(texts) if text]
+        metadata_by_file = dict(zip(with_text, self.extract_metadata_batch([texts[i] for i in with_text])))
+
+        # Process each PDF
+        for i, (pdf_file, content_hash, text) in enumerate(zip(readable_files, content_hashes, texts)):
+            if self._ingest_resume(pdf_file, text=text, content_hash=content_hash,
+                                   metadata=metadata_by_file.get(i)) is None:
+                skipped_files.append(pdf_file)
+
+        if not self.quiet:
+            print(f"✅ Processed {len(self.store)} resumes", file=sys.stderr)
+
+        # Build search index
+        if not len(self.store) or not self.build_index():
+            return False
+
+        if snapshot_dir:
+            try:
+                self.save_snapshot(snapshot_dir, skipped_files=skipped_files)
+            except Exception as e:
+                print(f"⚠️ Could not save snapshot: {e}", file=sys.stderr)
+        return True
+
+    def shared_snapshot_dir(self) -> Optional[str]:
+        """Snapshot directory of the institution-wide shared index, or None when caching is disabled."""
+        if not self.cache_dir:
+            return None
+        return str(Path(self.cache_dir) / "snapshots" / "shared")
+
+    def load_shared_index(self) -> bool:
+        """
+        Load the shared index saved by sync_folder, if there is one.
+
+        Returns:
+            bool: True if a shared snapshot was loaded
+        """
+        snapshot_dir = self.shared_snapshot_dir()
+        if not snapshot_dir or not self.load_snapshot(snapshot_dir):
+            return False
+        if not self.quiet:
+            print(f"✅ Loaded shared index with {len(self.store)} resumes", file=sys.stderr)
+        return True
+
+    def sync_folder(self, folder_path: str, save: bool = True) -> bool:
+        """
+        Add a folder's PDFs to the shared, content-deduplicated index.
 
-            # Extract text
-            text = self.extract_text_from_pdf(str(pdf_file))
-            if not text:
-                print(f"⚠️ No text extracted from {pdf_file.name}")
+        Unlike process_resumes, existing resumes are kept: each PDF is hashed
+        and only content not already indexed (from any folder) is extracted,
+        annotated and embedded. The folder's membership is recorded so that
+        search_resumes(folder=...) searches just its resumes; resumes no
+        longer present in any synced folder are removed.
+
+        When saving, the whole update runs under an inter-process lock on the
+        shared snapshot, starting from its latest version if another process
+        saved one since this selector last loaded or saved it, so concurrent
+        syncs do not overwrite each other's changes.
+
+        Args:
+            folder_path (str): Path to folder containing PDF resumes
+            save (bool): Save the shared snapshot if anything changed
+
+        Returns:
+            bool: True if the folder has at least one indexed resume, False otherwise
+        """
+        self._require_mode("search", "Resume indexing")
+        snapshot_dir = self.shared_snapshot_dir()
+        if not save or not snapshot_dir:
+            return self._sync_folder(folder_path, None)
+
+        with file_lock(snapshot_dir + ".lock"):
+            latest = self._current_snapshot(snapshot_dir)
+            if latest is not None and latest != self._snapshot_version and self.load_snapshot(snapshot_dir) \
+                    and not self.quiet:
+                print(f"🔄 Reloaded shared index saved by another process ({len(self.store)} resumes)",
+                      file=sys.stderr)
+            return self._sync_folder(folder_path, snapshot_dir)
+
+    def _sync_folder(self, folder_path: str, snapshot_dir: Optional[str]) -> bool:
+        """Body of sync_folder; saves to snapshot_dir (if given) when anything changed."""
+        folder = Path(folder_path)
+        if not folder.exists():
+            print(f"❌ Folder {folder_path} does not exist!", file=sys.stderr)
+            return False
+
+        # Hash every PDF; only content not yet in the index needs processing
+        hashed_files: List[Tuple[str, str]] = []
+        new_files: Dict[str, str] = {}
+        for pdf_file in sorted(folder.glob("*.pdf")):
+            try:
+                content_hash = hash_file(str(pdf_file))
+            except OSError as e:
+                print(f"❌ Could not read {pdf_file.name}: {e}", file=sys.stderr)
                 continue
+            hashed_files.append((str(pdf_file), content_hash))
+            if self.store.get_by_hash(content_hash) is None and content_hash not in new_files:
+                new_files[content_hash] = str(pdf_file)
+
+        added = []
+        if new_files:
+            new_paths, new_hashes = list(new_files.values()), list(new_files.keys())
+            texts = self.extract_texts_from_pdfs(new_paths, new_hashes)
+            with_text = [i for i, text in enumerate(texts) if text]
+            metadata_by_file = dict(zip(with_text, self.extract_metadata_batch([texts[i] for i in with_text])))
+
+            for i, (pdf_file, content_hash, text) in enumerate(zip(new_paths, new_hashes, texts)):
+                resume_id = self._ingest_resume(pdf_file, resume_id=content_hash[:16], text=text,
+                                                content_hash=content_hash, metadata=metadata_by_file.get(i))
+                if resume_id is not None:
+                    added.append(self.store.get_by_id(resume_id))
+            if added:
+                self._index_records(added)
+
+        # Record membership; drop resumes no synced folder contains any more
+        members = {}
+        for pdf_file, content_hash in hashed_files:
+            record = self.store.get_by_hash(content_hash)
+            if record is not None:
+                members.setdefault(record.row, pdf_file)
+
+        key = self._folder_key(folder_path)
+        previous = self.folder_members.get(key, {})
+        self.folder_members[key] = members
+        still_used = set().union(*self.folder_members.values())
+        orphaned = [row for row in previous if row not in still_used]
+        for row in orphaned:
+            record = self.store.get(row)
+            if record is not None:
+                self.remove_resume(record.resume_id)
 
-            # Extract metadata
-            metadata = self.extract_metadata(text)
+        if not self.quiet:
+            print(f"✅ Synced {len(members)} resumes from {folder.name} ({len(added)} new, "
+                  f"{len(orphaned)} removed; {len(self.store)} in shared index)", file=sys.stderr)
 
-            # Store data
-            self.resumes.append(text)
-            self.file_paths.append(str(pdf_file))
-
-            # Store metadata with truncated text for memory efficiency
-            short_text = text[:2000] + "..." if len(text) > 2000 else text
-            self.resume_metadata[file_id] = {
-                "file_name": pdf_file.name,
-                "file_path": str(pdf_file),
-                "text": short_text,
-                "metadata": metadata
-            }
+        if snapshot_dir and self.index is not None and (added or orphaned or members != previous):
+            try:
+                self.save_snapshot(snapshot_dir)
+            except Exception as e:
+                print(f"⚠️ Could not save shared snapshot: {e}", file=sys.stderr)
+        return bool(members)
+
+    def _folder_key(self, folder_path: str) -> str:
+        return str(Path(folder_path).resolve())
+
+    def add_resume(self, pdf_path: str, resume_id: Optional[str] = None) -> Optional[str]:
+        """
+        Add a single resume to an existing (or empty) index.
+
+        Only the new resume is extracted, annotated and embedded.
+
+        Args:
+            pdf_path (str): Path to the PDF resume
+            resume_id (Optional[str]): Stable ID for the resume; generated if omitted
+
+        Returns:
+            Optional[str]: The resume ID, or None if the resume could not be added
+        """
+        self._require_mode("search", "Resume indexing")
+        if resume_id is not None and resume_id in self.store:
+            print(f"❌ Resume {resume_id} already exists; use update_resume instead", file=sys.stderr)
+            return None
+
+        resume_id = self._ingest_resume(pdf_path, resume_id)
+        if resume_id is None:
+            return None
+
+        record = self.store.get_by_id(resume_id)
+        try:
+            self._index_records([record])
+        except Exception as e:
+            print(f"❌ Error indexing resume {resume_id}: {e}", file=sys.stderr)
+            self.store.remove(resume_id)
+            self.metadata_index.remove(record.row)
+            return None
 
         if not self.quiet:
-            print(f"✅ Processed {len(self.resumes)} resumes", file=sys.stderr)
+            print(f"✅ Added resume {resume_id}", file=sys.stderr)
+        return resume_id
 
-        # Build search index
-        if self.resumes:
-            return self.build_index()
+    def update_resume(self, resume_id: str, pdf_path: Optional[str] = None) -> bool:
+        """
+        Re-process a resume in place, keeping its ID.
+
+        The new version is extracted, annotated and embedded before the old
+        one is touched, so if any step fails the old record and vector stay
+        as they were.
+
+        Args:
+            resume_id (str): ID of the resume to update
+            pdf_path (Optional[str]): New PDF path; defaults to the resume's current path
+
+        Returns:
+            bool: True if the resume was updated, False otherwise
+        """
+        self._require_mode("search", "Resume indexing")
+        old = self.store.get_by_id(resume_id)
+        if old is None:
+            print(f"❌ Resume {resume_id} not found", file=sys.stderr)
+            return False
+
+        pdf_path = pdf_path or old.file_path
+        prepared = self._prepare_resume(pdf_path, resume_id)
+        if prepared is None:
+            return False
+        text, content_hash, metadata = prepared
+        try:
+            embeddings = self._embed_resumes([(text, metadata)])
+        except Exception as e:
+            print(f"❌ Error embedding resume {resume_id}: {e}", file=sys.stderr)
+            return False
+
+        # Swap: nothing below depends on the PDF, the LLM or the embedding model
+        self.remove_resume(resume_id)
+        record = self.store.add(resume_id, str(Path(pdf_path)), content_hash, text, metadata)
+        self._index_metadata(record)
+        self._add_vectors([record.row], embeddings)
+        for members in self.folder_members.values():
+            if old.row in members:
+                members[record.row] = members.pop(old.row)
+
+        if not self.quiet:
+            print(f"✅ Updated resume {resume_id}", file=sys.stderr)
+        return True
+
+    def remove_resume(self, resume_id: str) -> bool:
+        """
+        Remove a resume (e.g. a withdrawn application) from the index.
+
+        Args:
+            resume_id (str): ID of the resume to remove
+
+        Returns:
+            bool: True if the resume was removed, False if it was not found
+        """
+        record = self.store.remove(resume_id)
+        if record is None:
+            return False
+        self.metadata_index.remove(record.row)
+
+        if self.index is not None:
+            if supports_removal(self.index):
+                self._ensure_writable_index()
+                self.index.remove_ids(np.array([record.row], dtype='int64'))
+            else:
+                # Approximate indexes cannot delete vectors; searches skip the row until the next rebuild
+                self._index_tombstones.add(record.row)
+                if len(self._index_tombstones) > self.index.ntotal * self.TOMBSTONE_REBUILD_FRACTION:
+                    self._rebuild_index()
+        return True
+
+    def _ingest_resume(self, pdf_path: str, resume_id: Optional[str] = None, text: Optional[str] = None,
+                       content_hash: Optional[str] = None,
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Extract text and metadata for one PDF and store it, without touching the index.
+
+        Pass text, content_hash and metadata when they were already extracted in a batch.
+        """
+        file_id = resume_id or uuid.uuid4().hex[:8]
+        prepared = self._prepare_resume(pdf_path, file_id, text, content_hash, metadata)
+        if prepared is None:
+            return None
+        text, content_hash, metadata = prepared
+
+        # Store data
+        record = self.store.add(file_id, str(Path(pdf_path)), content_hash, text, metadata)
+        self._index_metadata(record)
+        return file_id
+
+    def _prepare_resume(self, pdf_path: str, resume_id: str, text: Optional[str] = None,
+                        content_hash: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None
+                        ) -> Optional[Tuple[str, Optional[str], Dict[str, Any]]]:
+        """Extract the (text, content hash, metadata) of one PDF without storing anything; None if it has no text."""
+        pdf_file = Path(pdf_path)
+        if not self.quiet:
+            print(f"Processing: {pdf_file.name} (ID: {resume_id})", file=sys.stderr)
+
+        # Extract text
+        if text is None:
+            try:
+                content_hash = hash_file(str(pdf_file))
+            except OSError as e:
+                print(f"❌ Could not read {pdf_file.name}: {e}", file=sys.stderr)
+                return None
+            text = self.extract_text_from_pdf(str(pdf_file), content_hash=content_hash)
+        if not text:
+            print(f"⚠️ No text extracted from {pdf_file.name}")
+            return None
+
+        # Extract metadata
+        if metadata is None:
+            metadata = self.extract_metadata(text)
+        return text, content_hash, metadata
+
+    def _index_metadata(self, record: ResumeRecord, metadata_index: Optional[MetadataIndex] = None):
+        """Add a stored resume's metadata features to the bulk-scoring index (or to metadata_index)."""
+        metadata = record.metadata
+        experience_years = metadata.get("experience_years", 0)
+        if not isinstance(experience_years, (int, float)):
+            experience_years = 0
+
+        (metadata_index or self.metadata_index).add(
+            record.row,
+            skills=self._extract_skills(metadata.get("skills", [])),
+            experience_years=experience_years,
+            education=self._extract_list_items(metadata.get("education", [])),
+            job_titles=self._extract_list_items(metadata.get("job_titles", []))
+        )
+
+    def _index_records(self, records: List[ResumeRecord]):
+        """Embed stored resumes and add them to the index under their row IDs."""
+        embeddings = self._embed_resumes([(record.text, record.metadata) for record in records])
+        self._add_vectors([record.row for record in records], embeddings)
+
+    def _embed_resumes(self, resumes: List[Tuple[str, Dict[str, Any]]]) -> np.ndarray:
+        """Normalized embeddings of (text, metadata) pairs."""
+        enhanced_texts = [self._build_enhanced_text(text, metadata) for text, metadata in resumes]
+        with self.telemetry.span("embedding") as span:
+            span.set(resumes=len(enhanced_texts))
+            embeddings = self._encode_documents(enhanced_texts)
+        faiss.normalize_L2(embeddings)
+        return embeddings
+
+    def _add_vectors(self, rows: List[int], embeddings: np.ndarray):
+        """Add normalized embeddings to the index under their row IDs."""
+        if self.index is None:
+            self.index = self._new_index(embeddings)
+        self._ensure_writable_index()
+        self.index.add_with_ids(embeddings, np.array(rows, dtype='int64'))
+        if self._index_outgrown():
+            self._rebuild_index()
+
+    def _clear(self):
+        """Reset all in-memory resume storage and the index."""
+        self.index = None
+        self._index_is_mmapped = False
+        self._index_tombstones.clear()
+        self.store.clear()
+        self.metadata_index.clear()
+        self.folder_members.clear()
+
+    def _new_index(self, embeddings: np.ndarray):
+        """Create an empty ID-mapped index of the configured type, sized (and for IVF trained) for embeddings."""
+        kind = choose_index_type(len(embeddings), self.index_type, self.ann_threshold)
+        if not self.quiet and kind != "flat":
+            print(f"Building {kind} index for {len(embeddings)} resumes", file=sys.stderr)
+        return create_index(kind, self.embedding_dim, training_vectors=embeddings)
+
+    def _index_outgrown(self) -> bool:
+        """True if incremental adds call for a rebuild: past ann_threshold, or IVF clusters trained on far fewer vectors."""
+        kind = index_kind(self.index)
+        if kind == "flat":
+            return choose_index_type(self.index.ntotal, self.index_type, self.ann_threshold) != "flat"
+        if kind == "ivf":
+            return ivf_list_count(self.index.ntotal) >= 2 * faiss.downcast_index(self.index.index).nlist
         return False
 
-    def build_index(self) -> bool:
+    def _index_contents(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(row IDs, vectors) currently in the index, tombstoned rows included."""
+        ids = faiss.vector_to_array(self.index.id_map).astype('int64')
+        embeddings = self.index.index.reconstruct_n(0, self.index.ntotal) if self.index.ntotal else \
+            np.zeros((0, self.embedding_dim), dtype='float32')
+        return ids, embeddings
+
+    def _rebuild_index(self):
+        """Rebuild the index from its own vectors, dropping tombstoned rows and applying index_type."""
+        ids, embeddings = self._index_contents()
+        if self._index_tombstones:
+            keep = ~np.isin(ids, np.fromiter(self._index_tombstones, dtype='int64'))
+            ids, embeddings = ids[keep], np.ascontiguousarray(embeddings[keep])
+        with self.telemetry.span("index_build") as span:
+            index = self._new_index(embeddings)
+            index.add_with_ids(embeddings, ids)
+            span.set(resumes=len(ids), kind=index_kind(index))
+        self.index = index
+        self._index_is_mmapped = False
+        self._index_tombstones.clear()
+
+    def _ensure_writable_index(self):
+        """Copy a memory-mapped snapshot index into memory before mutating it."""
+        if self._index_is_mmapped:
+            self.index = faiss.clone_index(self.index)
+            self._index_is_mmapped = False
+
+    def snapshot_dir_for(self, folder_path: str) -> Optional[str]:
         """
-        Build FAISS vector index for semantic search.
+        Get the snapshot directory used for a resume folder.
+
+        Args:
+            folder_path (str): Path to folder containing PDF resumes
 
         Returns:
-            bool: True if index was built successfully, False otherwise
+            Optional[str]: Snapshot directory, or None when caching is disabled
         """
-        enhanced_texts: List[str] = []
+        if not self.cache_dir:
+            return None
+        folder_key = hash_text(str(Path(folder_path).resolve()))[:16]
+        return str(Path(self.cache_dir) / "snapshots" / folder_key)
 
-        for resume, path in zip(self.resumes, self.file_paths):
-            # Find file ID
-            file_id = None
-            for fid, metadata in self.resume_metadata.items():
-                if metadata["file_path"] == path:
-                    file_id = fid
-                    break
+    def save_snapshot(self, snapshot_dir: str, skipped_files: Optional[List[str]] = None):
+        """
+        Save the complete selector state (index, embeddings, texts, metadata, manifest).
 
-            if file_id is None:
-                print(f"Warning: Could not find metadata for {path}")
-                continue
+        Each save writes a new version directory inside snapshot_dir and then
+        atomically replaces the CURRENT pointer file naming it, so a reader
+        always resolves to one complete version. Older versions beyond
+        SNAPSHOT_KEEP_VERSIONS are then removed.
 
-            meta = self.resume_metadata[file_id]["metadata"]
+        Args:
+            snapshot_dir (str): Directory to write the snapshot to
+            skipped_files (Optional[List[str]]): PDFs that were processed but not indexed
+                (e.g. no extractable text); recorded in the manifest so they do not make
+                the snapshot look stale
+        """
+        if self.index is None:
+            raise ValueError("Index not built")
+
+        target = Path(snapshot_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        # Time-ordered, unique across concurrent writers
+        version = f"v{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=target))
+        try:
+            # Written first: compaction updates the text spans serialized below
+            self.store.save_texts(str(tmp_dir / "texts.bin"))
+            self._write_snapshot(tmp_dir, skipped_files)
+            os.replace(tmp_dir, target / version)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        pointer_tmp = target / f".{self.SNAPSHOT_POINTER}-{version}"
+        pointer_tmp.write_text(version, encoding="utf-8")
+        os.replace(pointer_tmp, target / self.SNAPSHOT_POINTER)
+        self._snapshot_version = target / version
+        self._prune_snapshot_versions(target, version)
+
+    def _prune_snapshot_versions(self, target: Path, current: str):
+        """Remove versions older than the newest SNAPSHOT_KEEP_VERSIONS, abandoned writes and pre-versioning files."""
+        versions = sorted((entry.name for entry in target.iterdir() if entry.is_dir() and entry.name.startswith("v")),
+                          reverse=True)
+        for name in versions[self.SNAPSHOT_KEEP_VERSIONS:]:
+            if name != current:
+                # May fail on Windows while another process has the index memory-mapped; retried on the next save
+                shutil.rmtree(target / name, ignore_errors=True)
+        for entry in target.glob(".tmp-*"):
+            # Left behind by a writer that died; live writers finish well within an hour
+            if entry.is_dir() and time.time() - entry.stat().st_mtime > 3600:
+                shutil.rmtree(entry, ignore_errors=True)
+        for legacy in ("state.json", "index.faiss", "embeddings.npy", "ids.npy", "texts.bin"):
+            try:
+                (target / legacy).unlink()
+            except OSError:
+                pass
+
+    def _current_snapshot(self, snapshot_dir: str) -> Optional[Path]:
+        """The version directory the snapshot's CURRENT pointer names, or None if there is none."""
+        try:
+            version = (Path(snapshot_dir) / self.SNAPSHOT_POINTER).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        version_dir = Path(snapshot_dir) / version
+        return version_dir if version and version_dir.is_dir() else None
+
+    def _write_snapshot(self, tmp_dir: Path, skipped_files: Optional[List[str]]):
+        """Write the index, embeddings and state.json of a snapshot into a directory."""
+        resumes = [record.to_dict() for record in self.store]
+
+        manifest = {r["file_name"]: r["content_hash"] for r in resumes}
+        for skipped in skipped_files or []:
+            manifest[Path(skipped).name] = hash_file(skipped)
+
+        state = {
+            "version": self.SNAPSHOT_VERSION,
+            "embedding_model": self.embedding_key,
+            "embedding_dim": self.embedding_dim,
+            "next_row": self.store.next_row,
+            "manifest": manifest,
+            "resumes": resumes,
+            "folders": {folder: sorted(members.items()) for folder, members in self.folder_members.items()}
+        }
+
+        if self._index_tombstones:
+            self._rebuild_index()
+        faiss.write_index(self.index, str(tmp_dir / "index.faiss"))
+        ids, embeddings = self._index_contents()
+        np.save(tmp_dir / "embeddings.npy", embeddings)
+        np.save(tmp_dir / "ids.npy", ids)
+        # Checked on load so mismatched files are rejected rather than read past their end
+        state["file_sizes"] = {name: (tmp_dir / name).stat().st_size for name in ("index.faiss", "texts.bin")}
+        with open(tmp_dir / "state.json", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    def load_snapshot(self, snapshot_dir: str) -> bool:
+        """
+        Restore selector state saved by save_snapshot.
 
-            # Process skills safely
-            clean_skills = self._extract_skills(meta.get('skills', []))
+        The current version is resolved once, and its files are checked against
+        the sizes recorded in its state.json before anything is loaded. Texts,
+        records and the index are loaded into new objects first; the selector's
+        state is only replaced once all of them loaded, so a failed load leaves
+        it as it was. The FAISS index is memory-mapped where the FAISS build
+        supports it.
 
-            # Get other metadata safely
-            name = str(meta.get('name', 'Unknown'))
-            experience_years = meta.get('experience_years', 0)
-            if not isinstance(experience_years, (int, float)):
-                experience_years = 0
+        Args:
+            snapshot_dir (str): Directory containing the snapshot
 
-            summary = str(meta.get('summary', ''))
+        Returns:
+            bool: True if the snapshot was loaded, False otherwise
+        """
+        version_dir = self._current_snapshot(snapshot_dir)
+        state = self._read_snapshot_state(version_dir) if version_dir else None
+        if state is None:
+            return False
 
-            # Create enhanced text for better search
-            enhanced_text = (
-                f"Candidate Profile:\n"
-                f"Name: {name}\n"
-                f"Skills: {', '.join(clean_skills)}\n"
-                f"Experience: {experience_years} years\n"
-                f"Summary: {summary}\n\n"
-                f"Resume Content:\n{resume[:3000]}"
-            )
-            enhanced_texts.append(enhanced_text)
+        try:
+            sizes = {name: (version_dir / name).stat().st_size for name in state["file_sizes"]}
+        except OSError as e:
+            print(f"⚠️ Snapshot is incomplete: {e}", file=sys.stderr)
+            return False
+        if sizes != state["file_sizes"]:
+            print("⚠️ Snapshot files do not match its state; ignoring it", file=sys.stderr)
+            return False
+
+        store = ResumeStore(text_dir=self.store.texts.directory)
+        metadata_index = MetadataIndex()
+        try:
+            index_path = str(version_dir / "index.faiss")
+            try:
+                index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP)
+                mmapped = True
+            except RuntimeError:
+                index = faiss.read_index(index_path)
+                mmapped = False
+
+            store.load_texts(str(version_dir / "texts.bin"))
+            for record in state["resumes"]:
+                restored = ResumeRecord.from_dict(record, store.texts)
+                store.restore(restored)
+                self._index_metadata(restored, metadata_index)
+            store.reserve_rows(state["next_row"])
+            folder_members = {folder: {int(row): path for row, path in members}
+                              for folder, members in state.get("folders", {}).items()}
+        except Exception as e:
+            store.close()
+            print(f"⚠️ Could not load snapshot: {e}", file=sys.stderr)
+            return False
+
+        self._clear()
+        self.store.close()
+        self.store = store
+        self.metadata_index = metadata_index
+        self.folder_members = folder_members
+        self.index = index
+        self._index_is_mmapped = mmapped
+        self._snapshot_version = version_dir
+        if choose_index_type(index.ntotal, self.index_type, self.ann_threshold) != index_kind(index):
+            self._rebuild_index()
+        return True
+
+    def snapshot_is_current(self, snapshot_dir: str, folder_path: str) -> bool:
+        """
+        Check whether a snapshot still matches the PDFs in a folder.
+
+        Args:
+            snapshot_dir (str): Directory containing the snapshot
+            folder_path (str): Path to folder containing PDF resumes
+
+        Returns:
+            bool: True if every PDF in the folder is in the manifest with the same content hash
+        """
+        version_dir = self._current_snapshot(snapshot_dir)
+        state = self._read_snapshot_state(version_dir) if version_dir else None
+        if state is None:
+            return False
+
+        try:
+            current = {pdf_file.name: hash_file(str(pdf_file)) for pdf_file in Path(folder_path).glob("*.pdf")}
+        except OSError:
+            return False
+        return current == state["manifest"]
+
+    def _read_snapshot_state(self, version_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read a snapshot version's state.json if it exists and matches this selector's configuration."""
+        state_path = version_dir / "state.json"
+        if not state_path.exists():
+            return None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read snapshot state: {e}", file=sys.stderr)
+            return None
+
+        if state.get("version") != self.SNAPSHOT_VERSION or state.get("embedding_model") != self.embedding_key:
+            return None
+        return state
+
+    def _build_enhanced_text(self, resume: str, meta: Dict[str, Any]) -> str:
+        """Combine extracted metadata with the resume text for embedding."""
+        # Process skills safely
+        clean_skills = self._extract_skills(meta.get('skills', []))
+
+        # Get other metadata safely
+        name = str(meta.get('name', 'Unknown'))
+        experience_years = meta.get('experience_years', 0)
+        if not isinstance(experience_years, (int, float)):
+            experience_years = 0
+
+        summary = str(meta.get('summary', ''))
+
+        # Create enhanced text for better search
+        return (
+            f"Candidate Profile:\n"
+            f"Name: {name}\n"
+            f"Skills: {', '.join(clean_skills)}\n"
+            f"Experience: {experience_years} years\n"
+            f"Summary: {summary}\n\n"
+            f"Resume Content:\n{resume[:3000]}"
+        )
+
+    def build_index(self) -> bool:
+        """
+        Build FAISS vector index for semantic search.
+
+        Returns:
+            bool: True if index was built successfully, False otherwise
+        """
+        self._require_mode("search", "Resume indexing")
+        enhanced_texts: List[str] = []
+        faiss_ids: List[int] = []
+
+        for record in self.store:
+            enhanced_texts.append(self._build_enhanced_text(record.text, record.metadata))
+            faiss_ids.append(record.row)
 
         if not enhanced_texts:
             print("❌ No valid resume texts to index")
             return False
 
         try:
-            # Create embeddings
-            embeddings = self.embedding_model.encode(
-                enhanced_texts,
-                show_progress_bar=True
-            ).astype('float32')
+            # Create embeddings, reusing stored vectors for unchanged texts
+            with self.telemetry.span("embedding") as span:
+                span.set(resumes=len(enhanced_texts))
+                embeddings = self._encode_documents(enhanced_texts)
 
             # Normalize embeddings
             faiss.normalize_L2(embeddings)
 
-            # Build FAISS index
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.index.add(embeddings)
+            # Build FAISS index (approximate above ann_threshold resumes)
+            with self.telemetry.span("index_build") as span:
+                self.index = self._new_index(embeddings)
+                self.index.add_with_ids(embeddings, np.array(faiss_ids, dtype='int64'))
+                span.set(resumes=len(faiss_ids), kind=index_kind(self.index))
+            self._index_is_mmapped = False
+            self._index_tombstones.clear()
 
             if not self.quiet:
                 print(f"✅ Indexed {len(enhanced_texts)} resumes", file=sys.stderr)
@@ -261,65 +1419,238 @@ Important: Only return valid JSON, no additional text.
             print(f"❌ Error building index: {e}")
             return False
 
-    def search_resumes(self, project_description: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def _encode_documents(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, only running the model for texts missing from the embedding store.
+
+        Misses go through the backend's token-trimmed, length-bucketed pipeline.
+
+        Args:
+            texts (List[str]): Texts to encode
+
+        Returns:
+            np.ndarray: (len(texts), embedding_dim) float32 embeddings in input order
+        """
+        if self.embedding_store is None:
+            return self.embedding_backend.encode_documents(texts)
+
+        text_hashes = [hash_text(text) for text in texts]
+        embeddings, missing = self.embedding_store.get_many(text_hashes)
+        self._count_cache("embeddings", len(texts) - len(missing), len(missing))
+        if missing:
+            if not self.quiet:
+                print(f"Encoding {len(missing)} new resumes ({len(texts) - len(missing)} cached)", file=sys.stderr)
+            encoded = self.embedding_backend.encode_documents([texts[i] for i in missing])
+            embeddings[missing] = encoded
+            try:
+                self.embedding_store.put_many([text_hashes[i] for i in missing], encoded)
+            except Exception as e:
+                print(f"⚠️ Could not store embeddings: {e}", file=sys.stderr)
+        return embeddings
+
+    def search_resumes(self, project_description: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None,
+                       folder: Optional[str] = None, include_text: bool = False) -> List[Dict[str, Any]]:
         """
         Search for resumes matching a project description.
 
         Args:
             project_description (str): Description of the project requirements
             top_k (int): Number of top candidates to return
+            filters (Optional[Dict[str, Any]]): Hard constraints; see search_resumes_batch
+            folder (Optional[str]): Restrict the search to a folder added with sync_folder
+            include_text (bool): Also include each resume's full text; see search_resumes_batch
 
         Returns:
             List[Dict[str, Any]]: List of matching candidates with scores and metadata
         """
+        return self.search_resumes_batch([project_description], top_k=top_k, filters=filters, folder=folder,
+                                         include_text=include_text)[0]
+
+    def search_resumes_batch(self, project_descriptions: List[str], top_k: int = 5,
+                             filters: Optional[Dict[str, Any]] = None, folder: Optional[str] = None,
+                             include_text: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Search for resumes matching several project descriptions at once.
+
+        All uncached descriptions are encoded in a single batch and the index
+        is searched once with the whole query matrix.
+
+        Filters are hard constraints applied before the vector search: only
+        resumes satisfying all of them are searched, so results are not cut
+        short when the best semantic matches fail a constraint. Supported keys:
+        "min_experience_years" (number), "min_degree" ("bachelor", "master" or
+        "phd") and "required_skills" (a skill or list of skills).
+
+        Results carry the resume's "id" and an "excerpt" of its text; the full
+        text is only read when include_text is set (or later, with
+        get_resume_text), re-extracting it from the PDF when the stored text
+        was cut at text_char_budget.
+
+        Args:
+            project_descriptions (List[str]): Descriptions of the project requirements
+            top_k (int): Number of top candidates to return per project
+            filters (Optional[Dict[str, Any]]): Hard constraints shared by all queries
+            folder (Optional[str]): Restrict the search to a folder added with sync_folder;
+                results then carry that folder's file names and paths
+            include_text (bool): Add each resume's full text to its result under "text"
+                (see get_resume_text)
+
+        Returns:
+            List[List[Dict[str, Any]]]: Matching candidates per project, in input order
+
+        Raises:
+            ValueError: If filters contains an unknown key or degree level
+        """
+        self._require_mode("search", "Search")
+        with self.telemetry.span("search", filtered=bool(filters), folder=folder is not None) as span:
+            results = self._search_batch(project_descriptions, top_k, filters, folder, include_text)
+            span.set(queries=len(project_descriptions), top_k=top_k, results=sum(len(r) for r in results))
+        return results
+
+    def _search_batch(self, project_descriptions: List[str], top_k: int, filters: Optional[Dict[str, Any]],
+                      folder: Optional[str], include_text: bool) -> List[List[Dict[str, Any]]]:
         if not self.index:
             if not self.quiet:
                 print("❌ Index not built. Please process resumes first.", file=sys.stderr)
-            return []
-
-        # Create search query
-        query = f"Project Requirements:\n{project_description}\nLooking for relevant candidates."
+            return [[] for _ in project_descriptions]
 
-        # Get query embedding
-        query_embedding = self.embedding_model.encode([query]).astype('float32')
-        faiss.normalize_L2(query_embedding)
-
-        # Search index
-        scores, indices = self.index.search(query_embedding, top_k * 2)
+        if not project_descriptions:
+            return []
 
-        # Re-rank results using metadata
-        candidates_to_rerank = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0:
-                continue
+        folder_paths = None
+        if folder is not None:
+            folder_paths = self.folder_members.get(self._folder_key(folder))
+            if folder_paths is None:
+                print(f"❌ Folder {folder} has not been synced", file=sys.stderr)
+                return [[] for _ in project_descriptions]
+
+        # Get query embeddings
+        query_embeddings = self._encode_queries(project_descriptions)
+
+        # Search index; exact indexes are scanned in full so every resume gets a combined score
+        exact = self._index_is_exact()
+        pool_size = self.index.ntotal if exact else max(top_k * 2, self.ANN_CANDIDATE_POOL)
+        selector = None
+        if filters or folder_paths is not None or self._index_tombstones:
+            # Filters resolve to live rows only, so this also hides tombstoned rows
+            allowed = self._allowed_ids(filters or {})
+            if folder_paths is not None:
+                allowed = np.intersect1d(allowed, np.fromiter(folder_paths, dtype='int64'), assume_unique=True)
+            if not len(allowed):
+                return [[] for _ in project_descriptions]
+            if not exact and len(allowed) <= self.EXACT_SUBSET_SEARCH_MAX:
+                # A small allowed set (e.g. one project's applicants) is cheaper and exact to score directly
+                scores, indices = self._search_subset(query_embeddings, allowed)
+                return [
+                    self._rerank(description, scores[row], indices[row], top_k, folder_paths, include_text)
+                    for row, description in enumerate(project_descriptions)
+                ]
+            selector = faiss.IDSelectorBatch(allowed)
+            pool_size = min(pool_size, len(allowed))
+        params = search_parameters(self.index, selector, self.hnsw_ef_search, self.ivf_nprobe)
+        scores, indices = self.index.search(query_embeddings, max(1, pool_size), params=params)
+
+        return [
+            self._rerank(description, scores[row], indices[row], top_k, folder_paths, include_text)
+            for row, description in enumerate(project_descriptions)
+        ]
+
+    def _allowed_ids(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Resolve search filters to the FAISS IDs of resumes satisfying all of them."""
+        unknown = set(filters) - set(self.SEARCH_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown search filters: {', '.join(sorted(unknown))}")
+
+        required_skills = filters.get("required_skills")
+        if isinstance(required_skills, str):
+            required_skills = [required_skills]
+
+        return self.metadata_index.allowed_rows(
+            min_experience_years=filters.get("min_experience_years"),
+            min_degree=filters.get("min_degree"),
+            required_skills=required_skills
+        )
+
+    def _index_is_exact(self) -> bool:
+        """True if the index is a brute-force flat index (full scans cost no more than top-k)."""
+        return index_kind(self.index) == "flat"
+
+    def _search_subset(self, query_embeddings: np.ndarray, allowed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact inner-product scores of every allowed row, best first, shaped like Index.search output."""
+        vectors = np.vstack([self.index.reconstruct(int(row)) for row in allowed])
+        scores = query_embeddings @ vectors.T
+        order = np.argsort(-scores, axis=1, kind="stable")
+        return np.take_along_axis(scores, order, axis=1), allowed[order]
+
+    def _encode_queries(self, project_descriptions: List[str]) -> np.ndarray:
+        """
+        Get normalized query embeddings, encoding only descriptions missing from the LRU cache.
 
-            path = self.file_paths[idx]
-            file_id = self._get_file_id_by_path(path)
+        Args:
+            project_descriptions (List[str]): Descriptions of the project requirements
 
-            if file_id is None:
-                continue
+        Returns:
+            np.ndarray: (len(project_descriptions), embedding_dim) float32 embeddings
+        """
+        keys = [" ".join(description.split()) for description in project_descriptions]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._query_cache))
+        self._count_cache("query", len(keys) - len(missing), len(missing))
+
+        if missing:
+            # Create search queries
+            queries = [f"Project Requirements:\n{key}\nLooking for relevant candidates." for key in missing]
+            encoded = self.embedding_backend.encode(queries)
+            faiss.normalize_L2(encoded)
+            for key, embedding in zip(missing, encoded):
+                self._query_cache[key] = embedding
+
+        embeddings = np.empty((len(keys), self.embedding_dim), dtype='float32')
+        for row, key in enumerate(keys):
+            self._query_cache.move_to_end(key)
+            embeddings[row] = self._query_cache[key]
+
+        while len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
+        return embeddings
+
+    def _rerank(self, project_description: str, scores: np.ndarray, faiss_ids: np.ndarray, top_k: int,
+                folder_paths: Optional[Dict[int, str]] = None, include_text: bool = False) -> List[Dict[str, Any]]:
+        """
+        Re-rank one query's FAISS hits using metadata and build the result dicts.
 
-            metadata = self.resume_metadata[file_id]["metadata"]
-            metadata_score = self.calculate_metadata_similarity(project_description, metadata)
+        folder_paths maps row IDs to the searched folder's copy of each PDF (shared-index mode).
+        """
+        valid = faiss_ids >= 0
+        scores, faiss_ids = scores[valid], faiss_ids[valid]
+        metadata_scores = self.metadata_index.scores(project_description)
 
-            # Combined score: 60% semantic similarity + 40% metadata similarity
-            combined_score = (score * 0.6) + (metadata_score * 0.4)
-            candidates_to_rerank.append((combined_score, idx, file_id))
+        # Combined score: 60% semantic similarity + 40% metadata similarity
+        combined_scores = (scores * 0.6) + (metadata_scores[faiss_ids] * 0.4)
 
-        # Sort by combined score
-        candidates_to_rerank.sort(key=lambda x: x[0], reverse=True)
+        # Sort by combined score (stable, so ties keep FAISS order)
+        order = np.argsort(-combined_scores, kind="stable")
 
         # Return top candidates
         results = []
-        for score, idx, file_id in candidates_to_rerank[:top_k]:
-            results.append({
-                "id": file_id,
+        for position in order:
+            if len(results) == top_k:
+                break
+            record = self.store.get(int(faiss_ids[position]))
+            if record is None:
+                continue
+            score = combined_scores[position]
+            file_path = folder_paths[record.row] if folder_paths is not None else record.file_path
+            result = {
+                "id": record.resume_id,
                 "score": float(score),
-                "file_name": self.resume_metadata[file_id]["file_name"],
-                "file_path": self.resume_metadata[file_id]["file_path"],
-                "text": self.resumes[idx],
-                "metadata": self.resume_metadata[file_id]["metadata"]
-            })
+                "file_name": Path(file_path).name,
+                "file_path": file_path,
+                "excerpt": record.excerpt(self.RESULT_EXCERPT_CHARS),
+                "metadata": record.metadata
+            }
+            if include_text:
+                result["text"] = self._full_text(record, file_path)
+            results.append(result)
 
         return results
 
@@ -334,44 +1665,96 @@ Important: Only return valid JSON, no additional text.
         Returns:
             float: Similarity score between 0 and 1
         """
+        return self._metadata_matches(project_description, metadata)["score"]
+
+    def _metadata_matches(self, project_description: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """The metadata overlaps behind calculate_metadata_similarity, with the resulting score."""
         score = 0.0
         project_desc_lower = project_description.lower()
 
         # Skills matching
         skills = self._extract_skills(metadata.get("skills", []))
-        skill_matches = sum(1 for skill in skills if skill.lower() in project_desc_lower)
-        score += min(0.4, skill_matches * 0.05)
+        matched_skills = [skill for skill in skills if skill.lower() in project_desc_lower]
+        score += min(0.4, len(matched_skills) * 0.05)
 
         # Experience level matching
         experience_years = metadata.get("experience_years", 0)
         if not isinstance(experience_years, (int, float)):
             experience_years = 0
 
+        experience_level = None
         if "senior" in project_desc_lower and experience_years >= 5:
-            score += 0.2
+            experience_level = "senior"
         elif "junior" in project_desc_lower and experience_years < 5:
+            experience_level = "junior"
+        if experience_level:
             score += 0.2
 
         # Education matching
+        matched_education = []
         education = self._extract_list_items(metadata.get("education", []))
         for degree in education:
             degree_lower = degree.lower()
             if "phd" in project_desc_lower and "phd" in degree_lower:
                 score += 0.1
+                matched_education.append(degree)
             elif "master" in project_desc_lower and "master" in degree_lower:
                 score += 0.1
+                matched_education.append(degree)
 
         # Job title matching
         job_titles = self._extract_list_items(metadata.get("job_titles", []))
-        for title in job_titles:
-            if title.lower() in project_desc_lower:
-                score += 0.05
+        matched_titles = [title for title in job_titles if title.lower() in project_desc_lower]
+        score += 0.05 * len(matched_titles)
+
+        return {
+            "skills": matched_skills,
+            "experience_years": experience_years,
+            "experience_level": experience_level,
+            "education": matched_education,
+            "job_titles": matched_titles,
+            "score": min(1.0, score)
+        }
+
+    def generate_candidate_summary(self, project_description: str, candidate_info: Dict[str, Any],
+                                   fast: bool = False) -> Dict[str, Any]:
+        """
+        Generate a summary of why a candidate matches the project.
 
-        return min(1.0, score)
+        LLM summaries are cached by project description and resume, so
+        re-opening a shortlist does not call Mistral again.
 
-    def generate_candidate_summary(self, project_description: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
+        Args:
+            project_description (str): Project description
+            candidate_info (Dict[str, Any]): Candidate information
+            fast (bool): Build the reasons locally from metadata matches instead of calling the LLM
+
+        Returns:
+            Dict[str, Any]: Summary with name, skills, reasons, and score
         """
-        Generate a summary of why a candidate matches the project.
+        self._require_mode("search", "Candidate summaries")
+        if fast:
+            return self.fast_candidate_summary(project_description, candidate_info)
+
+        cached = self._get_cached_summary(project_description, candidate_info)
+        self._count_cache("summary", int(cached is not None), int(cached is None))
+        if cached is not None:
+            return cached
+
+        try:
+            response = self._llm_complete("summary", self._summary_request(project_description, candidate_info))
+            summary = self._parse_summary(response)
+        except Exception as e:
+            return self._summary_error(candidate_info, e)
+        self._cache_summary(project_description, candidate_info, summary)
+        return summary
+
+    def fast_candidate_summary(self, project_description: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize a candidate without the LLM.
+
+        The reasons come from the skills, experience level, degrees and job
+        titles that calculate_metadata_similarity matched against the project.
 
         Args:
             project_description (str): Project description
@@ -381,6 +1764,119 @@ Important: Only return valid JSON, no additional text.
             Dict[str, Any]: Summary with name, skills, reasons, and score
         """
         metadata = candidate_info.get("metadata", {})
+        matches = self._metadata_matches(project_description, metadata)
+
+        reasons = []
+        if matches["skills"]:
+            reasons.append(f"Has skills the project asks for: {', '.join(matches['skills'][:5])}")
+        if matches["experience_level"]:
+            reasons.append(f"{matches['experience_years']:g} years of experience suits a "
+                           f"{matches['experience_level']} role")
+        if matches["education"]:
+            reasons.append(f"Relevant education: {matches['education'][0]}")
+        if matches["job_titles"]:
+            reasons.append(f"Has worked as {', '.join(matches['job_titles'][:3])}")
+        if not reasons:
+            reasons.append("Resume content closely matches the project description")
+
+        skills = self._extract_skills(metadata.get("skills", []))
+        return {
+            "name": metadata.get("name", Path(candidate_info['file_name']).stem),
+            "skills": list(dict.fromkeys(matches["skills"] + skills))[:5],
+            "reasons": reasons,
+            "score": candidate_info.get("score", 0)
+        }
+
+    def generate_candidate_summaries(self, project_description: str, candidates: List[Dict[str, Any]],
+                                     fast: bool = False) -> List[Dict[str, Any]]:
+        """
+        Generate summaries for several candidates concurrently.
+
+        Args:
+            project_description (str): Project description
+            candidates (List[Dict[str, Any]]): Candidates returned by search_resumes
+            fast (bool): Build the reasons locally instead of calling the LLM
+
+        Returns:
+            List[Dict[str, Any]]: Summaries in the same order as candidates
+        """
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(candidates)
+        with self.telemetry.span("summaries", fast=fast) as span:
+            span.set(candidates=len(candidates))
+            for index, summary in self.iter_candidate_summaries(project_description, candidates, fast=fast):
+                summaries[index] = summary
+        return summaries
+
+    def iter_candidate_summaries(self, project_description: str, candidates: List[Dict[str, Any]],
+                                 fast: bool = False) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Generate candidate summaries concurrently, yielding each one as it completes.
+
+        Cached summaries are yielded first; the rest are requested from the
+        LLM, bounded by llm_concurrency and llm_requests_per_second.
+
+        Args:
+            project_description (str): Project description
+            candidates (List[Dict[str, Any]]): Candidates returned by search_resumes
+            fast (bool): Build the reasons locally instead of calling the LLM
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: (index into candidates, summary) in completion order
+        """
+        self._require_mode("search", "Candidate summaries")
+        if fast:
+            for index, candidate in enumerate(candidates):
+                yield index, self.fast_candidate_summary(project_description, candidate)
+            return
+
+        misses = []
+        for index, candidate in enumerate(candidates):
+            cached = self._get_cached_summary(project_description, candidate)
+            if cached is None:
+                misses.append(index)
+            else:
+                yield index, cached
+        self._count_cache("summary", len(candidates) - len(misses), len(misses))
+        if not misses:
+            return
+
+        loop = self._get_event_loop()
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        rate_limiter = TokenBucket(self.llm_requests_per_second)
+
+        async def summarize(index: int, candidate_info: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    response = await call_with_retries(
+                        lambda: self._llm_complete_async(
+                            "summary", self._summary_request(project_description, candidate_info)
+                        ),
+                        rate_limiter=rate_limiter
+                    )
+                    summary = self._parse_summary(response)
+                except Exception as e:
+                    return index, self._summary_error(candidate_info, e)
+                self._cache_summary(project_description, candidate_info, summary)
+                return index, summary
+
+        pending = {loop.create_task(summarize(i, candidates[i])) for i in misses}
+        try:
+            while pending:
+                done, pending = loop.run_until_complete(
+                    asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # The consumer stopped early; don't leave requests running on the shared loop
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    def _summary_request(self, project_description: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the chat.complete arguments for a candidate summary."""
+        metadata = candidate_info.get("metadata", {})
         name = metadata.get("name", Path(candidate_info['file_name']).stem)
 
         # Extract information safely
@@ -393,9 +1889,9 @@ Important: Only return valid JSON, no additional text.
             experience_years = 0
 
         # Get resume excerpt
-        excerpt = candidate_info.get('text', '')
-        if isinstance(excerpt, str) and len(excerpt) > 1500:
-            excerpt = excerpt[:1500] + "..."
+        excerpt = candidate_info.get('text') or candidate_info.get('excerpt', '')
+        if isinstance(excerpt, str) and len(excerpt) > self.RESULT_EXCERPT_CHARS + 3:
+            excerpt = excerpt[:self.RESULT_EXCERPT_CHARS] + "..."
 
         # Generate summary using LLM
         prompt = f"""
@@ -427,41 +1923,135 @@ This candidate has been SELECTED as a top match for the project. Analyze why thi
 
 Focus on strengths, relevant experience, matching skills, and why they would be successful in this project.
 """
-
+        return {
+            "model": self.LLM_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _summary_key(self, project_description: str, candidate_info: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """(project hash, resume hash) identifying a summary, or None if the resume cannot be identified."""
+        record = self.store.get_by_id(candidate_info["id"]) if candidate_info.get("id") else None
+        if record is not None:
+            resume_hash = record.content_hash or hash_text(record.text)
+        elif candidate_info.get("text") or candidate_info.get("excerpt"):
+            resume_hash = hash_text(candidate_info.get("text") or candidate_info["excerpt"])
+        else:
+            return None
+        return hash_text(" ".join(project_description.split())), resume_hash
+
+    def _get_cached_summary(self, project_description: str, candidate_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = self._summary_key(project_description, candidate_info) if self.summary_cache is not None else None
+        if key is None:
+            return None
         try:
-            response = self.mistral_client.chat.complete(
-                model="mistral-small-latest",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-
-            result = json.loads(response.choices[0].message.content)
-            result.setdefault("reasons", [])
-            result.setdefault("skills", [])
-            return result
-
+            summary = self.summary_cache.get(*key, self.SUMMARY_PROMPT_VERSION, self.LLM_MODEL)
         except Exception as e:
-            print(f"Error generating summary: {e}")
-            return {
-                "name": name,
-                "skills": skills,
-                "reasons": [f"Error generating summary: {str(e)}"],
-                "score": candidate_info.get('score', 0),
-                "error": str(e)
-            }
+            print(f"⚠️ Summary cache unavailable: {e}", file=sys.stderr)
+            return None
+        if summary is not None:
+            # The ranking score can change as the pool grows; the reasons stay
+            summary["score"] = candidate_info.get("score", summary.get("score", 0))
+        return summary
+
+    def _cache_summary(self, project_description: str, candidate_info: Dict[str, Any], summary: Dict[str, Any]):
+        key = self._summary_key(project_description, candidate_info) if self.summary_cache is not None else None
+        if key is None:
+            return
+        try:
+            self.summary_cache.put(*key, self.SUMMARY_PROMPT_VERSION, self.LLM_MODEL, summary)
+        except Exception as e:
+            print(f"⚠️ Could not cache summary: {e}", file=sys.stderr)
+
+    def _parse_summary(self, response) -> Dict[str, Any]:
+        result = json.loads(response.choices[0].message.content)
+        result.setdefault("reasons", [])
+        result.setdefault("skills", [])
+        return result
+
+    def _summary_error(self, candidate_info: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Summary returned when the LLM call fails."""
+        self.telemetry.count("llm_errors", kind="summary")
+        print(f"Error generating summary: {error}", file=sys.stderr)
+        metadata = candidate_info.get("metadata", {})
+        return {
+            "name": metadata.get("name", Path(candidate_info['file_name']).stem),
+            "skills": self._extract_skills(metadata.get('skills', []))[:5],
+            "reasons": [f"Error generating summary: {str(error)}"],
+            "score": candidate_info.get('score', 0),
+            "error": str(error)
+        }
 
     def get_resume_count(self) -> int:
         """Get the number of processed resumes."""
-        return len(self.resumes)
+        return len(self.store)
 
     def is_ready(self) -> bool:
         """Check if the system is ready for searching."""
-        return self.index is not None and len(self.resumes) > 0
+        return self.index is not None and len(self.store) > 0
 
     def get_resume_metadata(self, resume_id: str) -> Dict[str, Any]:
         """Get metadata for a specific resume by ID."""
-        return self.resume_metadata.get(resume_id, {})
+        record = self.store.get_by_id(resume_id)
+        if record is None:
+            return {}
+        return {
+            "file_name": record.file_name,
+            "file_path": record.file_path,
+            "content_hash": record.content_hash,
+            "text": record.excerpt(2000),
+            "metadata": record.metadata
+        }
+
+    def get_resume_text(self, resume_id: str) -> Optional[str]:
+        """
+        Get the full extracted text of a resume by ID (e.g. a search result's "id").
+
+        The store only holds the first text_char_budget characters of each
+        resume. When a stored text reaches the budget, the PDF is parsed again
+        without one (cached like any extraction). If the file is gone or its
+        content changed, the stored (possibly truncated) text is returned.
+
+        Args:
+            resume_id (str): Resume ID
+
+        Returns:
+            Optional[str]: Full text, or None if the ID is unknown
+        """
+        record = self.store.get_by_id(resume_id)
+        return self._full_text(record) if record is not None else None
+
+    def _full_text(self, record: ResumeRecord, file_path: Optional[str] = None) -> str:
+        """A record's text, re-extracted without the character budget if the stored text was cut."""
+        text = record.text
+        if self.text_char_budget is None or len(text) < self.text_char_budget:
+            return text
+
+        file_path = file_path or record.file_path
+        settings = dict(self.PDF_EXTRACTION_SETTINGS)
+        try:
+            if record.content_hash and hash_file(file_path) != record.content_hash:
+                return text
+        except OSError:
+            return text
+        if self.text_cache is not None and record.content_hash:
+            try:
+                cached = self.text_cache.get(record.content_hash, settings)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                print(f"⚠️ Text cache unavailable for {file_path}: {e}", file=sys.stderr)
+
+        full_text = extract_pdf(file_path, self.PDF_EXTRACTION_SETTINGS).text
+        if not full_text:
+            return text
+        if self.text_cache is not None and record.content_hash:
+            try:
+                self.text_cache.put(record.content_hash, settings, full_text)
+            except Exception as e:
+                print(f"⚠️ Could not cache text for {file_path}: {e}", file=sys.stderr)
+        return full_text
 
     def _extract_skills(self, skills_raw) -> List[str]:
         """Safely extract skills from various formats."""
@@ -524,12 +2114,10 @@ Focus on strengths, relevant experience, matching skills, and why they would be
 
         return clean_items
 
-    def _get_file_id_by_path(self, file_path: str) -> str:
+    def _get_file_id_by_path(self, file_path: str) -> Optional[str]:
         """Get file ID by file path."""
-        for file_id, metadata in self.resume_metadata.items():
-            if metadata["file_path"] == file_path:
-                return file_id
-        return None
+        record = self.store.get_by_path(file_path)
+        return record.resume_id if record is not None else None
 
 
 # Example usage:
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Long-lived HTTP worker for the resume selector.
+
+Loading torch, faiss, pdfplumber and the embedding model takes several
+seconds, so instead of spawning a fresh interpreter per shortlist request
+this worker keeps a single ResumeSelector warm and serves a small JSON API
+on localhost:
+
+    GET  /health            -> {"status": "ok", ...}
+    POST /shortlist         -> {"success": true, "candidates": [...]}
+    POST /shortlist/stream  -> NDJSON events: one "ranking" event (with
+                               quick local reasons), one "summary" event per
+                               candidate as its LLM summary completes, then
+                               "done" (or "error")
+
+Send "fast": true with either request to skip the LLM and get the local
+reasons only.
+
+Usage:
+    python scripts/resume_selector_worker.py --host 127.0.0.1 --port 8765
+"""
+import os
+import sys
+import json
+import argparse
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+warnings.filterwarnings("ignore")
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+os.environ.setdefault('HF_HUB_DISABLE_SYMLINKS_WARNING', '1')
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from resume_selector_main_class import ResumeSelector, DEFAULT_EMBEDDING_BACKEND
+from embedding_backends import EMBEDDING_BACKENDS
+from vector_index import ANN_THRESHOLD, HNSW_EF_SEARCH, INDEX_TYPES, IVF_NPROBE
+
+
+def folder_fingerprint(folder_path: str) -> Tuple:
+    """
+    Build a cheap fingerprint of the PDFs in a folder.
+
+    Args:
+        folder_path (str): Path to folder containing PDF resumes
+
+    Returns:
+        Tuple: Sorted (name, size, mtime) entries for every PDF in the folder
+    """
+    entries = []
+    for pdf_file in Path(folder_path).glob("*.pdf"):
+        stat = pdf_file.stat()
+        entries.append((pdf_file.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(entries))
+
+
+def candidate_result(candidate: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine a search hit and its summary into the shortlist payload format."""
+    return {
+        "file_name": candidate["file_name"],
+        "file_path": candidate["file_path"],
+        "score": candidate["score"],
+        "name": summary.get("name", "Unknown"),
+        "skills": summary.get("skills", []),
+        "reasons": summary.get("reasons", []),
+        "metadata": candidate.get("metadata", {})
+    }
+
+
+class ResumeSelectorWorker:
+    """
+    Keeps one ResumeSelector with the institution-wide shared index warm.
+
+    Every requested folder is synced into the same content-deduplicated
+    index, so a resume copied into several project folders is parsed,
+    annotated and embedded once; searches are restricted to the requested
+    folder's resumes.
+
+    ResumeSelector is not thread-safe, so all selector work is serialized
+    behind a lock; health checks do not take the lock.
+    """
+
+    def __init__(self, selector: ResumeSelector):
+        self.selector = selector
+        self.lock = threading.Lock()
+        self.current_folder: Optional[str] = None
+        self.fingerprints: Dict[str, Tuple] = {}
+        self.selector.load_shared_index()
+
+    def _ensure_folder(self, folder_path: str) -> bool:
+        """Sync the folder into the shared index unless it is unchanged since the last sync."""
+        folder = str(Path(folder_path).resolve())
+        if not Path(folder).exists():
+            return False
+
+        fingerprint = folder_fingerprint(folder)
+        if self.fingerprints.get(folder) == fingerprint and self.selector.is_ready():
+            print(f"Reusing warm index for {folder}", file=sys.stderr)
+            self.current_folder = folder
+            return True
+
+        self.fingerprints.pop(folder, None)
+        if not self.selector.sync_folder(folder):
+            return False
+
+        self.current_folder = folder
+        self.fingerprints[folder] = fingerprint
+        return True
+
+    def shortlist(self, folder_path: str, project_description: str, top_k: int = 3,
+                  filters: Optional[Dict[str, Any]] = None, fast: bool = False) -> Dict[str, Any]:
+        """
+        Shortlist candidates for a project from the resumes in a folder.
+
+        Args:
+            folder_path (str): Path to folder containing PDF resumes
+            project_description (str): Description of the project requirements
+            top_k (int): Number of top candidates to return
+            filters (Optional[Dict[str, Any]]): Hard constraints for ResumeSelector.search_resumes
+            fast (bool): Explain matches from metadata instead of LLM summaries
+
+        Returns:
+            Dict[str, Any]: Same payload the spawned shortlist script prints
+        """
+        with self.lock:
+            if not self._ensure_folder(folder_path):
+                return {"error": "Failed to process resumes"}
+
+            candidates = self.selector.search_resumes(project_description, top_k=top_k, filters=filters,
+                                                      folder=folder_path)
+            if not candidates:
+                return {"error": "No suitable candidates found"}
+
+            print(f"Analyzing {len(candidates)} candidates...", file=sys.stderr)
+            summaries = self.selector.generate_candidate_summaries(project_description, candidates, fast=fast)
+            results = [candidate_result(candidate, summary) for candidate, summary in zip(candidates, summaries)]
+
+            return {"success": True, "candidates": results}
+
+    def iter_shortlist_events(self, folder_path: str, project_description: str, top_k: int = 3,
+                              filters: Optional[Dict[str, Any]] = None,
+                              fast: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Shortlist candidates, yielding progress events as they become available.
+
+        The ranking is yielded as soon as the search finishes, before any LLM
+        summary is requested, with reasons built locally from metadata matches
+        so they can be shown right away; summaries follow in completion order.
+
+        Args:
+            folder_path (str): Path to folder containing PDF resumes
+            project_description (str): Description of the project requirements
+            top_k (int): Number of top candidates to return
+            filters (Optional[Dict[str, Any]]): Hard constraints for ResumeSelector.search_resumes
+            fast (bool): Send the local reasons as the summaries instead of calling the LLM
+
+        Yields:
+            Dict[str, Any]: "ranking", "summary", "done" or "error" events
+        """
+        with self.lock:
+            if not self._ensure_folder(folder_path):
+                yield {"event": "error", "error": "Failed to process resumes"}
+                return
+
+            candidates = self.selector.search_resumes(project_description, top_k=top_k, filters=filters,
+                                                      folder=folder_path)
+            if not candidates:
+                yield {"event": "error", "error": "No suitable candidates found"}
+                return
+
+            yield {
+                "event": "ranking",
+                "candidates": [
+                    candidate_result(candidate, self.selector.fast_candidate_summary(project_description, candidate))
+                    for candidate in candidates
+                ]
+            }
+
+            for index, summary in self.selector.iter_candidate_summaries(project_description, candidates,
+                                                                         fast=fast):
+                yield {"event": "summary", "index": index, "candidate": candidate_result(candidates[index], summary)}
+
+            yield {"event": "done"}
+
+    def health(self) -> Dict[str, Any]:
+        """Report worker status without blocking on in-flight requests."""
+        return {
+            "status": "ok",
+            "ready": self.selector.is_ready(),
+            "resume_count": self.selector.get_resume_count(),
+            "folder": self.current_folder,
+            "synced_folders": len(self.fingerprints),
+            "telemetry": self.selector.telemetry.snapshot() if self.selector.telemetry.enabled else None
+        }
+
+
+class WorkerRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler bound to a ResumeSelectorWorker."""
+
+    worker: ResumeSelectorWorker = None
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(self.worker.health())
+        else:
+            self._send_json({"error": "Not found"}, status=404)
+
+    def _send_ndjson(self, events: Iterator[Dict[str, Any]]):
+        # HTTP/1.0 response without Content-Length: the body ends when the connection closes
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            for event in events:
+                self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+                self.wfile.flush()
+        except Exception as e:
+            print(f"❌ Error streaming shortlist events: {e}", file=sys.stderr)
+            try:
+                self.wfile.write((json.dumps({"event": "error", "error": str(e)}) + "\n").encode("utf-8"))
+            except OSError:
+                pass
+        finally:
+            if hasattr(events, "close"):
+                events.close()
+
+    def do_POST(self):
+        if self.path not in ("/shortlist", "/shortlist/stream"):
+            self._send_json({"error": "Not found"}, status=404)
+            return
+
+        try:
+            body = self._read_json()
+        except (ValueError, UnicodeDecodeError):
+            self._send_json({"error": "Invalid JSON body"}, status=400)
+            return
+
+        folder = body.get("folder")
+        project_description = body.get("project_description")
+        if not folder or not project_description:
+            self._send_json({"error": "folder and project_description are required"}, status=400)
+            return
+
+        try:
+            top_k = int(body.get("top_k", 3))
+        except (TypeError, ValueError):
+            self._send_json({"error": "top_k must be an integer"}, status=400)
+            return
+
+        filters = body.get("filters") or None
+        if filters is not None and (not isinstance(filters, dict) or
+                                    set(filters) - set(ResumeSelector.SEARCH_FILTERS)):
+            self._send_json({
+                "error": f"filters must be an object with keys from: {', '.join(ResumeSelector.SEARCH_FILTERS)}"
+            }, status=400)
+            return
+
+        fast = bool(body.get("fast", False))
+
+        if self.path == "/shortlist/stream":
+            self._send_ndjson(self.worker.iter_shortlist_events(folder, project_description, top_k=top_k,
+                                                                filters=filters, fast=fast))
+            return
+
+        try:
+            result = self.worker.shortlist(folder, project_description, top_k=top_k, filters=filters, fast=fast)
+            self._send_json(result)
+        except ValueError as e:
+            # Invalid filter values (e.g. an unknown degree level)
+            self._send_json({"error": str(e)}, status=400)
+        except Exception as e:
+            print(f"❌ Error handling shortlist request: {e}", file=sys.stderr)
+            self._send_json({"error": str(e)}, status=500)
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} - {format % args}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the resume selector as a long-lived worker")
+    parser.add_argument("--host", default=os.environ.get("RESUME_SELECTOR_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("RESUME_SELECTOR_PORT", "8765")))
+    parser.add_argument("--extraction-workers", type=int,
+                        default=int(os.environ.get("RESUME_SELECTOR_EXTRACTION_WORKERS", os.cpu_count() or 1)),
+                        help="Processes used to parse PDFs (default: CPU count)")
+    parser.add_argument("--llm-concurrency", type=int,
+                        default=int(os.environ.get("RESUME_SELECTOR_LLM_CONCURRENCY", "8")),
+                        help="Maximum concurrent Mistral requests")
+    parser.add_argument("--llm-rps", type=float,
+                        default=float(os.environ.get("RESUME_SELECTOR_LLM_RPS", "5")),
+                        help="Sustained Mistral requests per second (match your API quota)")
+    parser.add_argument("--embedding-backend", choices=EMBEDDING_BACKENDS, default=DEFAULT_EMBEDDING_BACKEND,
+                        help="Embedding backend; 'onnx' runs an int8-quantized model on ONNX Runtime")
+    parser.add_argument("--index-type", choices=INDEX_TYPES,
+                        default=os.environ.get("RESUME_SELECTOR_INDEX_TYPE", "auto"),
+                        help="Vector index; 'auto' switches from exact to HNSW above --ann-threshold resumes")
+    parser.add_argument("--ann-threshold", type=int,
+                        default=int(os.environ.get("RESUME_SELECTOR_ANN_THRESHOLD", ANN_THRESHOLD)))
+    parser.add_argument("--hnsw-ef-search", type=int,
+                        default=int(os.environ.get("RESUME_SELECTOR_HNSW_EF_SEARCH", HNSW_EF_SEARCH)),
+                        help="HNSW search beam width (accuracy vs latency)")
+    parser.add_argument("--ivf-nprobe", type=int,
+                        default=int(os.environ.get("RESUME_SELECTOR_IVF_NPROBE", IVF_NPROBE)),
+                        help="IVF lists scanned per query (accuracy vs latency)")
+    args = parser.parse_args()
+
+    api_key = os.environ.get("MISTRAL_API_KEY", "")
+    if not api_key:
+        print("❌ MISTRAL_API_KEY is not set", file=sys.stderr)
+        sys.exit(1)
+
+    print("Initializing AI Resume Selector worker...", file=sys.stderr)
+    WorkerRequestHandler.worker = ResumeSelectorWorker(ResumeSelector(
+        api_key=api_key,
+        quiet=True,
+        extraction_workers=args.extraction_workers,
+        llm_concurrency=args.llm_concurrency,
+        llm_requests_per_second=args.llm_rps,
+        embedding_backend=args.embedding_backend,
+        index_type=args.index_type,
+        ann_threshold=args.ann_threshold,
+        hnsw_ef_search=args.hnsw_ef_search,
+        ivf_nprobe=args.ivf_nprobe
+    ))
+    # Pay the import and model-loading cost at startup rather than on the first request
+    WorkerRequestHandler.worker.selector.warm_up()
+
+    server = ThreadingHTTPServer((args.host, args.port), WorkerRequestHandler)
+    print(f"✅ Resume selector worker listening on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+In-memory resume storage for the resume selector.
+
+Resumes are stored by integer row ID. The row ID doubles as the resume's
+FAISS ID, so a search hit maps straight back to its record, and hash
+indexes give O(1) lookups by resume ID, file path and content hash. Removed rows
+become tombstones and are never reused, which keeps IDs stable for the
+lifetime of the index.
+
+Full resume texts are not kept as Python strings: they are appended to a
+single file-backed TextBlob and read back through a memory map on demand,
+so a worker holding thousands of resumes only keeps the offset table
+resident.
+"""
+import mmap
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class TextBlob:
+    """
+    Append-only UTF-8 text storage in one file, read through a memory map.
+
+    Each text is addressed by its (offset, length) span in bytes. The file is
+    anonymous (deleted when the blob is closed); use save/load to persist it.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory (Optional[str]): Directory for the backing file (default: system temp directory)
+        """
+        self.directory = directory
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._size = 0
+        self._map: Optional[mmap.mmap] = None
+
+    def append(self, text: str) -> Tuple[int, int]:
+        """
+        Store a text.
+
+        Args:
+            text (str): Text to store
+
+        Returns:
+            Tuple[int, int]: (offset, length) span of the encoded text
+        """
+        data = text.encode("utf-8")
+        offset = self._size
+        self._file.seek(offset)
+        self._file.write(data)
+        self._size += len(data)
+        return offset, len(data)
+
+    def read(self, offset: int, length: int) -> str:
+        """Read the text stored at a span."""
+        return self._read_bytes(offset, length).decode("utf-8")
+
+    def excerpt(self, offset: int, length: int, max_chars: int) -> str:
+        """Read at most the first max_chars characters of a text, without decoding the rest."""
+        # A character is at most 4 bytes; a cut multi-byte character at the end is dropped
+        data = self._read_bytes(offset, min(length, max_chars * 4))
+        return data.decode("utf-8", errors="ignore")[:max_chars]
+
+    def _read_bytes(self, offset: int, length: int) -> bytes:
+        if offset + length > self._size:
+            raise ValueError(f"Span ({offset}, {length}) is outside the blob ({self._size} bytes)")
+        if not length:
+            return b""
+        if self._map is None or len(self._map) < offset + length:
+            # Remap to cover everything appended since the last read
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    def save(self, path: str):
+        """Copy the blob to a file."""
+        self._file.flush()
+        self._file.seek(0)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(self._file, f)
+
+    def load(self, path: str):
+        """Replace the blob's contents with a file written by save; spans into that file stay valid."""
+        self.clear()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self._file)
+        self._size = self._file.tell()
+
+    def clear(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.seek(0)
+        self._file.truncate()
+        self._size = 0
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Size of the blob in bytes."""
+        return self._size
+
+
+class ResumeRecord:
+    """One stored resume; its text is read from the store's TextBlob when accessed."""
+
+    __slots__ = ("row", "resume_id", "file_name", "file_path", "content_hash", "text_offset", "text_length",
+                 "metadata", "_blob")
+
+    def __init__(self, row: int, resume_id: str, file_path: str, content_hash: Optional[str],
+                 text_span: Tuple[int, int], metadata: Dict[str, Any], blob: TextBlob,
+                 file_name: Optional[str] = None):
+        self.row = row
+        self.resume_id = resume_id
+        self.file_path = file_path
+        self.file_name = file_name or Path(file_path).name
+        self.content_hash = content_hash
+        self.text_offset, self.text_length = text_span
+        self.metadata = metadata
+        self._blob = blob
+
+    @property
+    def text(self) -> str:
+        """Full extracted text (read from the blob on every access)."""
+        return self._blob.read(self.text_offset, self.text_length)
+
+    def excerpt(self, max_chars: int) -> str:
+        """First max_chars characters of the text, with "..." appended when it was cut."""
+        excerpt = self._blob.excerpt(self.text_offset, self.text_length, max_chars)
+        # More bytes than kept characters means something was cut (kept characters are at least a byte each)
+        if self.text_length > len(excerpt.encode("utf-8")):
+            excerpt += "..."
+        return excerpt
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for snapshots (the text itself is saved with the blob)."""
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != "_blob"}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], blob: TextBlob) -> "ResumeRecord":
+        return cls(
+            row=data["row"],
+            resume_id=data["resume_id"],
+            file_path=data["file_path"],
+            content_hash=data.get("content_hash"),
+            text_span=(data["text_offset"], data["text_length"]),
+            metadata=data["metadata"],
+            blob=blob,
+            file_name=data.get("file_name")
+        )
+
+
+class ResumeStore:
+    """Row-indexed resume records with resume ID, file path and content hash indexes."""
+
+    def __init__(self, text_dir: Optional[str] = None):
+        """
+        Args:
+            text_dir (Optional[str]): Directory for the text blob's backing file (default: system temp directory)
+        """
+        self.texts = TextBlob(text_dir)
+        self._rows: List[Optional[ResumeRecord]] = []
+        self._by_id: Dict[str, int] = {}
+        self._by_path: Dict[str, int] = {}
+        self._by_hash: Dict[str, int] = {}
+
+    def add(self, resume_id: str, file_path: str, content_hash: Optional[str], text: str,
+            metadata: Dict[str, Any]) -> ResumeRecord:
+        """
+        Store a new resume under the next row ID.
+
+        Args:
+            resume_id (str): Stable resume ID (must not already be stored)
+            file_path (str): Path to the PDF resume
+            content_hash (Optional[str]): SHA-256 of the PDF
+            text (str): Extracted resume text
+            metadata (Dict[str, Any]): Extracted resume metadata
+
+        Returns:
+            ResumeRecord: The stored record
+        """
+        if resume_id in self._by_id:
+            raise KeyError(f"Resume {resume_id} already stored")
+        record = ResumeRecord(len(self._rows), resume_id, file_path, content_hash, self.texts.append(text),
+                              metadata, self.texts)
+        self._insert(record)
+        return record
+
+    def restore(self, record: ResumeRecord):
+        """
+        Put back a record with its original row ID (used when loading snapshots).
+
+        The record's text span must point into this store's blob (see load_texts).
+        """
+        if record.row < len(self._rows) and self._rows[record.row] is not None:
+            raise KeyError(f"Row {record.row} already in use")
+        while len(self._rows) <= record.row:
+            self._rows.append(None)
+        self._insert(record)
+
+    def _insert(self, record: ResumeRecord):
+        if record.row == len(self._rows):
+            self._rows.append(record)
+        else:
+            self._rows[record.row] = record
+        self._by_id[record.resume_id] = record.row
+        self._by_path[record.file_path] = record.row
+        if record.content_hash:
+            self._by_hash[record.content_hash] = record.row
+
+    def reserve_rows(self, count: int):
+        """Make sure the next new row ID is at least `count` (keeps snapshot IDs unique)."""
+        while len(self._rows) < count:
+            self._rows.append(None)
+
+    def remove(self, resume_id: str) -> Optional[ResumeRecord]:
+        """Remove a resume by ID, leaving a tombstone at its row; returns the removed record."""
+        row = self._by_id.pop(resume_id, None)
+        if row is None:
+            return None
+        record = self._rows[row]
+        self._rows[row] = None
+        if self._by_path.get(record.file_path) == row:
+            del self._by_path[record.file_path]
+        if record.content_hash and self._by_hash.get(record.content_hash) == row:
+            del self._by_hash[record.content_hash]
+        return record
+
+    def save_texts(self, path: str):
+        """
+        Write the texts of live records to a file, compacting away removed ones first.
+
+        Args:
+            path (str): Destination file
+        """
+        live = sum(record.text_length for record in self)
+        if live < len(self.texts):
+            self._compact_texts()
+        self.texts.save(path)
+
+    def load_texts(self, path: str):
+        """Load a file written by save_texts into the (empty) store's blob."""
+        if self._by_id:
+            raise ValueError("load_texts requires an empty store")
+        self.texts.load(path)
+
+    def _compact_texts(self):
+        """Rewrite the blob with only live records' texts and update their spans."""
+        compacted = TextBlob(self.texts.directory)
+        for record in self:
+            record.text_offset, record.text_length = compacted.append(record.text)
+            record._blob = compacted
+        self.texts.close()
+        self.texts = compacted
+
+    def close(self):
+        """Release the text blob's backing file; the store must not be used afterwards."""
+        self.texts.close()
+
+    def clear(self):
+        self.texts.clear()
+        self._rows.clear()
+        self._by_id.clear()
+        self._by_path.clear()
+        self._by_hash.clear()
+
+    def get(self, row: int) -> Optional[ResumeRecord]:
+        """Get a record by row (FAISS) ID."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def get_by_id(self, resume_id: str) -> Optional[ResumeRecord]:
+        row = self._by_id.get(resume_id)
+        return self._rows[row] if row is not None else None
+
+    def get_by_path(self, file_path: str) -> Optional[ResumeRecord]:
+        row = self._by_path.get(file_path)
+        return self._rows[row] if row is not None else None
+
+    def get_by_hash(self, content_hash: str) -> Optional[ResumeRecord]:
+        row = self._by_hash.get(content_hash)
+        return self._rows[row] if row is not None else None
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[ResumeRecord]:
+        """Iterate over live records in row order."""
+        return (record for record in self._rows if record is not None)
+
+    @property
+    def next_row(self) -> int:
+        return len(self._rows)
@@ -0,0 +1,253 @@
+"""
+Structured timing and resource telemetry for the resume selector.
+
+Telemetry records spans (timed blocks, e.g. one PDF extraction or one LLM
+call) and counters (e.g. cache hits, LLM tokens), each with string labels.
+Two sinks are supported and can be combined:
+
+    jsonl       one JSON object per span and counter update on stderr, each
+                with a "telemetry" key, so a process capturing stderr can
+                separate them from progress output
+    prometheus  a Prometheus text-format file (for node_exporter's textfile
+                collector) with counters and span count / total-seconds
+                summaries, rewritten at most every flush_interval seconds
+                as spans finish, and at exit
+
+Selectors get a disabled Telemetry unless one is passed in or configured
+through RESUME_SELECTOR_TELEMETRY ("jsonl") and
+RESUME_SELECTOR_TELEMETRY_FILE (Prometheus file path).
+"""
+import os
+import sys
+import json
+import time
+import mmap
+import atexit
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    # Windows: memory figures come from psutil when it is installed
+    resource = None
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _psutil_memory():
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info()
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None where neither /proc nor psutil is available)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE
+    except OSError:
+        memory = _psutil_memory()
+        return memory.rss if memory is not None else None
+
+
+def max_rss() -> Optional[int]:
+    """Peak resident set size of this process so far, in bytes (None where it cannot be measured)."""
+    if resource is None:
+        memory = _psutil_memory()
+        # Windows reports the peak working set
+        return getattr(memory, "peak_wset", None) if memory is not None else None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _key(name: str, labels: Dict[str, Any]) -> LabelKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _series(metric: str, labels: Tuple[Tuple[str, str], ...], value: float) -> str:
+    """One Prometheus sample line."""
+    if not labels:
+        return f"{metric} {value}"
+    rendered = ",".join(f'{label}="{_escape_label(text)}"' for label, text in labels)
+    return f"{metric}{{{rendered}}} {value}"
+
+
+class Span:
+    """A timed block; attributes set on it are reported with the span."""
+
+    __slots__ = ("name", "labels", "attributes", "start")
+
+    def __init__(self, name: str, labels: Dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self.attributes: Dict[str, Any] = {}
+        self.start = time.perf_counter()
+
+    def set(self, **attributes: Any):
+        """Attach values (e.g. pages parsed, tokens) to the span."""
+        self.attributes.update(attributes)
+
+
+class Telemetry:
+    """Collects spans and counters and writes them to the configured sinks."""
+
+    def __init__(self, jsonl: bool = False, prometheus_path: Optional[str] = None, stream=None,
+                 flush_interval: float = 5.0):
+        """
+        Args:
+            jsonl (bool): Emit every span and counter update as a JSON line
+            prometheus_path (Optional[str]): Prometheus text file to keep up to date
+            stream: Where JSON lines go (default: sys.stderr)
+            flush_interval (float): Minimum seconds between Prometheus file rewrites
+        """
+        self.jsonl = jsonl
+        self.prometheus_path = prometheus_path
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self._flushed_at = 0.0
+        if prometheus_path:
+            atexit.register(self.flush)
+        self._lock = threading.Lock()
+        self._counters: Dict[LabelKey, float] = {}
+        self._span_counts: Dict[LabelKey, int] = {}
+        self._span_seconds: Dict[LabelKey, float] = {}
+
+    @classmethod
+    def from_env(cls) -> "Telemetry":
+        """Configure from RESUME_SELECTOR_TELEMETRY and RESUME_SELECTOR_TELEMETRY_FILE."""
+        return cls(jsonl=os.environ.get("RESUME_SELECTOR_TELEMETRY", "").lower() == "jsonl",
+                   prometheus_path=os.environ.get("RESUME_SELECTOR_TELEMETRY_FILE") or None)
+
+    @property
+    def enabled(self) -> bool:
+        return self.jsonl or bool(self.prometheus_path)
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[Span]:
+        """
+        Time a block.
+
+        Args:
+            name (str): Span name, e.g. "extract_pdf"
+            **labels: Low-cardinality labels, e.g. kind="metadata"
+
+        Yields:
+            Span: Use span.set(...) to attach per-span values such as page counts
+        """
+        span = Span(name, labels)
+        try:
+            yield span
+        finally:
+            if self.enabled:
+                self._finish(span)
+
+    def _finish(self, span: Span):
+        self.record_span(span.name, time.perf_counter() - span.start, span.attributes, **span.labels)
+
+    def record_span(self, name: str, seconds: float, attributes: Optional[Dict[str, Any]] = None, **labels: Any):
+        """
+        Record a span timed elsewhere (e.g. in a worker process).
+
+        Args:
+            name (str): Span name
+            seconds (float): Duration
+            attributes (Optional[Dict[str, Any]]): Per-span values reported in the JSON line only
+            **labels: Low-cardinality labels
+        """
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._span_counts[key] = self._span_counts.get(key, 0) + 1
+            self._span_seconds[key] = self._span_seconds.get(key, 0.0) + seconds
+        if self.jsonl:
+            rss = current_rss()
+            self._emit({"telemetry": "span", "name": name, "seconds": round(seconds, 6), **labels,
+                        **(attributes or {}), "rss_mb": round(rss / 2 ** 20, 1) if rss else None})
+        if self.prometheus_path and time.monotonic() - self._flushed_at >= self.flush_interval:
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"⚠️ Could not write telemetry file: {e}", file=sys.stderr)
+
+    def count(self, name: str, value: float = 1, **labels: Any):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Counter name, e.g. "cache_hits"
+            value (float): Amount to add
+            **labels: Low-cardinality labels, e.g. cache="metadata"
+        """
+        if not self.enabled or not value:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        if self.jsonl:
+            self._emit({"telemetry": "counter", "name": name, "value": value, **labels})
+
+    def _emit(self, event: Dict[str, Any]):
+        print(json.dumps(event), file=self.stream or sys.stderr, flush=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counter values and span totals, keyed by "name{label=value,...}"."""
+        def render(key: LabelKey) -> str:
+            name, labels = key
+            return name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else "")
+
+        with self._lock:
+            return {
+                "counters": {render(key): value for key, value in self._counters.items()},
+                "spans": {render(key): {"count": self._span_counts[key], "seconds": round(seconds, 6)}
+                          for key, seconds in self._span_seconds.items()}
+            }
+
+    def flush(self):
+        """Rewrite the Prometheus file (atomically) with the current totals; no-op without one."""
+        if not self.prometheus_path:
+            return
+        self._flushed_at = time.monotonic()
+
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                metric = f"resume_selector_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.extend(_series(metric, labels, value)
+                             for (counter, labels), value in sorted(self._counters.items()) if counter == name)
+            for name in sorted({name for name, _ in self._span_counts}):
+                metric = f"resume_selector_{name}_seconds"
+                lines.append(f"# TYPE {metric} summary")
+                for (span, labels), count in sorted(self._span_counts.items()):
+                    if span == name:
+                        lines.append(_series(f"{metric}_count", labels, count))
+                        lines.append(_series(f"{metric}_sum", labels, round(self._span_seconds[(span, labels)], 6)))
+        rss, peak = current_rss(), max_rss()
+        if rss is not None:
+            lines.append("# TYPE resume_selector_resident_memory_bytes gauge")
+            lines.append(f"resume_selector_resident_memory_bytes {rss}")
+        if peak is not None:
+            lines.append("# TYPE resume_selector_peak_resident_memory_bytes gauge")
+            lines.append(f"resume_selector_peak_resident_memory_bytes {peak}")
+
+        directory = os.path.dirname(os.path.abspath(self.prometheus_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".telemetry-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp_path, self.prometheus_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
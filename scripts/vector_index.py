@@ -0,0 +1,133 @@
+"""
+FAISS index construction for resume embeddings.
+
+Three index types are supported, all wrapped in IndexIDMap2 so vectors are
+addressed by resume row ID and can be reconstructed:
+
+    flat  exact inner-product search (IndexFlatIP); every query scans every vector
+    hnsw  graph-based approximate search (IndexHNSWFlat); no training, fast
+          queries, tuned at search time with efSearch; vectors cannot be removed
+    ivf   inverted lists over k-means clusters (IndexIVFFlat); trained on the
+          vectors it is built with, tuned at search time with nprobe
+
+"auto" picks flat below a size threshold and hnsw above it.
+"""
+import math
+from typing import Optional
+
+import numpy as np
+
+from lazy_imports import LazyModule
+
+faiss = LazyModule("faiss")
+
+INDEX_TYPES = ("auto", "flat", "hnsw", "ivf")
+
+# Vectors at which "auto" switches from exact to approximate search
+ANN_THRESHOLD = 20000
+
+# HNSW graph degree and build-time beam width
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+
+# Default search-time accuracy knobs (higher is slower and more accurate)
+HNSW_EF_SEARCH = 64
+IVF_NPROBE = 16
+
+# IVF needs about this many training vectors per list; FAISS warns below 39
+IVF_TRAINING_PER_LIST = 39
+
+
+def choose_index_type(count: int, index_type: str = "auto", threshold: int = ANN_THRESHOLD) -> str:
+    """
+    Resolve "auto" to a concrete index type for a number of vectors.
+
+    Args:
+        count (int): Number of vectors the index will hold
+        index_type (str): One of INDEX_TYPES
+        threshold (int): Vector count at which "auto" switches to hnsw
+
+    Returns:
+        str: "flat", "hnsw" or "ivf"
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"index_type must be one of {', '.join(INDEX_TYPES)}, got {index_type!r}")
+    if index_type != "auto":
+        return index_type
+    return "hnsw" if count >= threshold else "flat"
+
+
+def ivf_list_count(count: int) -> int:
+    """Number of IVF lists for a collection: about 4 * sqrt(n), with enough training vectors per list."""
+    return max(1, min(int(4 * math.sqrt(count)), count // IVF_TRAINING_PER_LIST))
+
+
+def create_index(kind: str, dim: int, training_vectors: Optional[np.ndarray] = None):
+    """
+    Create an empty ID-mapped inner-product index.
+
+    Args:
+        kind (str): "flat", "hnsw" or "ivf"
+        dim (int): Embedding dimension
+        training_vectors (Optional[np.ndarray]): Normalized vectors to train IVF clusters on
+            (required for "ivf", ignored otherwise)
+
+    Returns:
+        faiss.IndexIDMap2: Empty index
+    """
+    if kind == "flat":
+        inner = faiss.IndexFlatIP(dim)
+    elif kind == "hnsw":
+        inner = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        inner.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    elif kind == "ivf":
+        if training_vectors is None or not len(training_vectors):
+            raise ValueError("An IVF index needs training vectors")
+        quantizer = faiss.IndexFlatIP(dim)
+        inner = faiss.IndexIVFFlat(quantizer, dim, ivf_list_count(len(training_vectors)),
+                                   faiss.METRIC_INNER_PRODUCT)
+        inner.train(training_vectors)
+        # IndexIDMap2 needs reconstruct_n for snapshots
+        inner.make_direct_map()
+    else:
+        raise ValueError(f"Unknown index type {kind!r}")
+    return faiss.IndexIDMap2(inner)
+
+
+def index_kind(index) -> str:
+    """"flat", "hnsw" or "ivf" for an index made by create_index (or loaded from disk)."""
+    inner = faiss.downcast_index(index.index) if hasattr(index, "index") else index
+    if isinstance(inner, faiss.IndexFlat):
+        return "flat"
+    if isinstance(inner, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(inner, faiss.IndexIVF):
+        return "ivf"
+    return type(inner).__name__
+
+
+def supports_removal(index) -> bool:
+    """True if vectors can be removed by ID (only the flat index keeps IndexIDMap2's row mapping intact)."""
+    return index_kind(index) == "flat"
+
+
+def search_parameters(index, selector=None, ef_search: int = HNSW_EF_SEARCH, nprobe: int = IVF_NPROBE):
+    """
+    Build search parameters matching the index type.
+
+    Args:
+        index: Index made by create_index
+        selector: Optional faiss.IDSelector restricting the search
+        ef_search (int): HNSW beam width
+        nprobe (int): IVF lists probed
+
+    Returns:
+        faiss.SearchParameters or None when there is nothing to set
+    """
+    kind = index_kind(index)
+    selection = {"sel": selector} if selector is not None else {}
+    if kind == "hnsw":
+        return faiss.SearchParametersHNSW(efSearch=ef_search, **selection)
+    if kind == "ivf":
+        return faiss.SearchParametersIVF(nprobe=nprobe, **selection)
+    return faiss.SearchParameters(**selection) if selection else None